@@ -0,0 +1,70 @@
+''' Batched lookups: get_many(), getter() and take() against a loop
+    of single lookups and operator.itemgetter, for a record of 64
+    fields, the same record made from a Shape, and an int keyed map
+    read through a buffer of keys.
+
+    python benchmarks/bench_batch.py
+'''
+import timeit
+from array import array
+from operator import itemgetter
+
+from frozen_dict import FrozenDict
+
+FIELDS = 64
+PICK = 16
+NUMBER = 100000
+
+def per_call(stmt, number=NUMBER, **names):
+    timer = timeit.Timer(stmt, globals=names)
+    return min(timer.repeat(number=number, repeat=5)) / number * 1e9
+
+def main():
+    keys = ['field%d' % i for i in range(FIELDS)]
+    # New objects, so that nothing matches by identity
+    pick = [''.join(list(k)) for k in keys[::FIELDS // PICK]]
+    d = dict((k, i) for i, k in enumerate(keys))
+    rows = (('FrozenDict', FrozenDict(d)),
+            ('shaped', FrozenDict.shape(keys).fromdict(d)),
+            ('dict', d))
+    print('%-32s %10s %10s %10s' % ('%d of %d keys' % (PICK, FIELDS),
+                                    'FrozenDict', 'shaped', 'dict'))
+    for name, stmt in (
+            ('get() each', 'tuple([m.get(k) for k in pick])'),
+            ('[k] each', 'tuple([m[k] for k in pick])'),
+            ('operator.itemgetter', 'ig(m)'),
+            ('get_many()', 'm.get_many(pick)'),
+            ('getter()', 'g(m)'),
+            ('get() one, found', 'm.get(k)'),
+            ('get() one, missing', 'm.get("missing")')):
+        times = []
+        for kind, m in rows:
+            if 'get_many' in stmt and kind == 'dict' or \
+               stmt == 'g(m)' and kind == 'dict':
+                times.append('%10s' % '-')
+                continue
+            t = per_call(stmt, m=m, pick=pick, k=pick[0],
+                         ig=itemgetter(*pick),
+                         g=FrozenDict.getter(*pick))
+            times.append('%7.1f ns' % t)
+        print('%-32s %s' % (name, ' '.join(times)))
+
+    n = 100000
+    frz = FrozenDict((i, float(i)) for i in range(n))
+    d = dict(frz.items())
+    ids = array('q', [(i * 7919) % n for i in range(n)])
+    out = array('d', bytes(8 * n))
+    print('')
+    print('%d int keys from a buffer      %10s' % (n, 'per key'))
+    for name, stmt, m in (
+            ('dict, Python loop', 'for i, k in enumerate(ids): '
+                                  'out[i] = m[k]', d),
+            ('FrozenDict, Python loop', 'for i, k in enumerate(ids): '
+                                        'out[i] = m[k]', frz),
+            ('FrozenDict.take(ids, out)', 'm.take(ids, out)', frz),
+            ('FrozenDict.take(ids)', 'm.take(ids)', frz)):
+        t = per_call(stmt, number=10, m=m, ids=ids, out=out) / n
+        print('%-32s %7.1f ns' % (name, t))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+''' Compares pickling a FrozenDict with pickling a plain dict
+    holding the same items, and with the tuple of pairs that
+    FrozenDict pickled through before it had __reduce__.
+
+    python benchmarks/bench_pickle.py
+'''
+import pickle
+import timeit
+
+from frozen_dict import FrozenDict, OrderedMap
+
+SIZE = 100000
+PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+def measure(obj):
+    data = pickle.dumps(obj, PROTOCOL)
+    dump = min(timeit.repeat(lambda: pickle.dumps(obj, PROTOCOL),
+                             number=5, repeat=5)) / 5
+    load = min(timeit.repeat(lambda: pickle.loads(data),
+                             number=5, repeat=5)) / 5
+    return dump, load, len(data)
+
+def main():
+    d = dict((i, str(i)) for i in range(SIZE))
+    frz = FrozenDict(d)
+    hash(frz)
+    cases = [
+        ('dict', d),
+        ('FrozenDict', frz),
+        ('OrderedMap', OrderedMap(d)),
+        ('tuple of pairs (old format)', tuple(d.items())),
+    ]
+    print('%d entries, protocol %d' % (SIZE, PROTOCOL))
+    print('%-28s %10s %10s %12s' % ('', 'dump', 'load', 'size'))
+    for name, obj in cases:
+        dump, load, size = measure(obj)
+        print('%-28s %7.2f ms %7.2f ms %10d B'
+              % (name, dump * 1e3, load * 1e3, size))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+''' Memory and latency of FrozenDicts by size, across the point where
+    small storage gives way to a hidden dictionary, next to a dict
+    with the same items.
+
+    python benchmarks/bench_small.py
+'''
+import gc
+import sys
+import timeit
+import tracemalloc
+
+from frozen_dict import FrozenDict
+
+SIZES = (1, 2, 4, 8, 9, 16)
+NUMBER = 200000
+COUNT = 1000
+
+def per_call(stmt, **names):
+    timer = timeit.Timer(stmt, globals=names)
+    return min(timer.repeat(number=NUMBER, repeat=5)) / NUMBER * 1e9
+
+def per_instance(make):
+    # Bytes allocated per instance while COUNT of them are alive
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    keep = [make() for i in range(COUNT)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before - sys.getsizeof(keep)) / float(COUNT)
+
+def main():
+    print('%-5s %-10s %9s %9s %9s %9s %9s %9s' % (
+        'size', 'type', 'bytes', 'hit', 'hit id', 'miss', 'build',
+        'items'))
+    for size in SIZES:
+        d = dict(('key%d' % i, i) for i in range(size))
+        # The same text as the last key, but a different object,
+        # so that it cannot be matched by identity
+        last = [k for k in d][-1]
+        equal = ''.join(list(last))
+        for name, make in (('FrozenDict', FrozenDict), ('dict', dict)):
+            m = make(d)
+            print('%-5d %-10s %9.0f %6.1f ns %6.1f ns %6.1f ns %6.1f ns '
+                  '%6.1f ns' % (
+                      size, name, per_instance(lambda: make(d)),
+                      per_call('m[k]', m=m, k=equal),
+                      per_call('m[k]', m=m, k=last),
+                      per_call('k in m', m=m, k='missing'),
+                      per_call('make(d)', make=make, d=d),
+                      per_call('for x in m.items(): pass', m=m)))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+''' Compares lookup latency of a StaticFrozenDict, made by
+    FrozenDict.compile(), with the FrozenDict it was made from.
+
+    python benchmarks/bench_static.py
+'''
+import timeit
+
+from frozen_dict import FrozenDict
+
+SIZES = (8, 1000, 100000)
+NUMBER = 1000000
+
+def per_lookup(mapping, key, stmt):
+    timer = timeit.Timer(stmt, globals={'m': mapping, 'k': key})
+    return min(timer.repeat(number=NUMBER, repeat=5)) / NUMBER
+
+def main():
+    print('%-8s %-6s %-6s %12s %12s' % ('size', 'keys', 'case',
+                                        'FrozenDict', 'static'))
+    for size in SIZES:
+        for kind, make in (('str', lambda i: 'key%d' % i), ('int', int)):
+            frz = FrozenDict((make(i), i) for i in range(size))
+            static = frz.compile()
+            # A fresh object, so lookups cannot match by identity
+            hit = make(size // 2)
+            if kind == 'str':
+                hit = ''.join(list(hit))
+            miss = make(size + 1)
+            for case, key, stmt in (('hit', hit, 'm[k]'),
+                                    ('miss', miss, 'k in m')):
+                print('%-8d %-6s %-6s %9.1f ns %9.1f ns' % (
+                    size, kind, case,
+                    per_lookup(frz, key, stmt) * 1e9,
+                    per_lookup(static, key, stmt) * 1e9))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+''' Compares looping over frz.items() with the lazy views against
+    the list-building methods that Python 3 builds used before.
+
+    python benchmarks/bench_views.py
+'''
+import timeit
+import tracemalloc
+
+from frozen_dict import FrozenDict
+
+SIZE = 100000
+
+def list_items(frz):
+    # What items() used to build on every call
+    return [(k, frz[k]) for k in frz]
+
+def loop(items):
+    for k, v in items:
+        pass
+
+def peak_bytes(func, *args):
+    tracemalloc.start()
+    func(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+def main():
+    frz = FrozenDict((i, str(i)) for i in range(SIZE))
+    cases = [
+        ('view: for k, v in frz.items()', lambda: loop(frz.items())),
+        ('list: for k, v in [...]', lambda: loop(list_items(frz))),
+    ]
+    print('%d entries' % SIZE)
+    for name, func in cases:
+        seconds = min(timeit.repeat(func, number=10, repeat=5)) / 10
+        print('%-32s %8.2f ms %12d bytes peak'
+              % (name, seconds * 1e3, peak_bytes(func)))
+
+if __name__ == '__main__':
+    main()
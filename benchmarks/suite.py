@@ -0,0 +1,361 @@
+''' Benchmarks FrozenDict against dict, types.MappingProxyType and
+    frozenset, covering the claims made in the README: construction,
+    lookup, hashing, set(), comparison, the views, OrderedMap,
+    freeze() and memory per instance.
+
+    python benchmarks/suite.py                 # print a table
+    python benchmarks/suite.py -o run.json     # and save the results
+    python benchmarks/suite.py -k hash -q      # some cases, quickly
+
+    The JSON file holds one record per case, so two runs of different
+    builds can be compared with any JSON tool.  Every timing includes
+    the cost of one Python call, the same for every implementation.
+'''
+import argparse
+import gc
+import itertools
+import json
+import platform
+import random
+import sys
+import time
+import timeit
+import tracemalloc
+from types import MappingProxyType
+
+import frozen_dict
+from frozen_dict import FrozenDict, OrderedMap, freeze, thaw
+
+SIZES = (10, 1000)
+CASES = []
+
+def case(group, impl, unit='ns'):
+    ''' Registers a function that returns a setup callable.  The setup
+        takes the size and returns the statement to be timed, which
+        is called with no arguments.  '''
+    def register(func):
+        CASES.append((group, impl, unit, func))
+        return func
+    return register
+
+def items(n):
+    return [('key%d' % i, i) for i in range(n)]
+
+def fresh(n):
+    # A dict whose keys are new objects, so nothing matches by identity
+    return dict((''.join(list(k)), v) for k, v in items(n))
+
+########################################
+#             Construction             #
+########################################
+
+@case('construct', 'FrozenDict')
+def construct_frozendict(n):
+    d = dict(items(n))
+    return lambda: FrozenDict(d)
+
+@case('construct', 'dict')
+def construct_dict(n):
+    d = dict(items(n))
+    return lambda: dict(d)
+
+@case('construct', 'MappingProxyType')
+def construct_proxy(n):
+    d = dict(items(n))
+    return lambda: MappingProxyType(dict(d))
+
+@case('construct', 'frozenset')
+def construct_frozenset(n):
+    d = dict(items(n))
+    return lambda: frozenset(d.items())
+
+@case('construct', 'OrderedMap')
+def construct_orderedmap(n):
+    pairs = items(n)
+    return lambda: OrderedMap(pairs)
+
+########################################
+#                Lookup                #
+########################################
+
+def lookup(mapping, n):
+    key = ''.join(list('key%d' % (n // 2)))
+    return lambda: mapping[key]
+
+@case('getitem', 'FrozenDict')
+def getitem_frozendict(n):
+    return lookup(FrozenDict(items(n)), n)
+
+@case('getitem', 'dict')
+def getitem_dict(n):
+    return lookup(dict(items(n)), n)
+
+@case('getitem', 'MappingProxyType')
+def getitem_proxy(n):
+    return lookup(MappingProxyType(dict(items(n))), n)
+
+@case('getitem', 'OrderedMap')
+def getitem_orderedmap(n):
+    return lookup(OrderedMap(items(n)), n)
+
+@case('contains', 'frozenset')
+def contains_frozenset(n):
+    fs = frozenset(items(n))
+    item = (''.join(list('key%d' % (n // 2))), n // 2)
+    return lambda: item in fs
+
+########################################
+#               Hashing                #
+########################################
+# The first hash of an instance does the work and later ones read
+# the cache, so first-call cases hash a new instance every time.
+# The time to make that instance is measured and taken off.
+
+class First(object):
+    ''' Marks a statement whose cost includes making a new instance,
+        given by make, which the runner subtracts.  '''
+    def __init__(self, stmt, make):
+        self.stmt = stmt
+        self.make = make
+
+@case('hash first', 'FrozenDict')
+def hash_first_frozendict(n):
+    d = dict(items(n))
+    return First(lambda: hash(FrozenDict(d)), lambda: FrozenDict(d))
+
+@case('hash first', 'frozenset')
+def hash_first_frozenset(n):
+    d = dict(items(n))
+    return First(lambda: hash(frozenset(d.items())),
+                 lambda: frozenset(d.items()))
+
+@case('hash cached', 'FrozenDict')
+def hash_cached_frozendict(n):
+    frz = FrozenDict(items(n))
+    hash(frz)
+    return lambda: hash(frz)
+
+@case('hash cached', 'frozenset')
+def hash_cached_frozenset(n):
+    fs = frozenset(items(n))
+    hash(fs)
+    return lambda: hash(fs)
+
+########################################
+#               Deriving               #
+########################################
+# Each call changes the map made by the call before, the way a
+# program that keeps its state in a FrozenDict would.
+
+def chain(derive, mapping, n):
+    state = [mapping]
+    keys = [k for k, v in items(n)]
+    counter = itertools.count()
+    def step():
+        i = next(counter)
+        state[0] = derive(state[0], keys[i % n], i)
+    return step
+
+def copy_and_set(d, key, value):
+    d = dict(d)
+    d[key] = value
+    return d
+
+@case('set chain', 'FrozenDict')
+def set_chain_frozendict(n):
+    return chain(FrozenDict.set, FrozenDict(items(n)), n)
+
+@case('set chain', 'dict copy')
+def set_chain_dict(n):
+    return chain(copy_and_set, dict(items(n)), n)
+
+########################################
+#              Comparison              #
+########################################
+
+def compare(make, n, change, op):
+    a = make(items(n))
+    pairs = fresh(n)
+    if change:
+        pairs['key0'] = -1
+    b = make(pairs.items())
+    for x in (a, b):
+        try:
+            hash(x)
+        except TypeError:
+            pass
+    return lambda: op(a, b)
+
+def eq(a, b):
+    return a == b
+
+def le(a, b):
+    return a <= b
+
+for _name, _make in (('FrozenDict', FrozenDict), ('dict', dict),
+                     ('frozenset', frozenset),
+                     ('MappingProxyType',
+                      lambda p: MappingProxyType(dict(p)))):
+    case('compare equal', _name)(
+        lambda n, m=_make: compare(m, n, False, eq))
+    case('compare unequal', _name)(
+        lambda n, m=_make: compare(m, n, True, eq))
+    if _name in ('FrozenDict', 'frozenset'):
+        # dicts cannot be ordered
+        case('compare <=', _name)(
+            lambda n, m=_make: compare(m, n, False, le))
+
+########################################
+#                Views                 #
+########################################
+
+def loop(iterable):
+    for x in iterable:
+        pass
+
+for _view in ('keys', 'values', 'items'):
+    for _name, _make in (('FrozenDict', FrozenDict), ('dict', dict),
+                         ('OrderedMap', OrderedMap)):
+        def _setup(n, make=_make, view=_view):
+            method = getattr(make(items(n)), view)
+            return lambda: loop(method())
+        case('iterate %s()' % _view, _name)(_setup)
+
+@case('keys() & set', 'FrozenDict')
+def keys_and_frozendict(n):
+    frz = FrozenDict(items(n))
+    other = set(k for k, v in items(n)[::2])
+    return lambda: frz.keys() & other
+
+@case('keys() & set', 'dict')
+def keys_and_dict(n):
+    d = dict(items(n))
+    other = set(k for k, v in items(n)[::2])
+    return lambda: d.keys() & other
+
+########################################
+#               freeze()               #
+########################################
+
+def document(n):
+    # Something like a page of a JSON API: records with nested
+    # objects, lists of scalars and lists of objects.
+    rnd = random.Random(n)
+    return [{
+        'id': i,
+        'name': 'user%d' % i,
+        'active': rnd.random() < 0.5,
+        'score': rnd.random(),
+        'tags': ['tag%d' % rnd.randrange(20) for j in range(3)],
+        'address': {'city': 'city%d' % rnd.randrange(50),
+                    'zip': '%05d' % rnd.randrange(99999),
+                    'geo': {'lat': rnd.random(), 'lng': rnd.random()}},
+        'orders': [{'sku': 'sku%d' % rnd.randrange(1000),
+                    'qty': rnd.randrange(1, 5)} for j in range(2)],
+    } for i in range(max(n // 10, 1))]
+
+@case('freeze', 'FrozenDict')
+def freeze_document(n):
+    doc = document(n)
+    return lambda: freeze(doc)
+
+@case('thaw', 'FrozenDict')
+def thaw_document(n):
+    frz = freeze(document(n))
+    return lambda: thaw(frz)
+
+########################################
+#                Memory                #
+########################################
+# Bytes allocated per instance, measured with tracemalloc while
+# many instances are alive.  The items themselves are shared
+# with the source and are not counted.
+
+class Memory(object):
+    def __init__(self, make):
+        self.make = make
+
+for _name, _make in (('FrozenDict', FrozenDict), ('dict', dict),
+                     ('MappingProxyType',
+                      lambda d: MappingProxyType(dict(d))),
+                     ('frozenset', lambda d: frozenset(d.items())),
+                     ('OrderedMap', OrderedMap)):
+    def _setup(n, make=_make):
+        d = dict(items(n))
+        return Memory(lambda: make(d))
+    case('memory', _name, unit='bytes')(_setup)
+
+@case('memory', 'FrozenDict shaped', unit='bytes')
+def memory_shaped(n):
+    shape = FrozenDict.shape([k for k, v in items(n)])
+    values = [v for k, v in items(n)]
+    return Memory(lambda: shape.fromvalues(values))
+
+########################################
+#                Runner                #
+########################################
+
+def per_call(stmt, quick):
+    ''' Seconds per call of stmt, the best of several repeats '''
+    timer = timeit.Timer(stmt)
+    number, elapsed = timer.autorange()
+    repeat = 3 if quick else 7
+    return min([elapsed] + timer.repeat(repeat=repeat, number=number)) \
+        / number
+
+def measure(setup, n, quick):
+    if isinstance(setup, Memory):
+        count = 200 if n <= 100 else 20
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        keep = [setup.make() for i in range(count)]
+        after = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        # The list holding them is not part of any instance
+        return (after - before - sys.getsizeof(keep)) / float(count)
+    if isinstance(setup, First):
+        total = per_call(setup.stmt, quick)
+        return max(total - per_call(setup.make, quick), 0.0) * 1e9
+    return per_call(setup, quick) * 1e9
+
+def environment():
+    return {
+        'python': sys.version.split()[0],
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'frozen_dict': getattr(frozen_dict, '__file__', None),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('-o', '--output', help='write the results as JSON')
+    parser.add_argument('-k', '--filter', default='',
+                        help='only run groups containing this text')
+    parser.add_argument('-q', '--quick', action='store_true',
+                        help='fewer repeats, noisier numbers')
+    parser.add_argument('-n', '--sizes', type=int, nargs='+',
+                        default=list(SIZES), help='map sizes to run')
+    args = parser.parse_args(argv)
+
+    results = []
+    print('%-20s %-18s %8s %14s' % ('group', 'implementation', 'size',
+                                    'result'))
+    for group, impl, unit, func in CASES:
+        if args.filter not in group:
+            continue
+        for n in args.sizes:
+            value = measure(func(n), n, args.quick)
+            results.append({'group': group, 'implementation': impl,
+                            'size': n, 'value': value, 'unit': unit})
+            print('%-20s %-18s %8d %11.1f %-5s' % (group, impl, n,
+                                                   value, unit))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'environment': environment(), 'results': results},
+                      f, indent=1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,219 @@
+# Declarations of frozen_dict for other Cython modules, which can
+# "from frozen_dict cimport FrozenDict, frozendict_get" and read
+# FrozenDicts with plain C calls.  The inline functions at the end are
+# the supported way in; the fields are private and may change.
+# C extensions get the same functions through the C API at the end of
+# frozen_dict.pyx, from the frozen_dict_api.h header Cython writes.
+cimport cython
+from cpython.object cimport PyObject
+from cpython.dict cimport PyDict_Next, PyDict_GetItemWithError
+from cpython.tuple cimport PyTuple_GET_ITEM
+from cpython.long cimport PyLong_AsSsize_t
+
+# Cached hashes are written the first time they are asked for, and
+# on a free-threaded build two threads may do that at once.  Both
+# work out the same number, so the only danger is a torn read or
+# write, which these atomic accessors rule out.  No ordering with
+# other memory is needed.
+cdef extern from *:
+    """
+    #if defined(_MSC_VER)
+    #include <intrin.h>
+    static __inline long long frz_load_hash(long long *p) {
+        return _InterlockedCompareExchange64((volatile __int64 *)p, 0, 0);
+    }
+    static __inline void frz_store_hash(long long *p, long long h) {
+        _InterlockedExchange64((volatile __int64 *)p, h);
+    }
+    #else
+    static inline long long frz_load_hash(long long *p) {
+        return __atomic_load_n(p, __ATOMIC_RELAXED);
+    }
+    static inline void frz_store_hash(long long *p, long long h) {
+        __atomic_store_n(p, h, __ATOMIC_RELAXED);
+    }
+    #endif
+    """
+    long long _load_hash "frz_load_hash" (long long *p) nogil
+    void _store_hash "frz_store_hash" (long long *p, long long h) nogil
+
+# FrozenDicts with up to this many items use small storage
+cdef enum:
+    _SMALL_MAX = 8
+
+cdef class FrozenDict
+
+@cython.final
+cdef class Shape:
+    cdef readonly tuple keys
+    cdef dict index
+
+@cython.final
+cdef class _Layer:
+    # The changes made to a large FrozenDict, kept apart from its
+    # hidden dictionary, base, which is shared and never changed.
+    # A key is present if it is in delta, or in base and not in
+    # removed.  A removed key that is set again stays in removed,
+    # so that it moves to the end of the order, as in a dict.
+    cdef dict base
+    cdef dict delta
+    cdef set removed
+    cdef Py_ssize_t n
+
+cdef class FrozenDict:
+    cdef object d
+    cdef long long h
+    # Shared-key storage: when keyshape is set, d is None
+    # and vals holds one value per key of the shape.
+    cdef Shape keyshape
+    # Small storage: when both d and keyshape are None, vals
+    # holds the keys followed by the values, and tags holds
+    # one byte of the hash of each key (see _small_index).
+    cdef tuple vals
+    cdef unsigned char tags[_SMALL_MAX]
+    # Layered storage: when layer is set, d, keyshape and vals are
+    # all None.  Lookups read the layer; anything else first turns
+    # the instance into an ordinary one with _flatten.
+    cdef _Layer layer
+    cdef object __weakref__
+
+    cdef _store(self, dict d)
+    @cython.final
+    cdef _store_small(self, dict d)
+    @cython.final
+    cdef Py_ssize_t _small_index(self, key) except -2
+    @cython.final
+    cdef _flatten(self)
+    cdef object _get(self, key)
+    cdef tuple _key_tuple(self)
+    cdef tuple _value_tuple(self)
+    cdef dict _dict(self)
+    cdef dict _dict_copy(self)
+    cdef object _itervalues(self)
+    cdef object _iteritems(self)
+    cdef long long _compute_hash(self) except? -1
+    cpdef _eq(self, FrozenDict other)
+    cdef object _equals(self, other)
+    cdef _adopt(self, dict d)
+    cdef FrozenDict _derive(self, dict d)
+    cdef long long _derived_hash(self, dict changes, d)
+    cdef FrozenDict _with_changes(self, dict changes)
+
+cdef class OrderedMap(FrozenDict):
+    cdef tuple key_array
+    cdef tuple value_array
+
+    cdef _set_arrays(self, keys)
+
+cdef class BaseMapView:
+    cdef FrozenDict frz
+
+@cython.final
+cdef class Values(BaseMapView):
+    pass
+
+cdef class SetView(BaseMapView):
+    cdef long long h
+
+    cdef long long _hash(self) except? -1
+    cdef object _builtin(self)
+
+@cython.final
+cdef class Keys(SetView):
+    pass
+
+@cython.final
+cdef class Items(SetView):
+    pass
+
+########################################
+#          Inline Accessors            #
+########################################
+# Each one goes straight to the storage of the FrozenDict, whichever
+# of its three layouts that is, with no Python call in between.
+
+cdef inline Py_ssize_t frozendict_size(FrozenDict frz) noexcept:
+    # The number of items
+    cdef _Layer layer = frz.layer
+    if layer is not None:
+        return layer.n
+    if frz.d is not None:
+        return len(<dict>frz.d)
+    if frz.keyshape is not None:
+        return len(frz.vals)
+    return len(frz.vals) >> 1
+
+cdef inline PyObject *frozendict_get(FrozenDict frz, key) except? NULL:
+    # The value for key as a borrowed reference, or NULL with no
+    # exception set when key is missing, like PyDict_GetItemWithError.
+    # The reference stays good for as long as frz does.
+    cdef PyObject *i
+    cdef Py_ssize_t n
+    cdef _Layer layer = frz.layer
+    if layer is not None:
+        i = PyDict_GetItemWithError(layer.delta, key)
+        if i is not NULL or (layer.removed and key in layer.removed):
+            return i
+        return PyDict_GetItemWithError(layer.base, key)
+    if frz.d is not None:
+        return PyDict_GetItemWithError(frz.d, key)
+    if frz.keyshape is not None:
+        i = PyDict_GetItemWithError(frz.keyshape.index, key)
+        if i is NULL:
+            return NULL
+        return PyTuple_GET_ITEM(frz.vals, PyLong_AsSsize_t(<object>i))
+    n = frz._small_index(key)
+    if n == -1:
+        return NULL
+    return PyTuple_GET_ITEM(frz.vals, n + (len(frz.vals) >> 1))
+
+cdef inline object frozendict_getitem(FrozenDict frz, key):
+    # frz[key], raising a KeyError when key is missing
+    cdef PyObject *value = frozendict_get(frz, key)
+    if value is NULL:
+        raise KeyError(key)
+    return <object>value
+
+cdef inline bint frozendict_contains(FrozenDict frz, key) except -1:
+    return frozendict_get(frz, key) is not NULL
+
+cdef inline bint frozendict_next(FrozenDict frz, Py_ssize_t *pos,
+                                 PyObject **key,
+                                 PyObject **value) except -1:
+    # Steps through the items like PyDict_Next, with borrowed
+    # references.  Start with *pos at 0 and stop at the first false
+    # return.  OrderedMaps go in their own order.  A layered
+    # FrozenDict is flattened first, which can raise MemoryError.
+    cdef Py_ssize_t i = pos[0], off = 0
+    cdef tuple keys, vals
+    if frz.layer is not None:
+        frz._flatten()
+    if isinstance(frz, OrderedMap):
+        keys = (<OrderedMap>frz).key_array
+        vals = (<OrderedMap>frz).value_array
+    elif frz.d is not None:
+        return PyDict_Next(frz.d, pos, key, value)
+    elif frz.keyshape is not None:
+        keys = frz.keyshape.keys
+        vals = frz.vals
+    else:
+        # Small storage: the values follow the keys
+        keys = vals = frz.vals
+        off = len(vals) >> 1
+    if i >= len(vals) - off:
+        return False
+    key[0] = PyTuple_GET_ITEM(keys, i)
+    value[0] = PyTuple_GET_ITEM(vals, off + i)
+    pos[0] = i + 1
+    return True
+
+cdef inline FrozenDict frozendict_adopt(dict d):
+    # A FrozenDict that takes over d without copying it, as
+    # FrozenDict.adopt does.  Nothing may change d afterwards.
+    cdef FrozenDict frz = FrozenDict.__new__(FrozenDict)
+    frz._adopt(d)
+    return frz
+
+cdef inline long long frozendict_cached_hash(FrozenDict frz) noexcept:
+    # The hash if it has been worked out already, or else -1
+    return _load_hash(&frz.h)
@@ -1,15 +1,299 @@
+# cython: freethreading_compatible=True
 import cython
+from cpython.dict cimport PyDict_Next
+from cpython.object cimport PyObject, PyObject_RichCompareBool, Py_EQ
+from cpython.tuple cimport PyTuple_GET_ITEM, PyTuple_New, PyTuple_SET_ITEM
+from cpython.list cimport PyList_GET_ITEM
+from cpython.sequence cimport PySequence_Fast_GET_ITEM
+from cpython.ref cimport Py_INCREF
+from cpython.unicode cimport (PyUnicode_CheckExact, PyUnicode_GET_LENGTH,
+                              PyUnicode_KIND, PyUnicode_DATA)
+from cpython.mem cimport PyMem_Malloc, PyMem_Free
+from cpython.number cimport PyNumber_Index
+from cpython.buffer cimport (PyObject_GetBuffer, PyBuffer_Release,
+                             PyBUF_RECORDS, PyBUF_RECORDS_RO)
+from libc.string cimport memcmp, memcpy, memset
+from libc.math cimport sqrt
+import errno
+import gc
+import os
+import sys
 from abc import ABCMeta
-from collections import Mapping, Set, Counter, \
-KeysView, MappingView, ValuesView, ItemsView
-from itertools import chain
+from bisect import bisect_left, bisect_right
+try:
+    from collections.abc import Mapping, Set, KeysView, \
+    ValuesView, ItemsView, MutableMapping, Sequence
+except ImportError:
+    from collections import Mapping, Set, KeysView, \
+    ValuesView, ItemsView, MutableMapping, Sequence
 from sys import getsizeof, maxsize
+from mmap import mmap, ACCESS_READ
+from struct import pack
+from weakref import WeakValueDictionary
+from functools import update_wrapper
+from types import MethodType
+from threading import Event, Lock
+try:
+    from os import cpu_count
+except ImportError:
+    from multiprocessing import cpu_count
+try:
+    from threading import get_ident
+except ImportError:
+    from thread import get_ident
+try:
+    from time import monotonic as _clock, perf_counter as _timer
+except ImportError:
+    from time import time as _clock, time as _timer
+
+cdef extern from "Python.h":
+    Py_ssize_t PY_SSIZE_T_MAX
+    int PY_MAJOR_VERSION
+
+########################################
+#           Instrumentation            #
+########################################
+# Off by default.  Each instrumented spot tests one C flag, and
+# only does any counting or timing once stats or a hook are on.
+
+cdef struct _Counters:
+    unsigned long long created
+    unsigned long long hash_computed
+    unsigned long long hash_cached
+    unsigned long long slow_compares
+    unsigned long long freeze_calls
+    double freeze_seconds
+    double freeze_max
+
+cdef _Counters _counters
+cdef bint _stats_enabled = False
+# True when stats are enabled or a slow hook is set
+cdef bint _observed = False
+cdef object _slow_hook = None
+cdef double _slow_threshold = 0.0
+
+def enable_stats(bint enabled=True):
+    ''' Turns the counters read by stats() on or off '''
+    global _stats_enabled, _observed
+    _stats_enabled = enabled
+    _observed = _stats_enabled or _slow_hook is not None
+
+def set_slow_hook(hook, double threshold=0.01):
+    ''' Calls hook(operation, seconds, obj) after any hash, slow
+        comparison or freeze() that takes at least threshold seconds.
+        operation is 'hash', 'compare' or 'freeze', and obj is the
+        object hashed, compared or frozen.  An exception raised by
+        the hook is passed on to the caller.  hook=None removes it.
+    '''
+    global _slow_hook, _slow_threshold, _observed
+    _slow_hook = hook
+    _slow_threshold = threshold
+    _observed = _stats_enabled or _slow_hook is not None
+
+def stats():
+    ''' Returns the counters collected since enable_stats() or the
+        last reset_stats().  slow_compares counts comparisons that
+        had to check the items one by one.  The counters are not
+        locked, so on a free-threaded build they are approximate.  '''
+    return {
+        'enabled': _stats_enabled,
+        'created': _counters.created,
+        'hash_computed': _counters.hash_computed,
+        'hash_cached': _counters.hash_cached,
+        'slow_compares': _counters.slow_compares,
+        'freeze_calls': _counters.freeze_calls,
+        'freeze_seconds': _counters.freeze_seconds,
+        'freeze_max_seconds': _counters.freeze_max,
+    }
+
+def reset_stats():
+    memset(&_counters, 0, sizeof(_Counters))
+
+cdef int _observe(str operation, double start, obj) except -1:
+    # Called after a timed operation, with the time it started
+    cdef double elapsed = _timer() - start
+    if _stats_enabled and operation == 'freeze':
+        _counters.freeze_calls += 1
+        _counters.freeze_seconds += elapsed
+        if elapsed > _counters.freeze_max:
+            _counters.freeze_max = elapsed
+    if _slow_hook is not None and elapsed >= _slow_threshold:
+        _slow_hook(operation, elapsed, obj)
+    return 0
+
+########################################
+#           Hash Combiner              #
+########################################
+# Hashes of unordered collections are built by folding one
+# well-mixed hash per entry into an accumulator with XOR.
+# Nothing is allocated, the order of the entries does not matter,
+# and an entry can be taken back out by folding it in again.
+# That lets a derived map compute its hash from the parent's
+# cached hash in time proportional to the number of changed keys.
+
+ctypedef unsigned long long hash_acc
+
+cdef bint _frozenset_hash = False
+
+def use_frozenset_hash(bint enabled=True):
+    ''' Makes the keys and items views hash exactly like
+        frozenset(view), as in earlier versions, at the cost of
+        building that frozenset.  Views cache their hash, so set
+        this before any views are hashed.  '''
+    global _frozenset_hash
+    _frozenset_hash = enabled
+
+cdef inline hash_acc _shuffle(hash_acc h) noexcept nogil:
+    # Spread the bits of one entry before it is folded in
+    return ((h ^ 89869747ULL) ^ (h << 16)) * 3644798167ULL
+
+cdef inline hash_acc _rotate(hash_acc x) noexcept nogil:
+    return (x << 31) | (x >> 33)
+
+cdef inline hash_acc _pair_hash(object first, object second) except? 0:
+    # Order dependent combination of two hashes,
+    # modelled on the xxHash rounds used for tuples
+    cdef hash_acc acc = 2870177450012600261ULL
+    acc += <hash_acc>hash(first) * 14029467366897019727ULL
+    acc = _rotate(acc) * 11400714785074694791ULL
+    acc += <hash_acc>hash(second) * 14029467366897019727ULL
+    acc = _rotate(acc) * 11400714785074694791ULL
+    return acc ^ 2870177450012600261ULL
+
+cdef inline hash_acc _entry_hash(object key, object value) except? 0:
+    # The key-value pairs of a FrozenDict are combined in reverse
+    # so that hash(frz) and hash(frz.items()) do not collide
+    return _shuffle(_pair_hash(value, key))
+
+cdef inline long long _finish_hash(hash_acc acc, Py_ssize_t n) noexcept nogil:
+    cdef long long h = <long long>(acc ^ (<hash_acc>(n + 1) * 1927868237ULL)
+                                   ^ <hash_acc>PY_SSIZE_T_MAX)
+    if h == -1:
+        h = -2
+    return h
+
+cdef inline bint _can_resume(long long h) noexcept nogil:
+    # -2 is ambiguous, since -1 is folded into it
+    return h != -1 and h != -2
+
+cdef inline hash_acc _resume_hash(long long h, Py_ssize_t n) noexcept nogil:
+    return (<hash_acc>h ^ (<hash_acc>(n + 1) * 1927868237ULL)
+            ^ <hash_acc>PY_SSIZE_T_MAX)
+
+cdef inline bint _str_eq(str a, str b):
+    # Equality of two exact strs, the way dictionaries test it,
+    # without going through the rich comparison machinery
+    cdef Py_ssize_t n = PyUnicode_GET_LENGTH(a)
+    if n != PyUnicode_GET_LENGTH(b) or PyUnicode_KIND(a) != PyUnicode_KIND(b):
+        return False
+    return memcmp(PyUnicode_DATA(a), PyUnicode_DATA(b),
+                  n * PyUnicode_KIND(a)) == 0
+
+cdef inline unsigned char _tag(Py_hash_t h) noexcept nogil:
+    # One byte standing for a key hash.  The high bits are folded
+    # in, since small ints hash to themselves.
+    cdef hash_acc x = <hash_acc>h
+    return <unsigned char>(x ^ (x >> 8) ^ (x >> 24) ^ (x >> 48))
+
+cdef long long _dict_hash(dict d) except? -1:
+    cdef Py_ssize_t pos = 0
+    cdef PyObject *k
+    cdef PyObject *v
+    cdef hash_acc acc = 0
+    while PyDict_Next(d, &pos, &k, &v):
+        acc ^= _entry_hash(<object>k, <object>v)
+    return _finish_hash(acc, len(d))
+
+cdef long long _shaped_hash(tuple keys, tuple vals) except? -1:
+    cdef Py_ssize_t i
+    cdef hash_acc acc = 0
+    for i in range(len(keys)):
+        acc ^= _entry_hash(keys[i], vals[i])
+    return _finish_hash(acc, len(keys))
+
+# Every FrozenDict built without arguments shares this.
+# Nothing ever writes to the hidden dictionary of a FrozenDict.
+cdef dict _EMPTY = {}
+
+cdef object _MISSING = object()
+
+cdef object _lookup(mapping, key):
+    # mapping[key], or _MISSING when the key is not there
+    cdef FrozenDict frz
+    if isinstance(mapping, FrozenDict):
+        frz = mapping
+        if frz.d is None:
+            return frz._get(key)
+        mapping = frz.d
+    if isinstance(mapping, dict):
+        return (<dict>mapping).get(key, _MISSING)
+    try:
+        return mapping[key]
+    except KeyError:
+        return _MISSING
+
+cdef bint _has_item(mapping, key, value) except -1:
+    found = _lookup(mapping, key)
+    if found is _MISSING:
+        return False
+    return found is value or found == value
+
+cdef bint _within(little, big) except -1:
+    cdef double start
+    cdef bint result
+    if not _observed:
+        return _within_items(little, big)
+    if _stats_enabled:
+        _counters.slow_compares += 1
+    start = _timer()
+    result = _within_items(little, big)
+    _observe('compare', start, little)
+    return result
+
+cdef bint _within_items(little, big) except -1:
+    # True if every item of little is an item of big as well.
+    # Hidden dictionaries are walked in C, with no lookups on
+    # the little side and a single one per key on the big side.
+    cdef Py_ssize_t pos = 0
+    cdef Py_ssize_t i
+    cdef PyObject *k
+    cdef PyObject *v
+    cdef FrozenDict frz
+    cdef dict d = None
+    cdef tuple keys, vals
+    cdef Py_ssize_t off = 0
+    if isinstance(little, FrozenDict):
+        frz = little
+        frz._flatten()
+        if frz.d is None:
+            # Small storage is read in place, values after keys
+            keys = vals = frz.vals
+            if frz.keyshape is not None:
+                keys = frz.keyshape.keys
+            else:
+                off = len(vals) >> 1
+            for i in range(len(vals) - off):
+                if not _has_item(big, <object>PyTuple_GET_ITEM(keys, i),
+                                 <object>PyTuple_GET_ITEM(vals, off + i)):
+                    return False
+            return True
+        d = frz.d
+    elif isinstance(little, dict):
+        d = little
+    if d is None:
+        for key in little:
+            if not _has_item(big, key, little[key]):
+                return False
+        return True
+    while PyDict_Next(d, &pos, &k, &v):
+        if not _has_item(big, <object>k, <object>v):
+            return False
+    return True
 
 cdef class BaseMapView:
     ''' Abstract base class for keys, values
         and items views of FrozenDict instances'''
 
-    cdef FrozenDict frz
     def __cinit__(self, frz):
         self.frz = frz
 
@@ -23,44 +307,97 @@ cdef class BaseMapView:
 @cython.final
 cdef class Values(BaseMapView):
     def __iter__(self):
-        for k in self.frz:
-            yield self.frz[k]
+        return self.frz._itervalues()
 
     def __contains__(self, value):
-        for k in self.frz:
-            if self.frz[k] == value:
-                return True
-        return False
+        cdef FrozenDict frz = self.frz
+        frz._flatten()
+        if frz.d is None:
+            return (value in frz._value_tuple())
+        if PY_MAJOR_VERSION >= 3:
+            return (value in (<dict>frz.d).values())
+        return (value in (<object>frz.d).itervalues())
+
+cdef enum:
+    _AND, _SUB, _XOR, _OR
+
+cdef object _set_operand(obj):
+    # Views hand over a builtin set or, on Python 3, the dict view
+    # of the hidden dictionary, whose set operations all run in C.
+    if isinstance(obj, SetView):
+        if PY_MAJOR_VERSION >= 3:
+            return (<SetView>obj)._builtin()
+        return set(obj)
+    if isinstance(obj, (set, frozenset)):
+        return obj
+    try:
+        return set(obj)
+    except TypeError:
+        return None
+
+cdef object _set_operation(a, b, int op):
+    a = _set_operand(a)
+    b = _set_operand(b)
+    if a is None or b is None:
+        return NotImplemented
+    if op == _AND:
+        result = a & b
+    elif op == _SUB:
+        result = a - b
+    elif op == _XOR:
+        result = a ^ b
+    else:
+        result = a | b
+    if type(result) is frozenset:
+        result = set(result)
+    return result
 
 cdef class SetView(BaseMapView):
-    cdef long long h
-    
     def __cinit__(self):
         self.h = -1
 
     def __hash__(self):
-        if self.h == -1:
-            self.h = hash(frozenset(self))
-        return self.h
+        cdef long long h = _load_hash(&self.h)
+        if h == -1:
+            if _frozenset_hash:
+                h = hash(frozenset(self))
+            else:
+                h = self._hash()
+            _store_hash(&self.h, h)
+        return h
+
+    cdef long long _hash(self) except? -1:
+        return hash(frozenset(self))
 
+    cdef object _builtin(self):
+        # A builtin set or dict view with the same members
+        return set(self)
+
+    # Both operands go through _set_operand, since Cython may
+    # call these with the view on either side.
     def __and__(self, other):
-        inner = (k for k in self if k in other)
-        return set(inner)
+        return _set_operation(self, other, _AND)
+
+    def __rand__(self, other):
+        return _set_operation(other, self, _AND)
 
     def __sub__(self, other):
-        left  = (k for k in self if k not in other)
-        return set(left)
+        return _set_operation(self, other, _SUB)
+
+    def __rsub__(self, other):
+        return _set_operation(other, self, _SUB)
 
     def __xor__(self, other):
-        left  = (k for k in self if k not in other)
-        right = (k for k in other if k not in self)
-        return set(chain(left, right))
+        return _set_operation(self, other, _XOR)
+
+    def __rxor__(self, other):
+        return _set_operation(other, self, _XOR)
 
     def __or__(self, other):
-        inner = (k for k in self if k in other)
-        left  = (k for k in self if k not in other)
-        right = (k for k in other if k not in self)
-        return set(chain(left, inner, right))
+        return _set_operation(self, other, _OR)
+
+    def __ror__(self, other):
+        return _set_operation(other, self, _OR)
 
     def __richcmp__(self, other, int flag):
         switch = (flag != 3)
@@ -127,8 +464,22 @@ cdef class SetView(BaseMapView):
 @cython.final
 cdef class Keys(SetView):
     def __iter__(self):
+        return iter(self.frz)
+
+    cdef object _builtin(self):
+        cdef FrozenDict frz = self.frz
+        frz._flatten()
+        if frz.keyshape is not None:
+            return frz.keyshape.index.keys()
+        if frz.d is None:
+            return set(frz._key_tuple())
+        return (<dict>frz.d).keys()
+
+    cdef long long _hash(self) except? -1:
+        cdef hash_acc acc = 0
         for k in self.frz:
-            yield k
+            acc ^= _shuffle(<hash_acc>hash(k))
+        return _finish_hash(acc, len(self.frz))
 
     def __contains__(self, key):
         return (key in self.frz)
@@ -136,8 +487,33 @@ cdef class Keys(SetView):
 @cython.final
 cdef class Items(SetView):
     def __iter__(self):
-        for k in self.frz:
-            yield (k, self.frz[k])
+        return self.frz._iteritems()
+
+    cdef object _builtin(self):
+        cdef FrozenDict frz = self.frz
+        frz._flatten()
+        if frz.d is None:
+            return set(zip(frz._key_tuple(), frz._value_tuple()))
+        return (<dict>frz.d).items()
+
+    cdef long long _hash(self) except? -1:
+        cdef Py_ssize_t pos = 0
+        cdef PyObject *k
+        cdef PyObject *v
+        cdef hash_acc acc = 0
+        cdef FrozenDict frz = self.frz
+        cdef Py_ssize_t i
+        cdef tuple keys, vals
+        frz._flatten()
+        if frz.d is None:
+            keys = frz._key_tuple()
+            vals = frz._value_tuple()
+            for i in range(len(keys)):
+                acc ^= _shuffle(_pair_hash(keys[i], vals[i]))
+        else:
+            while PyDict_Next(frz.d, &pos, &k, &v):
+                acc ^= _shuffle(_pair_hash(<object>k, <object>v))
+        return _finish_hash(acc, len(frz))
 
     def __contains__(self, item):
         try:
@@ -146,143 +522,723 @@ cdef class Items(SetView):
         except Exception:
             return False
 
+cdef enum:
+    _KEYS, _VALUES, _ITEMS
+
+@cython.final
+cdef class _SmallIterator:
+    # Iterates over small storage without slicing the tuple
+    cdef tuple items
+    cdef Py_ssize_t pos, n
+    cdef int what
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        cdef Py_ssize_t i = self.pos
+        if i >= self.n:
+            raise StopIteration
+        self.pos = i + 1
+        if self.what == _KEYS:
+            return <object>PyTuple_GET_ITEM(self.items, i)
+        if self.what == _VALUES:
+            return <object>PyTuple_GET_ITEM(self.items, self.n + i)
+        return (<object>PyTuple_GET_ITEM(self.items, i),
+                <object>PyTuple_GET_ITEM(self.items, self.n + i))
+
+    def __length_hint__(self):
+        return self.n - self.pos
+
+cdef _SmallIterator _small_iter(tuple items, int what):
+    cdef _SmallIterator it = _SmallIterator.__new__(_SmallIterator)
+    it.items = items
+    it.n = len(items) >> 1
+    it.what = what
+    return it
+
+########################################
+#           Layered Storage            #
+########################################
+# set, delete, update and patch on a large FrozenDict do not copy
+# its hidden dictionary.  The result shares it as the base of a
+# _Layer and keeps its own changes on top, so the next change copies
+# only those.  Once a layer would hold more than about sqrt(n)
+# changes, the next change builds a new dictionary instead.  Over a
+# run of changes each one then costs O(sqrt(n)) time and memory on
+# average, rather than O(n), and a lookup makes at most two probes.
+
+# Only FrozenDicts at least this large are layered
+cdef enum:
+    _LAYER_MIN = 512
+
+@cython.final
+cdef class _Layer:
+    # The fields are declared in frozen_dict.pxd
+    pass
+
+cdef _Layer _layered(FrozenDict frz, dict changes):
+    # A layer holding frz with changes made, where a value of
+    # _MISSING removes the key, or None when frz should be copied
+    cdef _Layer old = frz.layer
+    cdef _Layer layer
+    cdef Py_ssize_t n
+    if isinstance(frz, OrderedMap):
+        # The order is kept in tuples, which would be copied anyway
+        return None
+    if old is not None:
+        n = old.n
+        held = len(old.delta) + len(old.removed)
+    elif frz.d is not None and len(<dict>frz.d) >= _LAYER_MIN:
+        n = len(<dict>frz.d)
+        held = 0
+    else:
+        return None
+    if held + len(changes) > <Py_ssize_t>sqrt(<double>n):
+        return None
+    layer = _Layer.__new__(_Layer)
+    if old is None:
+        layer.base = frz.d
+        layer.delta = {}
+        layer.removed = set()
+    else:
+        layer.base = old.base
+        layer.delta = old.delta.copy()
+        layer.removed = old.removed.copy()
+    for k, v in changes.items():
+        present = k in layer.delta or \
+            (k in layer.base and k not in layer.removed)
+        if v is _MISSING:
+            if not present:
+                raise KeyError(k)
+            layer.delta.pop(k, None)
+            if k in layer.base:
+                layer.removed.add(k)
+            n -= 1
+        else:
+            layer.delta[k] = v
+            if not present:
+                n += 1
+    layer.n = n
+    return layer
+
+cdef dict _layer_dict(_Layer layer):
+    # A new dictionary with the items of a layered FrozenDict
+    cdef dict d = layer.base.copy()
+    for k in layer.removed:
+        del d[k]
+    d.update(layer.delta)
+    return d
+
 cdef class FrozenDict:
     ''' An immutable dictionary.  A builtin dictionary is wrapped
         at the C level, which makes it impossible to manipulate from
         Python.  This means that if the values are hashable, the 
         FrozenDict is hashable as well.  Item retrieval is within
         10 ns of a builtin dict.
+
+        Instances made by a Shape keep only a tuple of values and
+        share the keys with every other instance of that Shape.
+        They behave exactly like any other FrozenDict.
+
+        Instances with no more than 8 items keep no dictionary at
+        all.  Their keys and values sit together in a single tuple,
+        and a lookup scans the keys, which takes less memory and
+        about as much time as a hash table of that size.
     '''
-    cdef object d
-    cdef long long h
+    # The fields are declared in frozen_dict.pxd
 
     def __cinit__(self, *args, **kw):
-        self.d = dict(*args, **kw)
         self.h = -1
+        if _stats_enabled:
+            _counters.created += 1
+        if isinstance(self, OrderedMap):
+            # OrderedMap.__cinit__ and its subclasses build the
+            # hidden dictionary themselves, and the arguments
+            # may be a one-shot iterator.
+            return
+        cdef FrozenDict other
+        if len(args) == 1 and not kw and isinstance(args[0], FrozenDict):
+            # Both are immutable, so the hidden dictionary
+            # and the cached hash can simply be shared.
+            other = args[0]
+            self.d = other.d
+            self.h = other.h
+            self.keyshape = other.keyshape
+            self.vals = other.vals
+            self.layer = other.layer
+            memcpy(self.tags, other.tags, sizeof(self.tags))
+            return
+        if not args and not kw:
+            self.d = _EMPTY
+            return
+        if (len(args) == 1 and not kw and type(args[0]) is dict
+                and 0 < len(<dict>args[0]) <= _SMALL_MAX):
+            # The items are copied out, so no new dict is needed
+            self._store_small(args[0])
+            return
+        self._store(dict(*args, **kw))
+
+    cdef _store(self, dict d):
+        # Keeps d as the hidden dictionary, or its items in small
+        # storage when there are few enough.  d must not be shared.
+        cdef Py_ssize_t n = len(d)
+        if n == 0 or n > _SMALL_MAX:
+            self.d = d
+        else:
+            self._store_small(d)
+
+    @cython.final
+    cdef _store_small(self, dict d):
+        cdef Py_ssize_t n = len(d)
+        cdef tuple items = PyTuple_New(2 * n)
+        cdef Py_ssize_t pos = 0, i = 0
+        cdef PyObject *k
+        cdef PyObject *v
+        while PyDict_Next(d, &pos, &k, &v):
+            self.tags[i] = _tag(hash(<object>k))
+            Py_INCREF(<object>k)
+            PyTuple_SET_ITEM(items, i, <object>k)
+            Py_INCREF(<object>v)
+            PyTuple_SET_ITEM(items, n + i, <object>v)
+            i += 1
+        self.d = None
+        self.vals = items
+
+    @cython.final
+    cdef Py_ssize_t _small_index(self, key) except -2:
+        # The position of key in small storage, or -1.  As in a
+        # dictionary, a key is matched by identity or else by
+        # equality, which is only tried where the tag of the key
+        # matches.  A one byte tag passes over 255 in 256 of the
+        # other keys, and costs a byte per key to keep.
+        cdef tuple items = self.vals
+        cdef Py_ssize_t i, n = len(items) >> 1
+        cdef PyObject *found
+        cdef unsigned char tag = _tag(hash(key))
+        cdef bint text = PyUnicode_CheckExact(key)
+        for i in range(n):
+            found = PyTuple_GET_ITEM(items, i)
+            if found is <PyObject *>key:
+                return i
+            if self.tags[i] != tag:
+                continue
+            if text and PyUnicode_CheckExact(<object>found):
+                if _str_eq(<object>found, key):
+                    return i
+            elif PyObject_RichCompareBool(<object>found, key, Py_EQ):
+                return i
+        return -1
+
+    @cython.final
+    cdef _flatten(self):
+        # Gives a layered instance a dictionary of its own, once.
+        # d is set before layer is cleared, so a thread that finds
+        # no layer always finds the dictionary.
+        cdef _Layer layer = self.layer
+        if layer is not None:
+            self.d = _layer_dict(layer)
+            self.layer = None
+
+    cdef object _get(self, key):
+        # self[key], or _MISSING when the key is not there
+        cdef Py_ssize_t i
+        cdef PyObject *found
+        if self.layer is not None:
+            found = frozendict_get(self, key)
+            return _MISSING if found is NULL else <object>found
+        if self.d is not None:
+            return (<dict>self.d).get(key, _MISSING)
+        if self.keyshape is not None:
+            i = self.keyshape.index.get(key, -1)
+        else:
+            i = self._small_index(key)
+            if i != -1:
+                i += len(self.vals) >> 1
+        if i == -1:
+            return _MISSING
+        return <object>PyTuple_GET_ITEM(self.vals, i)
+
+    cdef tuple _key_tuple(self):
+        # The keys of a shaped or small instance
+        if self.keyshape is not None:
+            return self.keyshape.keys
+        return self.vals[:len(self.vals) >> 1]
+
+    cdef tuple _value_tuple(self):
+        # The values of a shaped or small instance
+        if self.keyshape is not None:
+            return self.vals
+        return self.vals[len(self.vals) >> 1:]
+
+    cdef dict _dict(self):
+        # The contents as a dictionary, which must not be changed.
+        # Shaped and small instances build a new one on every call.
+        self._flatten()
+        if self.d is not None:
+            return self.d
+        return dict(zip(self._key_tuple(), self._value_tuple()))
+
+    cdef dict _dict_copy(self):
+        # The contents as a new dictionary, free to be changed
+        cdef _Layer layer = self.layer
+        if layer is not None:
+            return _layer_dict(layer)
+        if self.d is not None:
+            return self.d.copy()
+        return dict(zip(self._key_tuple(), self._value_tuple()))
 
     def __len__(self):
-        return len(self.d)
+        return frozendict_size(self)
 
     def __iter__(self):
-        return iter(self.d)
+        self._flatten()
+        if self.d is not None:
+            return iter(self.d)
+        if self.keyshape is not None:
+            return iter(self.keyshape.keys)
+        return _small_iter(self.vals, _KEYS)
+
+    cdef object _itervalues(self):
+        if type(self) is not FrozenDict:
+            # Subclasses may iterate in their own order
+            return (self[k] for k in self)
+        self._flatten()
+        if self.keyshape is not None:
+            return iter(self.vals)
+        if self.d is None:
+            return _small_iter(self.vals, _VALUES)
+        if PY_MAJOR_VERSION >= 3:
+            return iter((<dict>self.d).values())
+        return (<object>self.d).itervalues()
+
+    cdef object _iteritems(self):
+        if type(self) is not FrozenDict:
+            return ((k, self[k]) for k in self)
+        self._flatten()
+        if self.keyshape is not None:
+            return iter(zip(self.keyshape.keys, self.vals))
+        if self.d is None:
+            return _small_iter(self.vals, _ITEMS)
+        if PY_MAJOR_VERSION >= 3:
+            return iter((<dict>self.d).items())
+        return (<object>self.d).iteritems()
 
     def __getitem__(self, key):
-        return self.d[key]
+        cdef Py_ssize_t i
+        cdef PyObject *found
+        if self.d is not None:
+            return self.d[key]
+        if self.layer is not None:
+            found = frozendict_get(self, key)
+            if found is NULL:
+                raise KeyError(key)
+            return <object>found
+        if self.keyshape is not None:
+            return self.vals[self.keyshape.index[key]]
+        i = self._small_index(key)
+        if i == -1:
+            raise KeyError(key)
+        return <object>PyTuple_GET_ITEM(self.vals, i + (len(self.vals) >> 1))
 
     def __contains__(self, key):
-        return (key in self.d)
+        if self.d is not None:
+            return (key in self.d)
+        return self._get(key) is not _MISSING
 
     def __hash__(self):
-        if self.h == -1:
-            # The key-value pairs are reversed
-            # so that hash(self) and hash(self.items())
-            # will not collide with each other
-            pairs = ((self[k],k) for k in self)
-            self.h = hash(frozenset(pairs))
-            self.h ^= maxsize
-            if self.h == -1:
-                self.h = -2
-        return self.h
+        cdef double start
+        cdef long long h = _load_hash(&self.h)
+        if h == -1:
+            if not _observed:
+                h = self._compute_hash()
+                _store_hash(&self.h, h)
+                return h
+            if _stats_enabled:
+                _counters.hash_computed += 1
+            start = _timer()
+            h = self._compute_hash()
+            _store_hash(&self.h, h)
+            _observe('hash', start, self)
+        elif _stats_enabled:
+            _counters.hash_cached += 1
+        return h
+
+    cdef long long _compute_hash(self) except? -1:
+        self._flatten()
+        if self.d is None:
+            return _shaped_hash(self._key_tuple(), self._value_tuple())
+        return _dict_hash(self.d)
 
     def __repr__(self):
         c = self.__class__.__name__
-        return '%s(%r)' % (c, self.d)
+        return '%s(%r)' % (c, self._dict())
 
     def __sizeof__(self):
+        cdef _Layer layer = self.layer
+        if layer is not None:
+            # The base dictionary is shared with the FrozenDict
+            # this one was derived from, and counted there
+            return (getsizeof(layer.delta) + getsizeof(layer.removed)
+                    + getsizeof(self.h))
+        if self.keyshape is not None:
+            # The keys belong to the shape, not to this instance
+            return getsizeof(self.vals) + getsizeof(self.h)
+        if self.d is None:
+            return (getsizeof(self.vals) + getsizeof(self.h)
+                    + sizeof(self.tags))
         return getsizeof(self.d) + getsizeof(self.h)
         
-    def __getnewargs__(self):
-        items = tuple(self.items())
-        return (items,)
+    def __reduce__(self):
+        # Keys and values go out as two flat tuples.  A shaped
+        # instance sends its Shape instead of its keys, which pickle
+        # stores only once however many instances use it.
+        self._flatten()
+        if self.keyshape is not None:
+            keys, values = self.keyshape, self.vals
+        elif isinstance(self, OrderedMap):
+            keys = (<OrderedMap>self).key_array
+            values = (<OrderedMap>self).value_array
+        elif self.d is None:
+            keys, values = self._key_tuple(), self._value_tuple()
+        else:
+            keys, values = tuple(self.d), tuple(self.d.values())
+        cdef long long h = _load_hash(&self.h)
+        if h != -1 and _stable_hash(self):
+            args = (type(self), keys, values, h, _HASH_SEED)
+        else:
+            args = (type(self), keys, values)
+        state = getattr(self, '__dict__', None)
+        if state:
+            return (_rebuild, args, state)
+        return (_rebuild, args)
 
     cpdef _eq(self, FrozenDict other):
-        return self.d == other.d
+        if self is other:
+            return True
+        if len(self) != len(other):
+            return False
+        # Equal maps always have equal hashes, so two different
+        # cached hashes settle it without touching the entries.
+        cdef long long h1 = _load_hash(&self.h)
+        cdef long long h2 = _load_hash(&other.h)
+        if h1 != -1 and h2 != -1 and h1 != h2:
+            return False
+        self._flatten()
+        other._flatten()
+        if self.d is not None and other.d is not None:
+            return self.d == other.d
+        if self.keyshape is not None and self.keyshape is other.keyshape:
+            return self.vals == other.vals
+        return _within(self, other)
+
+    cdef object _equals(self, other):
+        # Returns NotImplemented for anything that is not a mapping
+        if isinstance(other, FrozenDict):
+            return self._eq(<FrozenDict>other)
+        if isinstance(other, dict):
+            if self.d is not None:
+                return self.d == other
+        elif not isinstance(other, Mapping):
+            return NotImplemented
+        if len(self) != len(other):
+            return False
+        return _within(self, other)
 
     def __richcmp__(self, other, int flag):
-        # For fastest comparison of one FrozenDict to another.
-        # We just compare the hidden underlying dictionaries
-        # This makes comparisons slightly slower for regular
-        # dictionaries because we raise and catch an error.
-        try:
-            if flag == 2:
-                return self._eq(other)
-            elif flag == 3:
-                return not self._eq(other)
-        except TypeError:
-            pass
+        # Typed fast paths for FrozenDicts, dictionaries and other
+        # mappings.  The ordering operators compare the items as
+        # sets, the same way that ItemsView does.
+        if flag == 2:    # EQUAL
+            return self._equals(other)
+        if flag == 3:    # NOT EQUAL
+            eq = self._equals(other)
+            if eq is NotImplemented:
+                return eq
+            return not eq
 
-        # Check that "other" is either an instance of dict or FrozenDict
-        # This logic is quicker than using the builtin "isinstance"
-        mro = other.__class__.__mro__
-        if (dict not in mro) and (FrozenDict not in mro):
+        if not isinstance(other, (FrozenDict, dict, Mapping)):
             return NotImplemented
 
-        switch = True
         if flag == 0:    # LESS THAN
-            if len(self) >= len(other):
-                return False
-            little, big = self, other
-
+            return len(self) < len(other) and _within(self, other)
         elif flag == 1:  # LESS THAN OR EQUAL
-            if len(self) > len(other):
-                return False
-            little, big = self, other
+            return len(self) <= len(other) and _within(self, other)
+        elif flag == 4:  # GREATER THAN
+            return len(self) > len(other) and _within(other, self)
+        else:            # GREATER THAN OR EQUAL
+            return len(self) >= len(other) and _within(other, self)
 
-        elif flag == 2:    # EQUAL
-            if len(self) != len(other):
-                return False
-            little, big = self, other
+    def get(self, key, default=None):
+        cdef PyObject *value = frozendict_get(self, key)
+        if value is NULL:
+            return default
+        return <object>value
 
-        elif flag == 3:  # NOT EQUAL
-            if len(self) != len(other):
-                return True
-            little, big = self, other
-            switch = False
+    def get_many(self, keys, default=None):
+        ''' Returns a tuple of the values for keys, in the same
+            order, with default in place of any that are missing.  '''
+        return _get_many(self, keys, default)
 
-        elif flag == 4:  # GREATER THAN
-            if len(self) <= len(other):
-                return False
-            little, big = other, self
+    @staticmethod
+    def getter(*keys, default=_MISSING):
+        ''' Returns a Getter, which is called with a FrozenDict and
+            returns a tuple of its values for keys.  Missing keys
+            raise a KeyError unless a default is given.  '''
+        return Getter(keys, default)
 
-        elif flag == 5:  # GREATER THAN OR EQUAL
-            if len(self) < len(other):
-                return False
-            little, big = other, self
+    def take(self, keys, out=None, default=_MISSING):
+        ''' Looks up every integer in keys, a one dimensional buffer
+            such as an array.array or a NumPy array, in a single C
+            loop.  The values are written to out, a writable buffer
+            of numbers with the same length, which is returned; with
+            no out they are returned in a list.  Missing keys raise
+            a KeyError unless a default is given.  '''
+        return _take(self, keys, out, default)
+
+    def copy(self):
+        # Nothing can change a FrozenDict, so it is its own copy
+        return self
+
+    @classmethod
+    def adopt(cls, d):
+        ''' Wraps d without copying it.  The FrozenDict takes
+            ownership of d: the caller must not keep a reference
+            to it or change it afterwards.  Use this for a dict
+            that was built only to be frozen.  Anything other
+            than a plain dict is copied as usual.  '''
+        if type(d) is not dict:
+            return cls(d)
+        cdef FrozenDict frz = cls.__new__(cls)
+        frz._adopt(d)
+        return frz
+
+    cdef _adopt(self, dict d):
+        self._store(d)
+
+    cdef FrozenDict _derive(self, dict d):
+        # Wrap a freshly built dictionary that nobody else holds
+        # a reference to.  Skips the copy made by __cinit__.
+        cdef FrozenDict frz = type(self).__new__(type(self))
+        frz._store(d)
+        return frz
+
+    @staticmethod
+    def intern(frz):
+        ''' Returns the one live FrozenDict equal to frz, of the same
+            class and with items of the same types, adding frz to
+            intern_table if there is none yet.  Interned instances
+            that are equal are identical, and so compare by identity.
+            Raises a TypeError if frz is not hashable.  '''
+        return intern_table.intern(frz)
 
+    def compile(self):
+        ''' Returns a StaticFrozenDict with the same items, which
+            finds every key with a single probe of a perfect hash.  '''
+        return StaticFrozenDict(self._iteritems())
+
+    def dump_snapshot(self, path):
+        ''' Writes the items to a snapshot file, which open_snapshot
+            maps into memory.  Keys must be str, int or bytes, and
+            values None, bool, int, float, str or bytes.  '''
+        _dump_snapshot(self, path)
+
+    @staticmethod
+    def open_snapshot(path):
+        ''' Returns a Snapshot, a read-only mapping over a file
+            written by dump_snapshot.  Opening takes the same time
+            however large the file is, and lookups read it in place.'''
+        return Snapshot(path)
+
+    @staticmethod
+    def from_columns(keys, columns, bint lazy=False):
+        ''' Returns a list of FrozenDicts, one per row, from one
+            column of values per key.  A column may be a list, a tuple,
+            an array.array or anything else with the buffer protocol,
+            or any other iterable.  All the FrozenDicts share a single
+            Shape, so keys may also be a Shape.  With lazy=True a
+            FrozenRecordBatch is returned instead, which builds each
+            FrozenDict only when it is needed.  '''
+        cdef Shape shape = keys if isinstance(keys, Shape) else Shape(keys)
+        cdef list cols = _columns(shape, columns, lazy)
+        cdef Py_ssize_t n = len(cols[0]) if cols else 0
+        cdef FrozenRecordBatch batch
+        if lazy:
+            batch = FrozenRecordBatch.__new__(FrozenRecordBatch)
+            batch.shape = shape
+            batch.cols = cols
+            batch.n = n
+            return batch
+        return _rows_from_columns(shape, cols, n)
+
+    @staticmethod
+    def from_rows(keys, rows, bint lazy=False):
+        ''' Like from_columns, but from an iterable of rows, each a
+            sequence with one value per key in the order of keys.  '''
+        cdef Shape shape = keys if isinstance(keys, Shape) else Shape(keys)
+        cdef list vals = [_row_values(shape, row) for row in rows]
+        cdef FrozenRecordBatch batch
+        if lazy:
+            batch = FrozenRecordBatch.__new__(FrozenRecordBatch)
+            batch.shape = shape
+            batch.rows = vals
+            batch.n = len(vals)
+            return batch
+        cdef bint collecting = gc.isenabled()
+        gc.disable()
         try:
-            for k in little:
-                if little[k] != big[k]:
-                    return not switch
-            return switch
-        except KeyError:
-            return not switch
+            return [_shaped(shape, <tuple>v) for v in vals]
+        finally:
+            if collecting:
+                gc.enable()
 
-    def get(self, key, default=None):
-        if key in self.d:
-            return self.d[key]
+    @staticmethod
+    def shape(keys):
+        ''' Returns a Shape, a factory for FrozenDicts that all have
+            exactly these keys.  They store only their values, and
+            share a single key index between them.  '''
+        return Shape(keys)
+
+    cdef long long _derived_hash(self, dict changes, d):
+        # The hash of d, which is self with the keys in changes
+        # added, replaced or (when missing from d) removed, worked
+        # out from the cached hash of self.  Returns -1 when there
+        # is nothing to work from or a new value is unhashable.
+        cdef long long h = _load_hash(&self.h)
+        if not _can_resume(h):
+            return -1
+        cdef hash_acc acc = _resume_hash(h, len(self))
+        try:
+            for k in changes:
+                if k in self:
+                    acc ^= _entry_hash(k, self[k])
+                if k in d:
+                    acc ^= _entry_hash(k, d[k])
+        except TypeError:
+            return -1
+        return _finish_hash(acc, len(d))
+
+    cdef FrozenDict _with_changes(self, dict changes):
+        # self with the items in changes set, or removed where the
+        # value is _MISSING.  A large instance is layered over the
+        # hidden dictionary of self; anything else gets a copy.
+        cdef FrozenDict frz
+        cdef _Layer layer = _layered(self, changes)
+        cdef dict d
+        if layer is not None:
+            frz = type(self).__new__(type(self))
+            frz.d = None
+            frz.layer = layer
         else:
-            return default
+            d = self._dict_copy()
+            for k, v in changes.items():
+                if v is _MISSING:
+                    del d[k]
+                else:
+                    d[k] = v
+            frz = self._derive(d)
+        frz.h = self._derived_hash(changes, frz)
+        return frz
 
-    def copy(self):
-        return type(self)(self)
+    def set(self, key, value):
+        ''' Returns a FrozenDict with key mapped to value.
+            The original is left untouched.  A FrozenDict of 512
+            items or more shares its hidden dictionary with the
+            result, which keeps only its own changes, so a run of
+            calls costs O(sqrt(n)) time and memory per call on
+            average.  Smaller ones are copied.  Use evolver() to
+            make many changes with a single copy.  '''
+        cdef FrozenDict frz
+        if key in self and self[key] is value:
+            return self
+        if self.keyshape is not None and key in self.keyshape.index:
+            # Replacing a value keeps the shared keys
+            vals = list(self.vals)
+            vals[self.keyshape.index[key]] = value
+            frz = _shaped(self.keyshape, tuple(vals))
+            frz.h = self._derived_hash({key: value}, frz)
+            return frz
+        return self._with_changes({key: value})
+
+    def delete(self, key):
+        ''' Returns a FrozenDict without key.  Raises
+            a KeyError if key is not present.  Costs the
+            same as set().  '''
+        if key not in self:
+            raise KeyError(key)
+        return self._with_changes({key: _MISSING})
+
+    def update(self, *args, **kw):
+        ''' Returns a FrozenDict with the items from the arguments
+            added, accepting the same arguments as dict.update.
+            Costs the same as set() for each item added, or one
+            copy of the hidden dictionary at most.  '''
+        if not args and not kw:
+            return self
+        return self._with_changes(dict(*args, **kw))
+
+    def diff(self, other, bint recursive=False):
+        ''' Returns a Diff of the items added, removed and changed
+            on the way from self to other.  With recursive=True, a
+            value that is a FrozenDict on both sides is diffed in
+            turn.  Values are compared by identity first, and two
+            FrozenDicts with different cached hashes are known to
+            differ without a look inside, so trees that share their
+            unchanged parts, as the results of set and update do,
+            are diffed in time proportional to what changed.  '''
+        if not isinstance(other, FrozenDict):
+            other = FrozenDict(other)
+        return _diff(self, other, recursive)
+
+    def patch(self, Diff diff not None):
+        ''' Returns a FrozenDict with diff applied, so that
+            a.patch(a.diff(b)) == b.  The hash is carried over from
+            self in time proportional to the size of the diff.  '''
+        if not diff:
+            return self
+        cdef dict changes = {}
+        for k in diff.removed:
+            changes[k] = _MISSING
+        for k, v in diff.added._iteritems():
+            changes[k] = v
+        for k, c in diff.changed._iteritems():
+            if isinstance(c, Diff):
+                changes[k] = self[k].patch(c)
+            else:
+                changes[k] = c[1]
+        return self._with_changes(changes)
+
+    def evolver(self):
+        ''' Returns an Evolver for making a batch of changes
+            with a single O(n) copy of the underlying dictionary,
+            made on the first write.  '''
+        return Evolver(self)
 
     @classmethod
     def fromkeys(cls, keys, value):
-        return cls(dict.fromkeys(keys, value))
+        return cls.adopt(dict.fromkeys(keys, value))
 
     ########################################
-    #         Python 3 Methods             #
+    #      Python 3 and 2 Methods          #
     ########################################
-    """
+    # Python 3 gets lazy views, Python 2 gets lists.
+    # PY_MAJOR_VERSION is a C constant, so the compiler drops the
+    # branch that does not apply to the interpreter being built for.
+
     def keys(self):
-        return Keys(self)
+        if PY_MAJOR_VERSION >= 3:
+            return Keys(self)
+        return list(self)
 
     def values(self):
-        return Values(self)
+        if PY_MAJOR_VERSION >= 3:
+            return Values(self)
+        return list(Values(self))
 
     def items(self):
-        return Items(self)
-    #"""
+        if PY_MAJOR_VERSION >= 3:
+            return Items(self)
+        return list(Items(self))
 
     ########################################
     #         Python 2 Methods             #
@@ -301,42 +1257,2418 @@ cdef class FrozenDict:
         return Items(self)
 
     def iterkeys(self):
-        return (k for k in self)
+        return iter(self)
 
     def itervalues(self):
-        return (self[k] for k in self)
+        return iter(Values(self))
 
     def iteritems(self):
-        return ((k,self[k]) for k in self)
+        return iter(Items(self))
+
+@cython.final
+cdef class Evolver:
+    ''' A mutable working copy of a FrozenDict.  Reads go to
+        the original until the first write, which makes one private
+        copy of the hidden dictionary.  persistent() then wraps that
+        copy in a new FrozenDict without copying it a second time.
+
+        Behaves like a regular dictionary.  set, delete and update
+        mirror the FrozenDict methods of the same name, but change
+        the Evolver in place and return it, so calls can be chained.
+    '''
+    cdef FrozenDict frz
+    cdef dict base
+    cdef dict d
+    cdef dict changed
+
+    def __cinit__(self, FrozenDict frz):
+        self.frz = frz
+        self.base = frz._dict()
+        self.d = None
+        self.changed = {}
+
+    cdef dict _current(self):
+        if self.d is None:
+            return self.base
+        return self.d
+
+    cdef dict _writable(self):
+        if self.d is None:
+            self.d = self.base.copy()
+        return self.d
+
+    cdef dict _writable_key(self, key):
+        # The keys written to are remembered so that persistent()
+        # can derive the new hash instead of computing it afresh.
+        # Past a quarter of the map that would no longer pay off.
+        if self.changed is not None:
+            if len(self.changed) * 4 > len(self.base):
+                self.changed = None
+            else:
+                self.changed[key] = None
+        return self._writable()
+
+    def __len__(self):
+        return len(self._current())
+
+    def __iter__(self):
+        return iter(self._current())
+
+    def __getitem__(self, key):
+        return self._current()[key]
+
+    def __contains__(self, key):
+        return (key in self._current())
+
+    def __setitem__(self, key, value):
+        self._writable_key(key)[key] = value
+
+    def __delitem__(self, key):
+        if key not in self._current():
+            raise KeyError(key)
+        del self._writable_key(key)[key]
+
+    def __repr__(self):
+        c = self.__class__.__name__
+        return '%s(%r)' % (c, self._current())
+
+    def __richcmp__(self, other, int flag):
+        if flag == 2:
+            return self._current() == other
+        elif flag == 3:
+            return self._current() != other
+        return NotImplemented
+
+    __hash__ = None
+
+    def get(self, key, default=None):
+        return self._current().get(key, default)
 
     def keys(self):
-        return [k for k in self]
+        return KeysView(self)
 
     def values(self):
-        return [self[k] for k in self]
+        return ValuesView(self)
 
     def items(self):
-        return [(k,self[k]) for k in self]
-    #"""
+        return ItemsView(self)
 
-Mapping.register(FrozenDict)
-ValuesView.register(Values)
-ItemsView.register(Items)
-KeysView.register(Keys)
+    def pop(self, key, *default):
+        if key not in self._current():
+            if default:
+                return default[0]
+            raise KeyError(key)
+        return self._writable_key(key).pop(key)
+
+    def popitem(self):
+        if not self._current():
+            raise KeyError('popitem(): evolver is empty')
+        item = self._writable().popitem()
+        self._writable_key(item[0])
+        return item
+
+    def setdefault(self, key, default=None):
+        if key in self._current():
+            return self._current()[key]
+        self._writable_key(key)[key] = default
+        return default
+
+    def clear(self):
+        self.d = {}
+        self.changed = None
+
+    def set(self, key, value):
+        self[key] = value
+        return self
+
+    def delete(self, key):
+        del self[key]
+        return self
+
+    def update(self, *args, **kw):
+        for k, v in dict(*args, **kw).items():
+            self[k] = v
+        return self
+
+    def is_dirty(self):
+        return (self.d is not None)
+
+    def persistent(self):
+        ''' Returns a FrozenDict holding the current contents.
+            Further changes start from a fresh copy.  '''
+        cdef FrozenDict frz
+        if self.d is not None:
+            frz = self.frz._derive(self.d)
+            if self.changed is not None:
+                frz.h = self.frz._derived_hash(self.changed, self.d)
+            self.frz = frz
+            self.base = self.d
+            self.d = None
+        self.changed = {}
+        return self.frz
+
+########################################
+#                Diffs                 #
+########################################
+
+@cython.final
+cdef class Diff:
+    ''' The difference between two FrozenDicts, made by
+        old.diff(new).  added and removed map keys to their value in
+        new and old, and changed maps each key whose value differs to
+        an (old, new) pair, or to a nested Diff in recursive mode.
+        old.patch(diff) == new.  A Diff is false when nothing differs.
+    '''
+    cdef readonly FrozenDict added
+    cdef readonly FrozenDict removed
+    cdef readonly FrozenDict changed
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.changed)
+
+    def __richcmp__(self, other, int flag):
+        if flag != 2 and flag != 3 or not isinstance(other, Diff):
+            return NotImplemented
+        cdef Diff o = other
+        equal = (self.added == o.added and self.removed == o.removed
+                 and self.changed == o.changed)
+        return equal if flag == 2 else not equal
+
+    __hash__ = None
+
+    def __repr__(self):
+        c = self.__class__.__name__
+        return '%s(added=%r, removed=%r, changed=%r)' % (
+            c, self.added._dict(), self.removed._dict(),
+            self.changed._dict())
+
+cdef inline bint _same(a, b) except -1:
+    # Equality, settled without looking inside where possible
+    cdef long long h1, h2
+    if a is b:
+        return True
+    if isinstance(a, FrozenDict) and isinstance(b, FrozenDict):
+        h1 = _load_hash(&(<FrozenDict>a).h)
+        h2 = _load_hash(&(<FrozenDict>b).h)
+        if h1 != -1 and h2 != -1 and h1 != h2:
+            return False
+    return a == b
+
+cdef list _touched(FrozenDict old, FrozenDict new):
+    # The only keys that can differ between old and new when they
+    # read from the same hidden dictionary, one of them at least
+    # through a _Layer, or None when they do not
+    cdef _Layer layer
+    cdef _Layer a = old.layer
+    cdef _Layer b = new.layer
+    if a is None and b is None:
+        return None
+    base = old.d if a is None else a.base
+    if base is None or base is not (new.d if b is None else b.base):
+        return None
+    cdef dict keys = {}
+    for layer in (a, b):
+        if layer is not None:
+            keys.update(dict.fromkeys(layer.delta))
+            keys.update(dict.fromkeys(layer.removed))
+    return list(keys)
+
+cdef Diff _diff(FrozenDict old, FrozenDict new, bint recursive):
+    cdef dict added = {}, removed = {}, changed = {}
+    cdef Py_ssize_t pos = 0
+    cdef PyObject *k
+    cdef PyObject *v
+    cdef Diff diff = Diff.__new__(Diff)
+    cdef list touched = None if old is new else _touched(old, new)
+    if touched is not None:
+        for key in touched:
+            before = old._get(key)
+            after = new._get(key)
+            if before is _MISSING:
+                if after is not _MISSING:
+                    added[key] = after
+            elif after is _MISSING:
+                removed[key] = before
+            elif not _same(before, after):
+                if recursive and isinstance(before, FrozenDict) \
+                        and isinstance(after, FrozenDict):
+                    changed[key] = _diff(before, after, True)
+                else:
+                    changed[key] = (before, after)
+        diff.added = FrozenDict.adopt(added)
+        diff.removed = FrozenDict.adopt(removed)
+        diff.changed = FrozenDict.adopt(changed)
+        return diff
+    cdef dict a = old._dict()
+    cdef dict b = new._dict()
+    if old is not new and a is not b:
+        while PyDict_Next(a, &pos, &k, &v):
+            other = b.get(<object>k, _MISSING)
+            if other is _MISSING:
+                removed[<object>k] = <object>v
+            elif not _same(<object>v, other):
+                if recursive and isinstance(<object>v, FrozenDict) \
+                        and isinstance(other, FrozenDict):
+                    changed[<object>k] = _diff(<object>v, other, True)
+                else:
+                    changed[<object>k] = (<object>v, other)
+        if len(b) != len(a) - len(removed):
+            pos = 0
+            while PyDict_Next(b, &pos, &k, &v):
+                if <object>k not in a:
+                    added[<object>k] = <object>v
+    diff.added = FrozenDict.adopt(added)
+    diff.removed = FrozenDict.adopt(removed)
+    diff.changed = FrozenDict.adopt(changed)
+    return diff
+
+@cython.final
+cdef class Shape:
+    ''' A fixed sequence of keys shared by many FrozenDicts.
+        Calling the shape with one value per key returns a FrozenDict
+        that stores nothing but a tuple of those values.  Lookups go
+        through a single key to slot index owned by the shape.
+
+        >>> point = FrozenDict.shape(('x', 'y'))
+        >>> point(3, 4) == FrozenDict(x=3, y=4)
+        True
+    '''
+
+    def __cinit__(self, keys):
+        self.keys = tuple(keys)
+        self.index = {}
+        for i, k in enumerate(self.keys):
+            if k in self.index:
+                raise ValueError('Duplicate key in shape: %r' % (k,))
+            self.index[k] = i
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __repr__(self):
+        c = self.__class__.__name__
+        return '%s(%r)' % (c, self.keys)
+
+    def __reduce__(self):
+        return (Shape, (self.keys,))
+
+    def __call__(self, *values):
+        return self.fromvalues(values)
+
+    def fromvalues(self, values):
+        ''' Returns a FrozenDict pairing the keys with a
+            sequence of values, given in the same order.  '''
+        cdef tuple vals = tuple(values)
+        if len(vals) != len(self.keys):
+            msg = 'Expected %d values, got %d'
+            raise TypeError(msg % (len(self.keys), len(vals)))
+        return _shaped(self, vals)
+
+    def fromdict(self, mapping):
+        ''' Returns a FrozenDict with the same contents as mapping,
+            which must have exactly the keys of this shape.  '''
+        if len(mapping) != len(self.keys):
+            raise ValueError('Keys do not match %r' % (self,))
+        return _shaped(self, tuple([mapping[k] for k in self.keys]))
+
+cdef FrozenDict _shaped(Shape shape, tuple vals):
+    cdef FrozenDict frz = FrozenDict.__new__(FrozenDict)
+    frz.d = None
+    frz.keyshape = shape
+    frz.vals = vals
+    return frz
+
+########################################
+#           Batched Lookups            #
+########################################
+
+cdef tuple _get_many(FrozenDict frz, keys, default):
+    # A missing key raises a KeyError when default is _MISSING
+    cdef tuple ks = keys if type(keys) is tuple else tuple(keys)
+    cdef Py_ssize_t i, n = len(ks)
+    cdef tuple out = PyTuple_New(n)
+    cdef PyObject *value
+    for i in range(n):
+        key = <object>PyTuple_GET_ITEM(ks, i)
+        value = frozendict_get(frz, key)
+        if value is not NULL:
+            item = <object>value
+        elif default is _MISSING:
+            raise KeyError(key)
+        else:
+            item = default
+        Py_INCREF(item)
+        PyTuple_SET_ITEM(out, i, item)
+    return out
+
+@cython.final
+cdef class Getter:
+    ''' Pulls the values for a fixed sequence of keys out of a
+        FrozenDict, returning them as a tuple.  For FrozenDicts made
+        from a Shape, such as the rows of from_columns, the getter
+        remembers where its keys sit in the shape, so that each call
+        reads the values with no hashing at all.
+
+        >>> point = FrozenDict.getter('x', 'y')
+        >>> point(FrozenDict(x=3, y=4, z=5))
+        (3, 4)
+    '''
+    cdef readonly tuple keys
+    cdef object default
+    # (shape, slots): the last Shape seen, and the slot of each key
+    # in it or -1.  They are kept in one field so that threads
+    # sharing the getter always read a matching pair.
+    cdef tuple cache
+
+    def __cinit__(self, keys, default=_MISSING):
+        self.keys = tuple(keys)
+        self.default = default
+        self.cache = (None, ())
+
+    def __call__(self, frz):
+        if not isinstance(frz, FrozenDict):
+            return self._mapping_values(frz)
+        cdef FrozenDict f = <FrozenDict>frz
+        if f.keyshape is None:
+            return _get_many(f, self.keys, self.default)
+        cdef tuple cache = self.cache
+        if cache[0] is not f.keyshape:
+            cache = (f.keyshape, tuple([f.keyshape.index.get(k, -1)
+                                        for k in self.keys]))
+            self.cache = cache
+        cdef tuple slots = cache[1]
+        cdef Py_ssize_t i, j, n = len(slots)
+        cdef tuple out = PyTuple_New(n)
+        for i in range(n):
+            j = PyLong_AsSsize_t(<object>PyTuple_GET_ITEM(slots, i))
+            if j != -1:
+                item = <object>PyTuple_GET_ITEM(f.vals, j)
+            elif self.default is _MISSING:
+                raise KeyError(self.keys[i])
+            else:
+                item = self.default
+            Py_INCREF(item)
+            PyTuple_SET_ITEM(out, i, item)
+        return out
+
+    cdef tuple _mapping_values(self, mapping):
+        # Any other mapping, through its own __getitem__
+        cdef list out = []
+        for k in self.keys:
+            try:
+                out.append(mapping[k])
+            except KeyError:
+                if self.default is _MISSING:
+                    raise
+                out.append(self.default)
+        return tuple(out)
+
+    def __repr__(self):
+        args = ', '.join([repr(k) for k in self.keys])
+        if self.default is not _MISSING:
+            args += '%sdefault=%r' % (', ' if self.keys else '',
+                                      self.default)
+        return 'FrozenDict.getter(%s)' % (args,)
+
+    def __reduce__(self):
+        if self.default is _MISSING:
+            return (Getter, (self.keys,))
+        return (Getter, (self.keys, self.default))
+
+# take() reads and writes buffers of native numbers, in the codes
+# of the struct module.  Keys must be integers; the values written
+# to out may also be floats or bools.
+cdef bytes _INT_CODES = b'bBhHiIlLqQnN'
+cdef bytes _NUMBER_CODES = b'bBhHiIlLqQnNfd?'
+
+cdef char _buffer_code(Py_buffer *view, bytes codes, what) except 0:
+    fmt = view.format if view.format is not NULL else b'B'
+    if fmt[:1] == b'@':
+        fmt = fmt[1:]
+    if view.ndim != 1:
+        raise ValueError('%s must be one dimensional' % (what,))
+    if len(fmt) != 1 or fmt not in codes:
+        raise ValueError('Unsupported %s format: %r' % (what, fmt))
+    return (<char *>fmt)[0]
+
+cdef object _read_int(char *p, char code):
+    if code == b'b':
+        return (<signed char *>p)[0]
+    elif code == b'B':
+        return (<unsigned char *>p)[0]
+    elif code == b'h':
+        return (<short *>p)[0]
+    elif code == b'H':
+        return (<unsigned short *>p)[0]
+    elif code == b'i':
+        return (<int *>p)[0]
+    elif code == b'I':
+        return (<unsigned int *>p)[0]
+    elif code == b'l':
+        return (<long *>p)[0]
+    elif code == b'L':
+        return (<unsigned long *>p)[0]
+    elif code == b'q':
+        return (<long long *>p)[0]
+    elif code == b'Q':
+        return (<unsigned long long *>p)[0]
+    elif code == b'n':
+        return (<Py_ssize_t *>p)[0]
+    else:
+        return (<size_t *>p)[0]
+
+cdef int _write_number(char *p, char code, value) except -1:
+    # Numbers that do not fit raise an OverflowError
+    if code == b'd':
+        (<double *>p)[0] = value
+        return 0
+    elif code == b'f':
+        (<float *>p)[0] = value
+        return 0
+    elif code == b'?':
+        (<unsigned char *>p)[0] = 1 if value else 0
+        return 0
+    # Like array.array, floats are not truncated to fit integers
+    value = PyNumber_Index(value)
+    if code == b'b':
+        (<signed char *>p)[0] = value
+    elif code == b'B':
+        (<unsigned char *>p)[0] = value
+    elif code == b'h':
+        (<short *>p)[0] = value
+    elif code == b'H':
+        (<unsigned short *>p)[0] = value
+    elif code == b'i':
+        (<int *>p)[0] = value
+    elif code == b'I':
+        (<unsigned int *>p)[0] = value
+    elif code == b'l':
+        (<long *>p)[0] = value
+    elif code == b'L':
+        (<unsigned long *>p)[0] = value
+    elif code == b'q':
+        (<long long *>p)[0] = value
+    elif code == b'Q':
+        (<unsigned long long *>p)[0] = value
+    elif code == b'n':
+        (<Py_ssize_t *>p)[0] = value
+    else:
+        (<size_t *>p)[0] = value
+    return 0
+
+cdef object _take(FrozenDict frz, keys, out, default):
+    cdef Py_buffer kv, ov
+    cdef char kc, oc = 0
+    cdef Py_ssize_t i, n
+    cdef PyObject *value
+    cdef list result = None
+    PyObject_GetBuffer(keys, &kv, PyBUF_RECORDS_RO)
+    try:
+        kc = _buffer_code(&kv, _INT_CODES, 'keys')
+        n = kv.shape[0]
+        if out is None:
+            result = []
+        else:
+            PyObject_GetBuffer(out, &ov, PyBUF_RECORDS)
+        try:
+            if out is not None:
+                oc = _buffer_code(&ov, _NUMBER_CODES, 'out')
+                if ov.shape[0] != n:
+                    raise ValueError('out has %d items, expected %d'
+                                     % (ov.shape[0], n))
+            for i in range(n):
+                key = _read_int(<char *>kv.buf + i * kv.strides[0], kc)
+                value = frozendict_get(frz, key)
+                if value is not NULL:
+                    item = <object>value
+                elif default is _MISSING:
+                    raise KeyError(key)
+                else:
+                    item = default
+                if result is not None:
+                    result.append(item)
+                else:
+                    _write_number(<char *>ov.buf + i * ov.strides[0],
+                                  oc, item)
+        finally:
+            if out is not None:
+                PyBuffer_Release(&ov)
+    finally:
+        PyBuffer_Release(&kv)
+    return out if result is None else result
+
+########################################
+#          Columnar Construction       #
+########################################
+# Batches of rows share one Shape, so each row costs a tuple of
+# values and the FrozenDict around it, and nothing else.
+
+cdef object _column(col, bint lazy):
+    # A sequence that can be indexed.  Buffers are read through a
+    # memoryview; eagerly they are converted to a list in one go.
+    # A lazy batch keeps its columns, so it takes copies that the
+    # caller cannot change: tuples, or a read-only memoryview over
+    # a copy of the bytes of a buffer.
+    if isinstance(col, tuple):
+        return col
+    if isinstance(col, list):
+        return tuple(col) if lazy else col
+    try:
+        mv = memoryview(col)
+    except TypeError:
+        return tuple(col) if lazy else list(col)
+    if mv.ndim != 1:
+        raise ValueError('Columns must be one dimensional')
+    if not lazy:
+        return mv.tolist()
+    try:
+        return memoryview(mv.tobytes()).cast(mv.format)
+    except (AttributeError, TypeError, ValueError):
+        # Formats that cannot be cast back from bytes
+        return tuple(col)
+
+cdef list _columns(Shape shape, columns, bint lazy):
+    cdef list cols = [_column(c, lazy) for c in columns]
+    if len(cols) != len(shape.keys):
+        msg = 'Expected %d columns, got %d'
+        raise TypeError(msg % (len(shape.keys), len(cols)))
+    for c in cols:
+        if len(c) != len(cols[0]):
+            raise ValueError('Columns must all have the same length')
+    return cols
+
+cdef list _rows_from_columns(Shape shape, list cols, Py_ssize_t n):
+    cdef Py_ssize_t m = len(cols), i, j
+    cdef list out = []
+    cdef tuple vals
+    # The new objects cannot form cycles, so the collector would
+    # only slow the loop down by scanning them over and over.
+    cdef bint collecting = gc.isenabled()
+    gc.disable()
+    try:
+        for i in range(n):
+            vals = PyTuple_New(m)
+            for j in range(m):
+                item = <object>PySequence_Fast_GET_ITEM(
+                    <object>PyList_GET_ITEM(cols, j), i)
+                Py_INCREF(item)
+                PyTuple_SET_ITEM(vals, j, item)
+            out.append(_shaped(shape, vals))
+    finally:
+        if collecting:
+            gc.enable()
+    return out
+
+cdef tuple _row_values(Shape shape, row):
+    cdef tuple vals = tuple(row)
+    if len(vals) != len(shape.keys):
+        msg = 'Expected %d values, got %d'
+        raise TypeError(msg % (len(shape.keys), len(vals)))
+    return vals
+
+@cython.final
+cdef class FrozenRecordBatch:
+    ''' A read-only sequence of FrozenDicts that all have the same
+        keys, made by FrozenDict.from_columns or from_rows with
+        lazy=True.  Each FrozenDict is built when it is indexed, and
+        is not kept, so indexing twice gives two equal objects.
+        Slicing gives another batch over the same data.
+    '''
+    cdef readonly Shape shape
+    # Either one sequence per key, or one tuple of values per row
+    cdef list cols
+    cdef list rows
+    cdef Py_ssize_t n
+
+    def __len__(self):
+        return self.n
+
+    cdef FrozenDict _row(self, Py_ssize_t i):
+        if self.rows is not None:
+            return _shaped(self.shape, <tuple>self.rows[i])
+        return _shaped(self.shape, tuple([c[i] for c in self.cols]))
+
+    def __getitem__(self, index):
+        cdef FrozenRecordBatch batch
+        cdef Py_ssize_t i
+        if isinstance(index, slice):
+            batch = FrozenRecordBatch.__new__(FrozenRecordBatch)
+            batch.shape = self.shape
+            if self.rows is not None:
+                batch.rows = self.rows[index]
+                batch.n = len(batch.rows)
+            else:
+                batch.cols = [c[index] for c in self.cols]
+                batch.n = len(range(self.n)[index])
+            return batch
+        i = index
+        if i < 0:
+            i += self.n
+        if not 0 <= i < self.n:
+            raise IndexError('FrozenRecordBatch index out of range')
+        return self._row(i)
 
-cdef class OrderedMap(FrozenDict):
-    ''' A FrozenDict subclass where the item order is preserved.'''
-    cdef object key_order
-    def __cinit__(self, iterable):
-        keys, values = zip(*iterable)
-        d = dict(zip(keys, values))
-        FrozenDict.__init__(self, d)
-        self.key_order = keys
-        
     def __iter__(self):
-        return (k for k in self.key_order)
-        
+        cdef Py_ssize_t i
+        for i in range(self.n):
+            yield self._row(i)
+
+    def column(self, key):
+        ''' The values for key, one per row, as a tuple '''
+        cdef Py_ssize_t j = self.shape.index[key]
+        if self.rows is not None:
+            return tuple([row[j] for row in self.rows])
+        return tuple(self.cols[j])
+
+    def tolist(self):
+        ''' Builds every FrozenDict at once '''
+        if self.rows is not None:
+            return [_shaped(self.shape, <tuple>row) for row in self.rows]
+        cols = [c if isinstance(c, (list, tuple)) else list(c)
+                for c in self.cols]
+        return _rows_from_columns(self.shape, cols, self.n)
+
     def __repr__(self):
         c = self.__class__.__name__
-        i = list(self.items())
-        return '%s(%s)' % (c, i)
+        return '<%s of %d rows, %r>' % (c, self.n, self.shape)
+
+Sequence.register(FrozenRecordBatch)
+
+########################################
+#              Pickling                #
+########################################
+# A cached hash is only worth sending if the process loading it
+# would compute the same number.  Strings and bytes hash differently
+# under another PYTHONHASHSEED or word size, which _HASH_SEED
+# detects, and objects hashed by id never hash the same way twice.
+
+cdef Py_ssize_t _HASH_SEED = hash(u'frozen_dict')
+cdef frozenset _STABLE_TYPES = frozenset([
+    int, type(1 << 64), float, complex, bool, type(None),
+    str, bytes, type(u'')])
+
+cdef bint _stable_hash(FrozenDict frz):
+    # True if the hash of frz is built only from scalars
+    for k in frz:
+        if type(k) not in _STABLE_TYPES:
+            return False
+    for v in frz._itervalues():
+        if type(v) not in _STABLE_TYPES:
+            return False
+    return True
+
+def _rebuild(cls, keys, values, long long h=-1, seed=None):
+    ''' Unpickles a FrozenDict, or an instance of a subclass,
+        from the tuples made by __reduce__.  '''
+    cdef FrozenDict frz = cls.__new__(cls)
+    cdef OrderedMap om
+    if isinstance(keys, Shape):
+        frz.d = None
+        frz.keyshape = keys
+        frz.vals = values
+    elif isinstance(frz, OrderedMap):
+        om = frz
+        om.d = dict(zip(keys, values))
+        om.key_array = keys
+        om.value_array = values
+    elif keys:
+        frz._store(dict(zip(keys, values)))
+    else:
+        frz.d = _EMPTY
+    if seed == _HASH_SEED:
+        frz.h = h
+    return frz
+
+@cython.final
+cdef class InternTable:
+    ''' Weak-valued table of canonical FrozenDicts, keyed by hash.
+        Entries disappear once nothing else refers to them.  When the
+        table holds maxsize entries, the oldest one is dropped to make
+        room; that only costs a missed chance to share, never a wrong
+        answer.  A maxsize of 0 means the table is unbounded.
+
+        A FrozenDict is only ever swapped for one of the same class,
+        with the same keys and values down to their types, so values
+        that compare equal, such as 1, 1.0 and True, are kept apart.
+        OrderedMaps must also have their items in the same order.
+    '''
+    cdef object table
+    cdef object lock
+    cdef public Py_ssize_t maxsize
+    cdef readonly Py_ssize_t hits, misses, evictions
+
+    def __cinit__(self, Py_ssize_t maxsize=0):
+        self.table = WeakValueDictionary()
+        self.lock = Lock()
+        self.maxsize = maxsize
+
+    def __len__(self):
+        return len(self.table)
+
+    def __repr__(self):
+        c = self.__class__.__name__
+        return '%s(size=%d, maxsize=%d)' % (c, len(self), self.maxsize)
+
+    def intern(self, frz):
+        if not isinstance(frz, FrozenDict):
+            frz = FrozenDict(frz)
+        cdef Py_ssize_t h = hash(frz)
+        cdef Py_ssize_t n = 0
+        # The lookup and the insert must happen as one step, or two
+        # threads interning equal maps could both miss and each get
+        # back its own "canonical" instance.
+        with self.lock:
+            # Unequal FrozenDicts with the same hash
+            # take the next free number after it.
+            while True:
+                key = (h, n)
+                found = self.table.get(key)
+                if found is None:
+                    break
+                if found is frz or _same_typed(found, frz):
+                    self.hits += 1
+                    return found
+                n += 1
+            self.misses += 1
+            if self.maxsize and len(self.table) >= self.maxsize:
+                for oldest in self.table:
+                    break
+                else:
+                    oldest = None
+                if oldest is not None:
+                    self.table.pop(oldest, None)
+                    self.evictions += 1
+            self.table[key] = frz
+            return frz
+
+    def clear(self):
+        with self.lock:
+            self.table.clear()
+
+    def reset_stats(self):
+        with self.lock:
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        ''' Returns the size, bound and counters of the table.  '''
+        with self.lock:
+            total = self.hits + self.misses
+            return {
+                'size': len(self.table),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': (float(self.hits) / total) if total else 0.0,
+            }
+
+intern_table = InternTable()
+
+cdef bint _same_typed(x, y) except -1:
+    # x == y, with the types matching all the way down.  Equal
+    # hashable values can only differ in type inside FrozenDicts,
+    # tuples and frozensets, so only those are looked into.
+    if x is y:
+        return True
+    if type(x) is not type(y):
+        return False
+    if isinstance(x, OrderedMap):
+        # The order of the items counts as well
+        return _all_same_typed((<OrderedMap>x).key_array,
+                               (<OrderedMap>y).key_array) \
+            and _all_same_typed((<OrderedMap>x).value_array,
+                                (<OrderedMap>y).value_array)
+    if isinstance(x, FrozenDict):
+        if len(x) != len(y):
+            return False
+        return _same_typed_items((<FrozenDict>x)._iteritems(),
+                                 (<FrozenDict>y)._iteritems())
+    if type(x) is tuple:
+        return _all_same_typed(x, y)
+    if type(x) is frozenset:
+        if len(x) != len(y):
+            return False
+        return _same_typed_items([(e, None) for e in x],
+                                 [(e, None) for e in y])
+    return x == y
+
+cdef bint _all_same_typed(tuple x, tuple y) except -1:
+    if len(x) != len(y):
+        return False
+    for i in range(len(x)):
+        if not _same_typed(x[i], y[i]):
+            return False
+    return True
+
+cdef bint _same_typed_items(xs, ys) except -1:
+    # Pairs each key of xs with the equal key of ys, which need
+    # not be of the same type, and compares both halves strictly.
+    cdef dict index = {}
+    for k, v in ys:
+        index[k] = (k, v)
+    for k, v in xs:
+        pair = index.get(k)
+        if pair is None or not _same_typed(k, pair[0]) \
+                or not _same_typed(v, pair[1]):
+            return False
+    return True
+
+Mapping.register(FrozenDict)
+MutableMapping.register(Evolver)
+ValuesView.register(Values)
+ItemsView.register(Items)
+KeysView.register(Keys)
+
+cdef class OrderedMap(FrozenDict):
+    ''' A FrozenDict subclass where the item order is preserved.
+        The keys and values are also kept in two parallel tuples,
+        so items can be fetched by position as well as by key.'''
+    def __cinit__(self, iterable=(), **kw):
+        # Accepts a mapping or an iterable of (key, value) pairs.
+        # The pairs are read exactly once, so generators work too.
+        cdef OrderedMap other
+        if isinstance(iterable, OrderedMap) and not kw:
+            other = iterable
+            self.d = other.d
+            self.h = other.h
+            self.key_array = other.key_array
+            self.value_array = other.value_array
+            return
+        if isinstance(iterable, Mapping):
+            iterable = iterable.items()
+        cdef dict d = {}
+        cdef list keys = [], values = []
+        cdef bint repeated = False
+        for k, v in iterable:
+            if k in d:
+                repeated = True
+            else:
+                keys.append(k)
+                values.append(v)
+            d[k] = v
+        for k, v in kw.items():
+            if k in d:
+                repeated = True
+            else:
+                keys.append(k)
+                values.append(v)
+            d[k] = v
+        if repeated:
+            # A repeated key keeps its first place but its last value
+            values = [d[k] for k in keys]
+        self.d = d
+        self.key_array = tuple(keys)
+        self.value_array = tuple(values)
+
+    cdef _set_arrays(self, keys):
+        # Fill both tuples from the hidden dict in the given key order
+        cdef dict d = self.d
+        self.key_array = tuple(keys)
+        self.value_array = tuple([d[k] for k in self.key_array])
+
+    def __iter__(self):
+        return iter(self.key_array)
+
+    def __reversed__(self):
+        return reversed(self.key_array)
+
+    cdef object _itervalues(self):
+        return iter(self.value_array)
+
+    cdef object _iteritems(self):
+        return iter(zip(self.key_array, self.value_array))
+
+    def key_at(self, Py_ssize_t i):
+        ''' The key at position i.  Negative positions count
+            from the end, as they do for a tuple.'''
+        return self.key_array[i]
+
+    def value_at(self, Py_ssize_t i):
+        ''' The value at position i '''
+        return self.value_array[i]
+
+    def item_at(self, Py_ssize_t i):
+        ''' The (key, value) pair at position i '''
+        return (self.key_array[i], self.value_array[i])
+
+    def slice(self, start=None, stop=None):
+        ''' A new map of the same type holding the items from
+            position start up to, but not including, position stop.
+            Takes time proportional to the length of the slice.'''
+        cdef OrderedMap om = type(self).__new__(type(self))
+        om.key_array = self.key_array[start:stop]
+        om.value_array = self.value_array[start:stop]
+        om.d = dict(zip(om.key_array, om.value_array))
+        return om
+
+    cdef _adopt(self, dict d):
+        # The order is taken from iterating over d
+        self.d = d
+        self._set_arrays(d)
+
+    cdef FrozenDict _derive(self, dict d):
+        # Surviving keys keep their place, new keys go at the end.
+        cdef OrderedMap om = type(self).__new__(type(self))
+        order = [k for k in self.key_array if k in d]
+        order.extend([k for k in d if k not in self.d])
+        om.d = d
+        om._set_arrays(order)
+        return om
+        
+    def __repr__(self):
+        c = self.__class__.__name__
+        i = list(self.items())
+        return '%s(%s)' % (c, i)
+
+cdef class SortedFrozenMap(OrderedMap):
+    ''' An OrderedMap that keeps its keys in sorted order, whatever
+        order they were given in.  The keys must all be comparable
+        with each other.  Besides positional access it supports
+        range queries, which find their bounds by bisection.'''
+    def __cinit__(self, iterable=(), **kw):
+        # OrderedMap.__cinit__ has already run and kept the
+        # given order, unless it shared another sorted map.
+        if kw or not isinstance(iterable, SortedFrozenMap):
+            self._set_arrays(sorted(self.key_array))
+
+    cdef _adopt(self, dict d):
+        self.d = d
+        self._set_arrays(sorted(d))
+
+    cdef FrozenDict _derive(self, dict d):
+        cdef SortedFrozenMap sm = type(self).__new__(type(self))
+        sm.d = d
+        sm._set_arrays(sorted(d))
+        return sm
+
+    def rank(self, key):
+        ''' The number of keys less than key '''
+        return bisect_left(self.key_array, key)
+
+    def range(self, lo=None, hi=None):
+        ''' A new SortedFrozenMap holding the keys k where
+            lo <= k < hi.  Either bound may be None for no limit.'''
+        start = None if lo is None else bisect_left(self.key_array, lo)
+        stop = None if hi is None else bisect_left(self.key_array, hi)
+        return self.slice(start, stop)
+
+    def floor(self, key):
+        ''' The (key, value) pair with the greatest key that is not
+            greater than key.  Raises KeyError if there is none.'''
+        cdef Py_ssize_t i = bisect_right(self.key_array, key)
+        if i == 0:
+            raise KeyError(key)
+        return self.item_at(i - 1)
+
+    def ceiling(self, key):
+        ''' The (key, value) pair with the least key that is not
+            less than key.  Raises KeyError if there is none.'''
+        cdef Py_ssize_t i = bisect_left(self.key_array, key)
+        if i == len(self.key_array):
+            raise KeyError(key)
+        return self.item_at(i)
+
+########################################
+#             Freezing                 #
+########################################
+# freeze() walks the input with an explicit stack instead of
+# recursion, so the depth of the input is not limited by the
+# interpreter.  The kind of each object is looked up by its exact
+# type; only unknown types go through the slower generic checks.
+
+cdef enum:
+    _ATOM = 0       # hashable, returned as is
+    _MAPPING = 1    # any other mapping, becomes a FrozenDict
+    _FROZENDICT = 2 # kept if its values are already frozen
+    _LIST = 3       # always becomes a new tuple
+    _TUPLE = 4      # kept if its items are already frozen
+    _SET = 5        # always becomes a new frozenset
+    _FROZENSET = 6  # kept if its items are already frozen
+
+cdef dict _KINDS = {
+    dict: _MAPPING, FrozenDict: _FROZENDICT, LazyFrozenDict: _MAPPING,
+    list: _LIST, tuple: _TUPLE,
+    set: _SET, frozenset: _FROZENSET,
+    str: _ATOM, bytes: _ATOM, int: _ATOM, float: _ATOM,
+    complex: _ATOM, bool: _ATOM, type(None): _ATOM,
+    # unicode and long on Python 2
+    type(u''): _ATOM, type(1 << 64): _ATOM,
+}
+
+cdef int _generic_kind(obj) except -1:
+    try:
+        hash(obj)
+        return _ATOM
+    except TypeError:
+        pass
+    if isinstance(obj, Mapping):
+        return _MAPPING
+    if isinstance(obj, Set):
+        return _SET
+    # Mappings that are not registered with the ABC are known by
+    # what they do: they have keys(), or looking up the tuple of
+    # their own keys raises a KeyError, where a sequence would
+    # raise a TypeError or an IndexError.
+    cls = type(obj)
+    if hasattr(cls, '__getitem__'):
+        if hasattr(cls, 'keys'):
+            return _MAPPING
+        try:
+            obj[tuple(obj)]
+        except KeyError:
+            return _MAPPING
+        except (TypeError, IndexError):
+            pass
+    try:
+        iter(obj)
+    except TypeError:
+        msg = 'Unsupported type: %r' % type(obj).__name__
+        raise TypeError(msg)
+    # Sequences can be indexed, other iterables are unordered
+    if hasattr(type(obj), '__getitem__'):
+        return _LIST
+    return _SET
+
+@cython.final
+cdef class _FreezeFrame:
+    # One container whose children are being frozen
+    cdef object obj
+    cdef int kind
+    cdef list keys
+    cdef list children
+    cdef list out
+    cdef Py_ssize_t pos
+    cdef bint changed
+
+    cdef object finish(self):
+        cdef Py_ssize_t i
+        cdef dict d
+        if not self.changed:
+            if self.kind == _FROZENDICT or self.kind == _TUPLE \
+                    or self.kind == _FROZENSET:
+                return self.obj
+        if self.kind == _MAPPING or self.kind == _FROZENDICT:
+            d = {}
+            for i in range(len(self.keys)):
+                d[self.keys[i]] = self.out[i]
+            return FrozenDict.adopt(d)
+        if self.kind == _LIST or self.kind == _TUPLE:
+            return tuple(self.out)
+        return frozenset(self.out)
+
+cdef object _PENDING = object()
+
+cdef object _freeze_enter(obj, list stack, dict memo, set active):
+    # Returns the frozen form of obj when that needs no further
+    # work, otherwise pushes a frame for it and returns _PENDING.
+    kind = _KINDS.get(type(obj))
+    cdef int k = _generic_kind(obj) if kind is None else kind
+    if k == _ATOM:
+        return obj
+    cdef Py_ssize_t oid = id(obj)
+    if oid in memo:
+        return memo[oid]
+    if oid in active:
+        raise ValueError('Cannot freeze a structure that contains itself')
+    cdef _FreezeFrame frame = _FreezeFrame.__new__(_FreezeFrame)
+    frame.obj = obj
+    frame.kind = k
+    if k == _MAPPING or k == _FROZENDICT:
+        frame.keys = list(obj)
+        frame.children = [obj[key] for key in frame.keys]
+    else:
+        frame.children = list(obj)
+    frame.out = []
+    frame.pos = 0
+    frame.changed = False
+    active.add(oid)
+    stack.append(frame)
+    return _PENDING
+
+cdef object _freeze_intern(obj, dict interned):
+    if isinstance(obj, FrozenDict):
+        return intern_table.intern(obj)
+    if type(obj) is tuple or type(obj) is frozenset:
+        return interned.setdefault(obj, obj)
+    return obj
+
+def freeze(obj, bint intern=False):
+    ''' Turns dictionaries into FrozenDict objects, lists into
+        tuples, and sets into frozensets, all the way down.
+
+        Can also be used to turn JSON data into a hashable value.
+        Sub-objects that appear more than once are frozen once,
+        and a structure that contains itself raises a ValueError.
+
+        With intern=True every FrozenDict is passed through
+        FrozenDict.intern, so equal payloads share one object.
+        Tuples and frozensets cannot be weakly referenced, so they
+        are only shared within a single call to freeze.
+    '''
+    cdef double start
+    if not _observed:
+        return _freeze(obj, intern)
+    start = _timer()
+    result = _freeze(obj, intern)
+    _observe('freeze', start, obj)
+    return result
+
+cdef object _freeze(obj, bint intern):
+    cdef list stack = []
+    cdef dict memo = {}
+    cdef set active = set()
+    cdef dict interned = {} if intern else None
+    cdef _FreezeFrame frame
+    result = _freeze_enter(obj, stack, memo, active)
+    if result is not _PENDING:
+        # An atom, with nothing inside to walk
+        if interned is not None:
+            result = _freeze_intern(result, interned)
+        return result
+    while stack:
+        if result is _PENDING:
+            frame = stack[-1]
+        else:
+            # Hand a finished child to the frame waiting for it
+            frame = stack[-1]
+            if result is not frame.children[frame.pos]:
+                frame.changed = True
+            frame.out.append(result)
+            frame.pos += 1
+        if frame.pos < len(frame.children):
+            result = _freeze_enter(frame.children[frame.pos],
+                                   stack, memo, active)
+            continue
+        stack.pop()
+        result = frame.finish()
+        if interned is not None:
+            result = _freeze_intern(result, interned)
+        memo[id(frame.obj)] = result
+        active.discard(id(frame.obj))
+    return result
+
+def freeze_many(objs, workers=None):
+    ''' Returns [freeze(obj) for obj in objs], spreading the work
+        over several workers, os.cpu_count() of them by default.
+
+        A free-threaded interpreter runs the workers as threads.
+        With the GIL, threads would take turns, so the work goes to
+        a pool of processes instead, and the objects and their frozen
+        copies are pickled on the way.  That only pays off for large
+        payloads, and on platforms that spawn processes the calling
+        script needs an if __name__ == '__main__' guard.
+    '''
+    objs = list(objs)
+    if workers is None:
+        workers = cpu_count() or 1
+    workers = min(workers, len(objs))
+    if workers <= 1:
+        return [freeze(obj) for obj in objs]
+    try:
+        from concurrent.futures import ThreadPoolExecutor, \
+            ProcessPoolExecutor
+    except ImportError:
+        return [freeze(obj) for obj in objs]
+    if _free_threaded():
+        with ThreadPoolExecutor(workers) as pool:
+            return list(pool.map(freeze, objs))
+    # Several objects per message, to keep the pickling overhead down
+    chunksize = max(1, len(objs) // (workers * 4))
+    with ProcessPoolExecutor(workers) as pool:
+        return list(pool.map(freeze, objs, chunksize=chunksize))
+
+cdef bint _free_threaded():
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+########################################
+#           Lazy Freezing              #
+########################################
+# lazy_freeze() copies one level of the input at a time, when that
+# level is first read.  Mappings become LazyFrozenDicts, lists
+# and tuples become tuples of lazily frozen items, and anything
+# else, sets included, is frozen on the spot.
+
+def lazy_freeze(obj):
+    ''' Like freeze, but a mapping comes back as a LazyFrozenDict,
+        which freezes each of its values only when it is first read.
+        Reading a few fields of a large document then costs about
+        as much as the fields read, instead of the whole document.
+
+        lazy_freeze takes ownership of obj, the way FrozenDict.adopt
+        does.  The top level is copied straight away, but the others
+        only when they are first read, so the caller must not change
+        anything inside obj afterwards.
+    '''
+    if _KINDS.get(type(obj)) == _MAPPING and type(obj) is not LazyFrozenDict:
+        return LazyFrozenDict(obj)
+    return _lazy(obj)
+
+cdef object _lazy(obj):
+    cdef LazyFrozenDict lazy
+    kind = _KINDS.get(type(obj))
+    cdef int k = _generic_kind(obj) if kind is None else kind
+    if k == _ATOM:
+        return obj
+    if type(obj) is LazyFrozenDict:
+        return obj
+    if k == _MAPPING:
+        lazy = LazyFrozenDict.__new__(LazyFrozenDict)
+        lazy.src = obj
+        return lazy
+    if k == _LIST or k == _TUPLE:
+        return tuple([_lazy(x) for x in obj])
+    return _freeze(obj, False)
+
+cdef object _force(value):
+    # The fully frozen form of a value handed out by _lazy
+    cdef LazyFrozenDict lazy
+    if type(value) is LazyFrozenDict:
+        lazy = value
+        if lazy.raw is None and lazy.full is None:
+            # Never read, so the input can be frozen in one go
+            lazy.full = _freeze(lazy.src, False)
+        return lazy.materialize()
+    if type(value) is tuple:
+        return tuple([_force(x) for x in <tuple>value])
+    return value
+
+# A LazyFrozenDict only refers to the input it owns, which never
+# refers back to it, and to LazyFrozenDicts made after it, so it
+# cannot be part of a cycle.  Leaving it out of the collector keeps
+# reading a long list, which makes one per item, from setting off
+# collections that would look through the whole input.
+@cython.final
+@cython.no_gc
+cdef class LazyFrozenDict:
+    ''' A read-only mapping made by lazy_freeze, which holds a
+        shallow copy of one mapping and freezes each value the first
+        time it is read.  The value is kept, so reading it again
+        returns the same object.
+
+        It compares equal to a FrozenDict with the same items, and
+        comparing reads only as far as it needs to.  Hashing builds
+        the whole FrozenDict, once, as do materialize(), repr and
+        pickling, which stores the FrozenDict.
+    '''
+    # The input, its copy once made, the values frozen so far,
+    # and the FrozenDict once everything has been frozen
+    cdef object src
+    cdef dict raw
+    cdef dict done
+    cdef FrozenDict full
+
+    def __cinit__(self, *args):
+        # LazyFrozenDict(mapping) copies mapping straight away.
+        # _lazy makes them without, to be copied on first use.
+        # done is made here once, never replaced, so that a value
+        # one thread has handed out is the one every thread sees.
+        self.done = {}
+        if args:
+            self.raw = dict(*args)
+
+    cdef dict _raw(self):
+        cdef dict raw = self.raw
+        if raw is None:
+            # Racing threads copy the same unchanged input
+            raw = {} if self.src is None else dict(self.src)
+            self.raw = raw
+        return raw
+
+    def __len__(self):
+        return len(self._raw())
+
+    def __iter__(self):
+        return iter(self._raw())
+
+    def __contains__(self, key):
+        return (key in self._raw())
+
+    def __getitem__(self, key):
+        cdef dict raw = self._raw()
+        value = self.done.get(key, _MISSING)
+        if value is _MISSING:
+            value = _lazy(raw[key])
+            # Another thread may have got there first
+            value = self.done.setdefault(key, value)
+        return value
+
+    def get(self, key, default=None):
+        if key in self._raw():
+            return self[key]
+        return default
+
+    def keys(self):
+        return KeysView(self)
+
+    def values(self):
+        return ValuesView(self)
+
+    def items(self):
+        return ItemsView(self)
+
+    def materialize(self):
+        ''' Returns the FrozenDict that freeze would have made.
+            Values read already are reused, and the rest are frozen
+            in one pass.  '''
+        cdef dict d
+        if self.full is None:
+            d = {}
+            for k, v in self._raw().items():
+                found = self.done.get(k, _MISSING)
+                d[k] = _freeze(v, False) if found is _MISSING \
+                    else _force(found)
+            self.full = FrozenDict.adopt(d)
+        return self.full
+
+    def __hash__(self):
+        return hash(self.materialize())
+
+    def __richcmp__(self, other, int flag):
+        if flag != 2 and flag != 3:
+            return NotImplemented
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        if self.full is not None:
+            equal = (self.full == other)
+        else:
+            equal = self is other or \
+                (len(other) == len(self._raw()) and _within(other, self))
+        return equal if flag == 2 else not equal
+
+    def __reduce__(self):
+        return self.materialize().__reduce__()
+
+    def __repr__(self):
+        c = self.__class__.__name__
+        return '%s(%r)' % (c, (<FrozenDict>self.materialize())._dict())
+
+Mapping.register(LazyFrozenDict)
+
+########################################
+#              Thawing                 #
+########################################
+
+cdef object _thaw_enter(obj, int level, int depth, list stack, dict memo):
+    # Returns the thawed form of obj.  Containers come back empty
+    # and are queued on the stack to have their contents filled in.
+    cdef type t = type(obj)
+    if depth >= 0 and level > depth:
+        return obj
+    if t is not tuple and t is not frozenset \
+            and not isinstance(obj, FrozenDict):
+        return obj
+    cdef Py_ssize_t oid = id(obj)
+    if oid in memo:
+        return memo[oid]
+    if t is frozenset:
+        # Set members must stay hashable, so they stay frozen
+        out = set(obj)
+    elif t is tuple:
+        out = list(obj)
+        stack.append((out, obj, level))
+    else:
+        out = {}
+        stack.append((out, obj, level))
+    # Empty containers are cheap, and are never shared
+    if obj:
+        memo[oid] = out
+    return out
+
+def thaw(obj, depth=None):
+    ''' The inverse of freeze.  FrozenDicts become dictionaries,
+        tuples become lists and frozensets become sets.  Dictionary
+        keys and set members stay as they are, since they must be
+        hashable.
+
+        With depth=N only the top N levels are thawed, and anything
+        below is left frozen.  depth=1 thaws just obj itself.
+
+        Like copy.deepcopy, a non-empty object that appears more
+        than once in the input comes out as one shared object.
+    '''
+    cdef int limit = -1 if depth is None else depth
+    cdef list stack = []
+    cdef dict memo = {}
+    cdef dict out
+    cdef list seq
+    cdef FrozenDict frz
+    cdef Py_ssize_t i, pos
+    cdef PyObject *k
+    cdef PyObject *v
+    if limit == 0:
+        return obj
+    if type(obj) is LazyFrozenDict:
+        obj = (<LazyFrozenDict>obj).materialize()
+    result = _thaw_enter(obj, 1, limit, stack, memo)
+    while stack:
+        target, src, level = stack.pop()
+        level += 1
+        if type(target) is list:
+            # Already a copy of the tuple, thawed in place
+            seq = target
+            for i in range(len(seq)):
+                seq[i] = _thaw_enter(seq[i], level, limit, stack, memo)
+            continue
+        out = target
+        frz = src
+        frz._flatten()
+        if type(frz) is FrozenDict and frz.d is None:
+            keys = frz._key_tuple()
+            vals = frz._value_tuple()
+            for i in range(len(keys)):
+                out[keys[i]] = _thaw_enter(
+                    vals[i], level, limit, stack, memo)
+        elif type(frz) is FrozenDict:
+            # Walk the hidden dictionary directly
+            pos = 0
+            while PyDict_Next(frz.d, &pos, &k, &v):
+                out[<object>k] = _thaw_enter(
+                    <object>v, level, limit, stack, memo)
+        else:
+            for key in frz:
+                out[key] = _thaw_enter(frz[key], level, limit, stack, memo)
+    return result
+
+########################################
+#                JSON                  #
+########################################
+# The json module builds every JSON object by handing its list of
+# pairs to object_pairs_hook, innermost first.  frozen_pairs turns
+# them straight into FrozenDicts, so no dict tree is built and then
+# walked again by freeze().  Arrays arrive as lists; each is turned
+# into a tuple by the object that holds it, or by frozen_json for an
+# array at the top level.
+
+cdef tuple _json_tuple(list items):
+    cdef Py_ssize_t i
+    for i in range(len(items)):
+        if type(items[i]) is list:
+            items[i] = _json_tuple(<list>items[i])
+    return tuple(items)
+
+def json_value(value):
+    ''' Turns the lists in a decoded JSON value into tuples.  Only
+        needed for a value that did not come through frozen_pairs.'''
+    if type(value) is list:
+        return _json_tuple(<list>value)
+    return value
+
+def frozen_pairs(list pairs):
+    ''' An object_pairs_hook for json.loads that makes a FrozenDict
+        of each JSON object, with its arrays turned into tuples.
+        Repeated keys keep their last value, as with a dict.  '''
+    cdef dict d = {}
+    cdef FrozenDict frz
+    for k, v in pairs:
+        if type(v) is list:
+            v = _json_tuple(<list>v)
+        d[k] = v
+    frz = FrozenDict.__new__(FrozenDict)
+    frz._adopt(d)
+    return frz
+
+########################################
+#             Memoization              #
+########################################
+# Cached results sit in a circular doubly linked list, most
+# recently used first, so a hit moves its entry to the front and
+# the least recently used entry is the one just before the root.
+
+# Separates the positional arguments from the keyword arguments
+# in a cache key.  Nobody else can pass this object in.
+cdef object _KWMARK = object()
+# Marks an argument that was frozen to make the key hashable
+cdef object _FROZEN = object()
+
+@cython.final
+cdef class _Link:
+    cdef _Link prev
+    cdef _Link next
+    cdef object key
+    cdef object result
+    cdef double expires
+
+@cython.final
+cdef class _InFlight:
+    # A call that one thread is running and others may wait on
+    cdef object owner
+    cdef object event
+    cdef object result
+    cdef object error
+
+cdef object _make_key(tuple args, dict kw, bint typed):
+    cdef tuple types = ()
+    if typed:
+        types = tuple([type(a) for a in args])
+        if kw:
+            # By name, as the order of the keywords does not count
+            types += (frozendict_adopt(
+                dict([(k, type(v)) for k, v in kw.items()])),)
+    try:
+        return _hashed_key(args, kw, types)
+    except TypeError:
+        pass
+    # Unhashable arguments are frozen.  freeze() leaves anything
+    # it cannot convert alone, so this can still raise.
+    return _hashed_key(tuple([_frozen_arg(a) for a in args]),
+                       dict([(k, _frozen_arg(v)) for k, v in kw.items()]),
+                       types)
+
+cdef tuple _hashed_key(tuple args, dict kw, tuple types):
+    cdef tuple key = args
+    if kw:
+        # The keyword dict is new on every call, so it is adopted
+        # rather than copied.
+        key = args + (_KWMARK, frozendict_adopt(kw))
+    key += types
+    hash(key)
+    return key
+
+cdef object _frozen_arg(a):
+    # A frozen copy of an unhashable argument, tagged with its type,
+    # so that it never matches an argument that was hashable as it
+    # was passed: f([1, 2]) and f((1, 2)) are cached apart.
+    try:
+        hash(a)
+        return a
+    except TypeError:
+        return (_FROZEN, type(a), freeze(a))
+
+@cython.final
+cdef class Memoized:
+    ''' A function wrapped by memoize().  Results are cached by
+        argument; a result older than ttl seconds is recomputed and
+        at most maxsize results are kept, dropping the least recently
+        used.  When several threads ask for the same missing result
+        at once, the function runs only in the first of them and the
+        others wait for its answer.  Exceptions are not cached.
+    '''
+    cdef object func
+    cdef object lock
+    cdef dict cache
+    cdef dict pending
+    cdef _Link root
+    cdef readonly object maxsize
+    cdef readonly object ttl
+    cdef bint typed
+    cdef readonly Py_ssize_t hits, misses, evictions
+    cdef dict __dict__
+
+    def __cinit__(self, func, maxsize=128, ttl=None, bint typed=False):
+        if not callable(func):
+            raise TypeError('memoize() needs a callable, not %r' % (func,))
+        if maxsize is not None and maxsize < 0:
+            maxsize = 0
+        self.func = func
+        self.lock = Lock()
+        self.cache = {}
+        self.pending = {}
+        self.root = _Link()
+        self.root.prev = self.root.next = self.root
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.typed = typed
+        update_wrapper(self, func)
+
+    def __len__(self):
+        return len(self.cache)
+
+    def __repr__(self):
+        return '<memoized %r>' % (self.func,)
+
+    def __get__(self, obj, objtype):
+        # Behave like a plain function when used as a method
+        if obj is None:
+            return self
+        return MethodType(self, obj)
+
+    cdef void _unlink(self, _Link link):
+        link.prev.next = link.next
+        link.next.prev = link.prev
+
+    cdef void _push_front(self, _Link link):
+        cdef _Link root = self.root
+        link.prev = root
+        link.next = root.next
+        root.next.prev = link
+        root.next = link
+
+    cdef _store(self, key, result):
+        # Called with the lock held
+        cdef _Link link
+        if self.maxsize == 0:
+            return
+        link = _Link()
+        link.key = key
+        link.result = result
+        if self.ttl is not None:
+            link.expires = _clock() + self.ttl
+        old = self.cache.get(key)
+        if old is not None:
+            self._unlink(<_Link>old)
+        self.cache[key] = link
+        self._push_front(link)
+        if self.maxsize is not None and len(self.cache) > self.maxsize:
+            link = self.root.prev
+            self._unlink(link)
+            del self.cache[link.key]
+            self.evictions += 1
+
+    def __call__(self, *args, **kw):
+        cdef _Link link
+        cdef _InFlight flight
+        key = _make_key(args, kw, self.typed)
+        with self.lock:
+            found = self.cache.get(key)
+            if found is not None:
+                link = found
+                if self.ttl is None or link.expires > _clock():
+                    self.hits += 1
+                    self._unlink(link)
+                    self._push_front(link)
+                    return link.result
+                # Expired
+                self._unlink(link)
+                del self.cache[key]
+                self.evictions += 1
+            found = self.pending.get(key)
+            if found is None:
+                self.misses += 1
+                flight = _InFlight()
+                flight.owner = get_ident()
+                self.pending[key] = flight
+            else:
+                flight = found
+                if flight.owner == get_ident():
+                    # A recursive call for the same arguments
+                    # would wait on itself forever.
+                    flight = None
+                else:
+                    self.hits += 1
+                    if flight.event is None:
+                        flight.event = Event()
+                    event = flight.event
+        if flight is None:
+            return self.func(*args, **kw)
+        if found is not None:
+            event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+        try:
+            result = self.func(*args, **kw)
+        except BaseException as e:
+            with self.lock:
+                del self.pending[key]
+                flight.error = e
+                event = flight.event
+            if event is not None:
+                event.set()
+            raise
+        with self.lock:
+            del self.pending[key]
+            self._store(key, result)
+            flight.result = result
+            event = flight.event
+        if event is not None:
+            event.set()
+        return result
+
+    def clear(self):
+        ''' Drops every cached result '''
+        with self.lock:
+            self.cache.clear()
+            self.root.prev = self.root.next = self.root
+
+    def reset_stats(self):
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        ''' Returns the size, bounds and counters of the cache.  '''
+        total = self.hits + self.misses
+        return {
+            'size': len(self.cache),
+            'maxsize': self.maxsize,
+            'ttl': self.ttl,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': (float(self.hits) / total) if total else 0.0,
+        }
+
+def memoize(maxsize=128, ttl=None, typed=False):
+    ''' Decorator that caches a function's results by argument.
+        Keyword arguments are keyed with a FrozenDict, and unhashable
+        arguments such as lists and dicts are keyed by their freeze().
+
+        maxsize=None keeps every result, and maxsize=0 caches nothing.
+        ttl is a number of seconds after which a result is recomputed.
+        With typed=True, arguments of different types such as 1 and
+        1.0 are cached separately.  May be used without parentheses.
+    '''
+    if callable(maxsize):
+        return Memoized(maxsize)
+    def decorator(func):
+        return Memoized(func, maxsize, ttl, typed)
+    return decorator
+
+########################################
+#              Snapshots               #
+########################################
+# A snapshot file is an open-addressed hash table that is read in
+# place through mmap, so opening one reads nothing but the header
+# and every process that opens it shares the same page cache.
+#
+#   header   magic, entry count, slot count, slot and data offsets
+#   slots    per slot: 64-bit key hash, then the entry's file offset,
+#            or 0 for an empty slot.  Linear probing, at most half full.
+#   data     per entry, in the order of the map:
+#            key length, key, value length, value
+#
+# All integers are little endian.  A key or value is one tag byte and
+# its payload, and its length counts both.  Keys are hashed with
+# 64-bit FNV-1a over those bytes, which gives the same answer in
+# every process, unlike hash().
+
+cdef bytes _SNAP_MAGIC = b'FRZSNAP1'
+cdef enum:
+    _SNAP_HEADER = 48
+    _SNAP_SLOT = 16
+    _TAG_NONE = 0
+    _TAG_FALSE = 1
+    _TAG_TRUE = 2
+    _TAG_INT = 3
+    _TAG_FLOAT = 4
+    _TAG_STR = 5
+    _TAG_BYTES = 6
+
+cdef inline unsigned long long _read_u64(const unsigned char *p) noexcept nogil:
+    cdef unsigned long long x = 0
+    cdef int i
+    for i in range(7, -1, -1):
+        x = (x << 8) | p[i]
+    return x
+
+cdef inline unsigned int _read_u32(const unsigned char *p) noexcept nogil:
+    return p[0] | (p[1] << 8) | (p[2] << 16) | (<unsigned int>p[3] << 24)
+
+cdef inline void _write_u64(unsigned char *p, unsigned long long x) noexcept nogil:
+    cdef int i
+    for i in range(8):
+        p[i] = x & 0xff
+        x >>= 8
+
+cdef unsigned long long _FNV_OFFSET = 14695981039346656037ULL
+
+cdef inline unsigned long long _fnv1a(unsigned long long h,
+                                      const unsigned char *p,
+                                      Py_ssize_t n) noexcept nogil:
+    cdef Py_ssize_t i
+    for i in range(n):
+        h = (h ^ p[i]) * 1099511628211ULL
+    return h
+
+cdef bytes _snap_payload(obj, bint key, unsigned char *tag):
+    # Sets the tag and returns the payload, or returns None if obj
+    # cannot be stored.  Keys that compare equal must encode the same
+    # way, so a bool key is stored as the int it equals.  Floats are
+    # only looked up, never stored, as keys.
+    cdef unsigned char buf[8]
+    cdef double f
+    cdef unsigned long long bits
+    if type(obj) is type(u''):
+        tag[0] = _TAG_STR
+        return (<unicode>obj).encode('utf-8')
+    if isinstance(obj, bool):
+        if key:
+            tag[0] = _TAG_INT
+            return b'1' if obj else b'0'
+        tag[0] = _TAG_TRUE if obj else _TAG_FALSE
+        return b''
+    if isinstance(obj, (int, type(1 << 64))):
+        tag[0] = _TAG_INT
+        return str(int(obj)).encode('ascii')
+    if isinstance(obj, bytes):
+        tag[0] = _TAG_BYTES
+        return bytes(obj)
+    if isinstance(obj, type(u'')):
+        tag[0] = _TAG_STR
+        return obj.encode('utf-8')
+    if key:
+        # Only a float equal to an int can match a stored key
+        if isinstance(obj, float) and obj.is_integer():
+            return _snap_payload(int(obj), True, tag)
+        return None
+    if obj is None:
+        tag[0] = _TAG_NONE
+        return b''
+    if isinstance(obj, float):
+        f = obj
+        memcpy(&bits, &f, 8)
+        _write_u64(buf, bits)
+        tag[0] = _TAG_FLOAT
+        return (<char*>buf)[:8]
+    return None
+
+cdef inline unsigned long long _snap_hash(unsigned char tag, bytes payload):
+    cdef unsigned long long h = _fnv1a(_FNV_OFFSET, &tag, 1)
+    return _fnv1a(h, payload, len(payload))
+
+cdef object _snap_decode(const unsigned char *p, Py_ssize_t n):
+    cdef unsigned long long bits
+    cdef double f
+    cdef unsigned char tag = p[0]
+    if tag == _TAG_STR:
+        return (<const char*>p)[1:n].decode('utf-8')
+    if tag == _TAG_INT:
+        return int((<const char*>p)[1:n])
+    if tag == _TAG_BYTES:
+        return (<const char*>p)[1:n]
+    if tag == _TAG_FLOAT:
+        bits = _read_u64(p + 1)
+        memcpy(&f, &bits, 8)
+        return f
+    if tag == _TAG_NONE:
+        return None
+    return tag == _TAG_TRUE
+
+def _dump_snapshot(mapping, path):
+    cdef Py_ssize_t n = len(mapping)
+    cdef Py_ssize_t nslots = 8
+    while nslots < 2 * n:
+        nslots *= 2
+    # The file is written under a new name and then moved over path,
+    # so that a failure part way leaves any old snapshot untouched.
+    f, temp = _create_beside(path)
+    try:
+        with f:
+            _write_snapshot(f, mapping, n, nslots)
+        _replace(temp, path)
+    except BaseException:
+        try:
+            os.remove(temp)
+        except OSError:
+            pass
+        raise
+
+cdef _write_snapshot(f, mapping, Py_ssize_t n, Py_ssize_t nslots):
+    cdef Py_ssize_t mask = nslots - 1, i
+    cdef unsigned long long h
+    cdef unsigned long long offset = _SNAP_HEADER + nslots * _SNAP_SLOT
+    cdef bytearray slots = bytearray(nslots * _SNAP_SLOT)
+    cdef unsigned char *s = slots
+    cdef unsigned char ktag, vtag
+    f.seek(offset)
+    for k in mapping:
+        v = mapping[k]
+        kb = _snap_payload(k, True, &ktag)
+        vb = _snap_payload(v, False, &vtag)
+        if kb is None or vb is None:
+            raise TypeError('cannot store %r: %r in a snapshot'
+                            % (k, v))
+        h = _snap_hash(ktag, kb)
+        i = h & mask
+        while _read_u64(s + i * _SNAP_SLOT + 8):
+            i = (i + 1) & mask
+        _write_u64(s + i * _SNAP_SLOT, h)
+        _write_u64(s + i * _SNAP_SLOT + 8, offset)
+        entry = (pack('<IB', len(kb) + 1, ktag) + kb
+                 + pack('<IB', len(vb) + 1, vtag) + vb)
+        f.write(entry)
+        offset += len(entry)
+    f.seek(0)
+    # The last header field is reserved
+    f.write(_SNAP_MAGIC + pack('<QQQQQ', n, nslots, _SNAP_HEADER,
+                               _SNAP_HEADER + nslots * _SNAP_SLOT, 0))
+    f.write(slots)
+
+_replace = getattr(os, 'replace', os.rename)
+
+cdef tuple _create_beside(path):
+    # A new file for writing, in the same directory as path, with
+    # the permissions any new file there would get.
+    if hasattr(os, 'fspath'):
+        path = os.fspath(path)
+    cdef Py_ssize_t n = 0
+    while True:
+        suffix = '.%d-%d-%d.tmp' % (os.getpid(), get_ident(), n)
+        temp = path + (suffix.encode() if isinstance(path, bytes)
+                       else suffix)
+        try:
+            fd = os.open(temp, os.O_WRONLY | os.O_CREAT | os.O_EXCL
+                         | getattr(os, 'O_BINARY', 0), 0o666)
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+            n += 1
+            continue
+        return os.fdopen(fd, 'wb'), temp
+
+@cython.final
+cdef class Snapshot:
+    ''' A read-only mapping over a file written by
+        FrozenDict.dump_snapshot.  The file is memory mapped, and
+        keys and values are decoded only when they are looked up.
+        It compares and hashes like a FrozenDict with the same items.
+
+        Close it with close() or a with block when done.  Pickling a
+        Snapshot only sends its path, which suits worker processes.
+    '''
+    cdef readonly object path
+    cdef object file
+    cdef object mm
+    cdef const unsigned char[:] buf
+    cdef Py_ssize_t n, mask, data
+    cdef long long h
+
+    def __cinit__(self, path):
+        self.h = -1
+        self.path = path
+        self.file = open(path, 'rb')
+        try:
+            self.mm = mmap(self.file.fileno(), 0, access=ACCESS_READ)
+        except BaseException:
+            self.file.close()
+            raise
+        self.buf = self.mm
+        if len(self.mm) < _SNAP_HEADER or \
+                self.mm[:8] != _SNAP_MAGIC:
+            self.close()
+            raise ValueError('%r is not a FrozenDict snapshot' % (path,))
+        self.n = _read_u64(&self.buf[8])
+        self.mask = _read_u64(&self.buf[16]) - 1
+        self.data = _read_u64(&self.buf[32])
+
+    def close(self):
+        self.buf = None
+        if self.mm is not None:
+            self.mm.close()
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __reduce__(self):
+        return (Snapshot, (self.path,))
+
+    cdef const unsigned char *_ptr(self) except NULL:
+        if self.buf is None:
+            raise ValueError('snapshot %r is closed' % (self.path,))
+        return &self.buf[0]
+
+    cdef Py_ssize_t _find(self, key) except -2:
+        # The file offset of key's entry, or -1 if it is not there
+        cdef const unsigned char *p = self._ptr()
+        cdef const unsigned char *slot
+        cdef unsigned long long h, offset
+        cdef Py_ssize_t i
+        cdef unsigned char tag
+        kb = _snap_payload(key, True, &tag)
+        if kb is None:
+            return -1
+        cdef const unsigned char *k = kb
+        cdef Py_ssize_t klen = len(kb)
+        h = _snap_hash(tag, kb)
+        i = h & self.mask
+        while True:
+            slot = p + _SNAP_HEADER + i * _SNAP_SLOT
+            offset = _read_u64(slot + 8)
+            if offset == 0:
+                return -1
+            if _read_u64(slot) == h and _read_u32(p + offset) == klen + 1 \
+                    and p[offset + 4] == tag \
+                    and memcmp(p + offset + 5, k, klen) == 0:
+                return offset
+            i = (i + 1) & self.mask
+
+    cdef object _value_at(self, Py_ssize_t offset):
+        cdef const unsigned char *p = self._ptr() + offset
+        p += 4 + _read_u32(p)
+        return _snap_decode(p + 4, _read_u32(p))
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, key):
+        cdef Py_ssize_t offset = self._find(key)
+        if offset == -1:
+            raise KeyError(key)
+        return self._value_at(offset)
+
+    def __contains__(self, key):
+        return self._find(key) != -1
+
+    def get(self, key, default=None):
+        cdef Py_ssize_t offset = self._find(key)
+        if offset == -1:
+            return default
+        return self._value_at(offset)
+
+    def _entries(self):
+        # (key, value) pairs in file order
+        cdef const unsigned char *p = self._ptr()
+        cdef Py_ssize_t offset = self.data
+        cdef Py_ssize_t i, klen, vlen
+        for i in range(self.n):
+            p = self._ptr()
+            klen = _read_u32(p + offset)
+            vlen = _read_u32(p + offset + 4 + klen)
+            yield (_snap_decode(p + offset + 4, klen),
+                   _snap_decode(p + offset + 8 + klen, vlen))
+            offset += 8 + klen + vlen
+
+    def __iter__(self):
+        for k, v in self._entries():
+            yield k
+
+    def keys(self):
+        return KeysView(self)
+
+    def values(self):
+        return ValuesView(self)
+
+    def items(self):
+        return ItemsView(self)
+
+    def __hash__(self):
+        # The same combination FrozenDict uses
+        cdef hash_acc acc = 0
+        cdef long long h = _load_hash(&self.h)
+        if h == -1:
+            for k, v in self._entries():
+                acc ^= _entry_hash(k, v)
+            h = _finish_hash(acc, self.n)
+            _store_hash(&self.h, h)
+        return h
+
+    def __richcmp__(self, other, int flag):
+        if flag != 2 and flag != 3:
+            return NotImplemented
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        equal = self is other or \
+            (len(other) == self.n and _within(other, self))
+        return equal if flag == 2 else not equal
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, self.path)
+
+Mapping.register(Snapshot)
+
+########################################
+#             Static Maps              #
+########################################
+# compile() builds a minimal perfect hash in the style of CHD
+# (compress, hash and displace).  Keys are spread over buckets of
+# about three, and each bucket gets a seed, found by trial, that
+# sends all of its keys to slots nobody else has taken.  A lookup
+# then hashes the key, reads its bucket's seed and checks the one
+# slot that gives, so there are no collision chains to follow.
+
+cdef inline hash_acc _fmix(hash_acc x) noexcept nogil:
+    # The 64-bit finaliser of MurmurHash3
+    x ^= x >> 33
+    x *= 0xff51afd7ed558ccdULL
+    x ^= x >> 33
+    x *= 0xc4ceb9fe1a85ec53ULL
+    x ^= x >> 33
+    return x
+
+cdef inline Py_ssize_t _scale(hash_acc x, Py_ssize_t n) noexcept nogil:
+    # Maps x onto range(n) with a multiply instead of a division
+    return <Py_ssize_t>(((x >> 32) * <hash_acc>n) >> 32)
+
+cdef inline Py_ssize_t _chd_slot(hash_acc h, unsigned int seed,
+                                 Py_ssize_t n) noexcept nogil:
+    return _scale(_fmix(h ^ (seed * 0x9e3779b97f4a7c15ULL)), n)
+
+cdef struct _chd_entry:
+    # One slot: the hash of its key, and where the key is in keys_
+    hash_acc h
+    Py_ssize_t pos
+
+cdef bint _chd_fits(const hash_acc *hashes, Py_ssize_t size,
+                    unsigned int seed, Py_ssize_t n,
+                    const char *taken, Py_ssize_t *slots) noexcept nogil:
+    # True if seed sends every hash to a different free slot,
+    # which are left in slots
+    cdef Py_ssize_t j, k
+    for j in range(size):
+        slots[j] = _chd_slot(hashes[j], seed, n)
+        if taken[slots[j]]:
+            return False
+        for k in range(j):
+            if slots[k] == slots[j]:
+                return False
+    return True
+
+@cython.final
+cdef class StaticFrozenDict:
+    ''' A lookup-only mapping, built once by FrozenDict.compile()
+        or from the same arguments as a dict.  Every key has a slot
+        of its own, found with a single probe, and the table holds
+        exactly one slot per key.  Building it takes longer than a
+        FrozenDict, so it suits tables that are made once and read
+        many times.  It compares and hashes like a FrozenDict, and
+        iterates in the order the items were given.
+    '''
+    cdef tuple keys_
+    cdef tuple values_
+    cdef Py_ssize_t n, nbuckets
+    cdef unsigned int *seeds
+    cdef _chd_entry *slots
+    # Keys whose hash() equals that of an earlier key can never be
+    # told apart by a seed, so they are looked up here instead.
+    cdef dict overflow
+    cdef long long h
+
+    def __cinit__(self, *args, **kw):
+        self.h = -1
+        if _stats_enabled:
+            _counters.created += 1
+        cdef dict d = dict(*args, **kw)
+        if len(d) >= 0xffffffff:
+            raise OverflowError('too many keys for a StaticFrozenDict')
+        self.keys_ = tuple(d)
+        self.values_ = tuple(d.values())
+        self._build()
+
+    def __dealloc__(self):
+        PyMem_Free(self.seeds)
+        PyMem_Free(self.slots)
+
+    cdef _build(self):
+        cdef Py_ssize_t i, j, k, b, size, start
+        cdef unsigned int seed
+        cdef hash_acc h
+        cdef list positions = [], hashes = []
+        cdef dict seen = {}
+        # Set aside keys whose hash is already spoken for
+        for i in range(len(self.keys_)):
+            h = <hash_acc>hash(self.keys_[i])
+            if h in seen:
+                if self.overflow is None:
+                    self.overflow = {}
+                self.overflow[self.keys_[i]] = self.values_[i]
+            else:
+                seen[h] = i
+                positions.append(i)
+                hashes.append(h)
+        cdef Py_ssize_t n = len(positions)
+        cdef Py_ssize_t nb = n // 3 + 1
+        self.n = n
+        self.nbuckets = nb
+        self.seeds = <unsigned int*>PyMem_Malloc(nb * sizeof(unsigned int))
+        self.slots = <_chd_entry*>PyMem_Malloc((n or 1) * sizeof(_chd_entry))
+        # Scratch space: the keys grouped by bucket with their hashes,
+        # the slots being tried for one bucket, the slots taken, and
+        # the order to place the buckets in.
+        cdef Py_ssize_t *ends = <Py_ssize_t*>PyMem_Malloc(
+            (nb + 1) * sizeof(Py_ssize_t))
+        cdef Py_ssize_t *members = <Py_ssize_t*>PyMem_Malloc(
+            (n or 1) * sizeof(Py_ssize_t))
+        cdef hash_acc *member_hashes = <hash_acc*>PyMem_Malloc(
+            (n or 1) * sizeof(hash_acc))
+        cdef Py_ssize_t *slots = <Py_ssize_t*>PyMem_Malloc(
+            (n or 1) * sizeof(Py_ssize_t))
+        cdef char *taken = <char*>PyMem_Malloc(n or 1)
+        cdef Py_ssize_t *order = <Py_ssize_t*>PyMem_Malloc(
+            nb * sizeof(Py_ssize_t))
+        cdef unsigned int *seeds = self.seeds
+        cdef _chd_entry *table = self.slots
+        try:
+            if not (self.seeds and self.slots and ends and members
+                    and member_hashes and slots and taken and order):
+                raise MemoryError()
+            # Counting sort of the keys by bucket
+            memset(ends, 0, (nb + 1) * sizeof(Py_ssize_t))
+            memset(taken, 0, n)
+            for j in range(n):
+                ends[_scale(_fmix(hashes[j]), nb) + 1] += 1
+            for b in range(nb):
+                ends[b + 1] += ends[b]
+            for j in range(n):
+                h = hashes[j]
+                b = _scale(_fmix(h), nb)
+                members[ends[b]] = positions[j]
+                member_hashes[ends[b]] = h
+                ends[b] += 1
+            # Bucket b now ends at ends[b].  Place the largest buckets
+            # first, while most slots are still free.
+            sizes = [(ends[b] - (ends[b - 1] if b else 0), b)
+                     for b in range(nb)]
+            sizes.sort(reverse=True)
+            for k in range(nb):
+                order[k] = sizes[k][1]
+            # The search only touches C arrays, so other threads
+            # can run while it goes on.
+            with nogil:
+                for k in range(nb):
+                    b = order[k]
+                    start = ends[b - 1] if b else 0
+                    size = ends[b] - start
+                    seed = 0
+                    if size:
+                        seed = 1
+                        while not _chd_fits(member_hashes + start, size,
+                                            seed, n, taken, slots):
+                            seed += 1
+                        for j in range(size):
+                            taken[slots[j]] = 1
+                            table[slots[j]].h = member_hashes[start + j]
+                            table[slots[j]].pos = members[start + j]
+                    seeds[b] = seed
+        finally:
+            PyMem_Free(order)
+            PyMem_Free(ends)
+            PyMem_Free(members)
+            PyMem_Free(member_hashes)
+            PyMem_Free(slots)
+            PyMem_Free(taken)
+
+    cdef Py_ssize_t _find(self, key) except -2:
+        # The key's position in keys_, or -1
+        cdef hash_acc h = <hash_acc>hash(key)
+        cdef _chd_entry *e
+        if self.n:
+            e = self.slots + _chd_slot(
+                h, self.seeds[_scale(_fmix(h), self.nbuckets)], self.n)
+            if e.h != h:
+                return -1
+            k = <object>PyTuple_GET_ITEM(self.keys_, e.pos)
+            if type(k) is unicode and type(key) is unicode:
+                # Skips the generic comparison, as dict does
+                if <unicode>k == <unicode>key:
+                    return e.pos
+            elif PyObject_RichCompareBool(k, key, Py_EQ):
+                return e.pos
+        return -1
+
+    def __len__(self):
+        return len(self.keys_)
+
+    def __iter__(self):
+        return iter(self.keys_)
+
+    def __getitem__(self, key):
+        cdef Py_ssize_t i = self._find(key)
+        if i != -1:
+            return self.values_[i]
+        if self.overflow is not None:
+            return self.overflow[key]
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        if self._find(key) != -1:
+            return True
+        return self.overflow is not None and key in self.overflow
+
+    def get(self, key, default=None):
+        cdef Py_ssize_t i = self._find(key)
+        if i != -1:
+            return self.values_[i]
+        if self.overflow is not None:
+            return self.overflow.get(key, default)
+        return default
+
+    def keys(self):
+        return KeysView(self)
+
+    def values(self):
+        return ValuesView(self)
+
+    def items(self):
+        return ItemsView(self)
+
+    def __sizeof__(self):
+        return (getsizeof(self.keys_) + getsizeof(self.values_)
+                + self.nbuckets * sizeof(unsigned int)
+                + self.n * sizeof(_chd_entry)
+                + (getsizeof(self.overflow) if self.overflow else 0))
+
+    def __hash__(self):
+        # The same combination FrozenDict uses
+        cdef hash_acc acc = 0
+        cdef Py_ssize_t i
+        cdef long long h = _load_hash(&self.h)
+        if h == -1:
+            for i in range(len(self.keys_)):
+                acc ^= _entry_hash(self.keys_[i], self.values_[i])
+            h = _finish_hash(acc, len(self.keys_))
+            _store_hash(&self.h, h)
+        return h
+
+    def __richcmp__(self, other, int flag):
+        if flag != 2 and flag != 3:
+            return NotImplemented
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        equal = self is other or \
+            (len(other) == len(self.keys_) and _within(other, self))
+        return equal if flag == 2 else not equal
+
+    def __reduce__(self):
+        return (StaticFrozenDict, (list(zip(self.keys_, self.values_)),))
+
+    def __repr__(self):
+        c = self.__class__.__name__
+        return '%s(%s)' % (c, dict(zip(self.keys_, self.values_)))
+
+Mapping.register(StaticFrozenDict)
+
+########################################
+#                C API                 #
+########################################
+# Functions for C extensions.  Building this module writes a header,
+# frozen_dict_api.h, which declares them; a C extension includes it
+# and calls import_frozen_dict() once before using any of them.
+# They take and return plain PyObject pointers, and raise a
+# TypeError for anything that is not a FrozenDict.  Cython modules
+# should cimport the inline functions in frozen_dict.pxd instead.
+
+cdef inline FrozenDict _checked(obj):
+    if not isinstance(obj, FrozenDict):
+        raise TypeError('expected a FrozenDict, got %r'
+                        % type(obj).__name__)
+    return <FrozenDict>obj
+
+cdef api bint FrozenDict_Check(obj) noexcept:
+    # True for a FrozenDict or an instance of a subclass
+    return isinstance(obj, FrozenDict)
+
+cdef api object FrozenDict_FromDict(d):
+    # A new FrozenDict that takes over the dict d without copying
+    # it.  The caller keeps its own reference, but must not change d.
+    # C callers are not type checked by Cython, hence the object.
+    if type(d) is dict:
+        return frozendict_adopt(d)
+    if isinstance(d, dict):
+        return FrozenDict(d)
+    raise TypeError('expected a dict, got %r' % type(d).__name__)
+
+cdef api Py_ssize_t FrozenDict_Size(frz) except -1:
+    return frozendict_size(_checked(frz))
+
+cdef api PyObject *FrozenDict_GetItem(frz, key) except? NULL:
+    # A borrowed reference to the value for key, or NULL
+    # with no exception set when key is missing
+    return frozendict_get(_checked(frz), key)
+
+cdef api int FrozenDict_Contains(frz, key) except -1:
+    return frozendict_contains(_checked(frz), key)
+
+cdef api int FrozenDict_Next(frz, Py_ssize_t *pos, PyObject **key,
+                             PyObject **value) except -1:
+    # Like PyDict_Next, with borrowed references.  Returns 1 for
+    # each item, then 0, or -1 with an exception set when a derived
+    # FrozenDict cannot get a dictionary of its own.
+    return frozendict_next(_checked(frz), pos, key, value)
+
+cdef api long long FrozenDict_CachedHash(frz) except? -1:
+    # The hash if it has been worked out, or else
+    # -1 with no exception set
+    return frozendict_cached_hash(_checked(frz))
@@ -1,8 +1,17 @@
-from frozen_dict import FrozenDict
+import frozen_dict
+from frozen_dict import FrozenDict, OrderedMap, SortedFrozenMap
+from freeze_recursive import freeze
+from frozen_dict import thaw
 import unittest
 from abc import ABCMeta, abstractmethod
 from operator import itemgetter, methodcaller
-from collections import namedtuple, ItemsView, KeysView, ValuesView
+from collections import namedtuple
+try:
+    from collections.abc import ItemsView, KeysView, ValuesView, \
+    MutableMapping
+except ImportError:
+    from collections import ItemsView, KeysView, ValuesView, \
+    MutableMapping
 
 frz_nt = namedtuple('FrozenDictTestUnit',('orig','frz','plus_one','thaw','aggKey','aggValue'))
 if 3 / 2 == 1:
@@ -38,6 +47,12 @@ class TestMapping(ABC):
         u = frz_nt(orig,frz,p1,thaw,aggKey,aggValue)
         self.units.append(u)
 
+        #Add the same items stored with shared keys
+        shape = FrozenDict.shape(orig)
+        frz = shape(*[orig[k] for k in shape.keys])
+        u = frz_nt(orig,frz,p1,dict(frz),aggKey,aggValue)
+        self.units.append(u)
+
         #Add a second version with addition items that have hash collisions
         orig = orig.copy()
         coll = {hash(k): (k,v) for k,v in orig.items()}
@@ -398,6 +413,33 @@ class Test_FrozenDict(TestMapping):
                 self.assertEqual((u.frz == a.orig), orig_eq)
                 self.assertEqual((a.orig == u.frz), orig_eq)
             
+    def test_frozendict_equality_uses_cached_hash(self):
+        class Strict(object):
+            def __init__(self, h):
+                self.h = h
+            def __hash__(self):
+                return self.h
+            def __eq__(self, other):
+                raise AssertionError('entries were compared')
+        a = FrozenDict(x=Strict(1))
+        b = FrozenDict(x=Strict(2))
+        self.assertRaises(AssertionError, a.__eq__, b)
+        hash(a), hash(b)
+        self.assertFalse(a == b)
+        self.assertTrue(a != b)
+
+    def test_frozendict_compares_with_mappings(self):
+        from types import MappingProxyType
+        for u in self.units:
+            proxy = MappingProxyType(u.orig)
+            self.assertTrue(u.frz == proxy)
+            self.assertFalse(u.frz != proxy)
+            self.assertFalse(u.plus_one == FrozenDict(proxy))
+            self.assertTrue(u.frz <= proxy)
+            self.assertFalse(u.frz < proxy)
+            self.assertTrue(u.frz < u.plus_one)
+            self.assertTrue(FrozenDict(u.plus_one) > proxy)
+
     def test_frozendict_operator__ne__(self):
         for u in self.units:
             self.assertEqual((u.orig != u.thaw), False)
@@ -474,6 +516,54 @@ class Test_FrozenDict(TestMapping):
             else:
                 self.assertRaises(TypeError, set().add, u.frz)
 
+    def test_frozendict_derived_hash(self):
+        for u in self.units:
+            try:
+                hash(u.frz)
+                hash(u.plus_one[u.aggKey])
+            except TypeError:
+                continue
+            derived = [u.frz.set(u.aggKey, u.aggValue),
+                       u.frz.update({u.aggKey: u.aggValue}),
+                       u.frz.evolver().set(u.aggKey, u.aggValue).persistent()]
+            derived.extend(u.frz.delete(k) for k in u.orig)
+            for k in u.orig:
+                derived.append(u.frz.set(k, u.aggValue))
+            for f in derived:
+                self.assertEqual(hash(f), hash(FrozenDict(dict(f))))
+
+    def test_frozendict_views_iterate_like_dict(self):
+        for u in self.units:
+            self.assertEqual(list(u.frz.viewkeys()), list(u.thaw.keys()))
+            self.assertEqual(list(u.frz.viewvalues()), list(u.thaw.values()))
+            self.assertEqual(list(u.frz.viewitems()), list(u.thaw.items()))
+            for v in u.orig.values():
+                self.assertIn(v, u.frz.viewvalues())
+            try:
+                keys = set(u.orig)
+            except TypeError:
+                continue
+            self.assertEqual(keys & u.frz.viewkeys(), keys)
+            self.assertEqual(u.frz.viewkeys() - keys, set())
+            self.assertEqual([u.aggKey] | u.frz.viewkeys(), keys | {u.aggKey})
+
+    def test_frozendict_views_hash(self):
+        for u in self.units:
+            backwards = FrozenDict(reversed(list(u.orig.items())))
+            for name in ('viewkeys', 'viewitems'):
+                try:
+                    s = frozenset(getattr(u.frz, name)())
+                except TypeError:
+                    continue
+                view = getattr(u.frz, name)()
+                self.assertEqual(hash(view), hash(getattr(backwards, name)()))
+                frozen_dict.use_frozenset_hash(True)
+                try:
+                    view = getattr(u.frz, name)()
+                    self.assertEqual(hash(view), hash(s))
+                finally:
+                    frozen_dict.use_frozenset_hash(False)
+
     def test_frozendict_behavior_inside_a_set(self):
         for u in self.units:
             for a in self.units:
@@ -513,7 +603,7 @@ class Test_FrozenDict(TestMapping):
             fCopy = u.frz.copy()
             self.assertEqual(dict(fCopy), u.orig)
             self.assertEqual(fCopy, u.frz)
-            self.assertIsNot(fCopy, u.frz)
+            self.assertIs(fCopy, u.frz)
             self.assertIs(type(fCopy), type(u.frz))
             try:
                 hash(u.frz)
@@ -521,6 +611,29 @@ class Test_FrozenDict(TestMapping):
                 continue
             self.assertEqual({u.frz}, {u.frz, fCopy})
             
+    def test_frozendict_shares_storage(self):
+        for u in self.units:
+            f = FrozenDict(u.frz)
+            self.assertEqual(f, u.frz)
+            self.assertEqual(dict(f), u.orig)
+            try:
+                h = hash(u.frz)
+            except TypeError:
+                continue
+            self.assertEqual(hash(f), h)
+            self.assertEqual(hash(FrozenDict(u.frz, extra=1)),
+                             hash(FrozenDict(u.orig, extra=1)))
+
+    def test_frozendict_method_adopt(self):
+        for u in self.units:
+            d = dict(u.orig)
+            f = FrozenDict.adopt(d)
+            self.assertIs(type(f), FrozenDict)
+            self.assertEqual(dict(f), u.orig)
+            self.assertEqual(f, u.frz)
+        self.assertRaises(TypeError, FrozenDict.adopt, None)
+        self.assertEqual(FrozenDict.adopt(u.frz), u.frz)
+
     def test_frozendict_generator_consistency(self):
         #Make sure the keys/values/and items all yield their results
         #in orders that are consistent with each other.
@@ -595,11 +708,72 @@ class Test_FrozenDict(TestMapping):
         for u in self.units:
             self.assertRaises(AttributeError,func,u.frz)
             
-    def test_frozendict_fails_method_update(self):
-        def func(obj, other):
-            obj.update(other)
+    def test_frozendict_method_update(self):
+        for u in self.units:
+            f = u.frz.update({u.aggKey: u.aggValue})
+            self.assertIs(type(f), type(u.frz))
+            self.assertEqual(dict(f), dict(u.plus_one))
+            self.assertEqual(dict(u.frz), u.orig)
+            self.assertIs(u.frz.update(), u.frz)
+            f = u.frz.update(u.plus_one, **{'kw': 0})
+            self.assertEqual(f['kw'], 0)
+
+    def test_frozendict_method_set(self):
         for u in self.units:
-            self.assertRaises(AttributeError,func,u.frz,{u.aggKey:u.aggValue})
+            f = u.frz.set(u.aggKey, u.aggValue)
+            self.assertIs(type(f), type(u.frz))
+            self.assertEqual(dict(f), dict(u.plus_one))
+            self.assertNotIn(u.aggKey, u.frz)
+            for k, v in u.orig.items():
+                self.assertIs(u.frz.set(k, v), u.frz)
+                f = u.frz.set(k, u.aggValue)
+                self.assertIs(f[k], u.aggValue)
+                self.assertIs(u.frz[k], v)
+
+    def test_frozendict_method_delete(self):
+        for u in self.units:
+            self.assertRaises(KeyError, u.frz.delete, u.aggKey)
+            for k in u.orig:
+                f = u.frz.delete(k)
+                self.assertIs(type(f), type(u.frz))
+                self.assertNotIn(k, f)
+                self.assertIn(k, u.frz)
+                self.assertEqual(len(f), len(u.frz) - 1)
+
+    def test_frozendict_method_evolver(self):
+        for u in self.units:
+            e = u.frz.evolver()
+            self.assertIs(e.persistent(), u.frz)
+            e[u.aggKey] = u.aggValue
+            self.assertTrue(e.is_dirty())
+            self.assertEqual(e[u.aggKey], u.aggValue)
+            self.assertNotIn(u.aggKey, u.frz)
+            f = e.persistent()
+            self.assertFalse(e.is_dirty())
+            self.assertEqual(dict(f), dict(u.plus_one))
+            del e[u.aggKey]
+            for k in u.orig:
+                e.delete(k)
+            self.assertEqual(len(e.persistent()), 0)
+            self.assertEqual(dict(f), dict(u.plus_one))
+            self.assertEqual(dict(u.frz), u.orig)
+
+    def test_frozendict_evolver_as_mutable_mapping(self):
+        for u in self.units:
+            e = u.frz.evolver()
+            self.assertIsInstance(e, MutableMapping)
+            self.assertEqual(e, u.orig)
+            self.assertEqual(set(e.keys()), set(u.orig.keys()))
+            self.assertEqual(len(e.items()), len(u.orig))
+            self.assertRaises(TypeError, hash, e)
+            self.assertEqual(e.setdefault(u.aggKey, u.aggValue), u.aggValue)
+            self.assertIs(e.pop(u.aggKey), u.aggValue)
+            self.assertIs(e.pop(u.aggKey, None), None)
+            self.assertRaises(KeyError, e.pop, u.aggKey)
+            e.clear()
+            self.assertEqual(len(e), 0)
+            self.assertRaises(KeyError, e.popitem)
+            self.assertEqual(dict(u.frz), u.orig)
             
     def test_frozendict_fails_method_pop(self):
         def func(obj, key):
@@ -771,5 +945,1291 @@ if version == 3:
             for u in self.units:
                 self.assertRaises(TypeError, itemgetter(0), u.frz.items())
 
+class Test_Small(unittest.TestCase):
+    def test_sizes_behave_alike(self):
+        import pickle
+        for n in range(12):
+            d = dict(('key%d' % i, i) for i in range(n))
+            frz = FrozenDict(d)
+            self.assertEqual(frz, d)
+            self.assertEqual(frz, FrozenDict(dict(d)))
+            self.assertEqual(len(frz), n)
+            self.assertEqual(list(frz), list(d))
+            self.assertEqual(list(frz.values()), list(d.values()))
+            self.assertEqual(list(frz.items()), list(d.items()))
+            self.assertEqual(frz.keys() & set(d), set(d))
+            self.assertEqual(thaw(frz), d)
+            for k in d:
+                self.assertEqual(frz[''.join(list(k))], d[k])
+            self.assertNotIn('missing', frz)
+            self.assertRaises(KeyError, itemgetter('missing'), frz)
+            self.assertEqual(pickle.loads(pickle.dumps(frz)), frz)
+            grown = frz.set('extra', -1)
+            self.assertEqual(grown, dict(d, extra=-1))
+            self.assertEqual(grown.delete('extra'), frz)
+            self.assertEqual(hash(grown.delete('extra')), hash(frz))
+            if n:
+                self.assertEqual(hash(frz), hash(OrderedMap(d)))
+
+    def test_equal_keys(self):
+        frz = FrozenDict({1: 'int', (1, 2): 'tuple'})
+        self.assertEqual(frz[1.0], 'int')
+        self.assertEqual(frz[True], 'int')
+        self.assertEqual(frz[(1, 2)], 'tuple')
+        self.assertRaises(TypeError, itemgetter([1]), frz)
+        nan = float('nan')
+        frz = FrozenDict({nan: 'nan'})
+        self.assertEqual(frz[nan], 'nan')
+        self.assertNotIn(float('nan'), frz)
+
+        class Key(object):
+            # Every Key has the same hash, so tags cannot tell
+            # them apart and each lookup falls back to __eq__
+            def __init__(self, name):
+                self.name = name
+            def __hash__(self):
+                return 0
+            def __eq__(self, other):
+                return isinstance(other, Key) and self.name == other.name
+        frz = FrozenDict((Key(c), c) for c in 'abcdefgh')
+        self.assertEqual(frz[Key('e')], 'e')
+        self.assertNotIn(Key('z'), frz)
+
+    def test_smaller_than_dict(self):
+        import sys
+        d = dict(('key%d' % i, i) for i in range(4))
+        self.assertLess(sys.getsizeof(FrozenDict(d)), sys.getsizeof(d))
+
+class Test_Shape(unittest.TestCase):
+    def setUp(self):
+        self.shape = FrozenDict.shape(('x', 'y', 'z'))
+        self.frz = self.shape(1, 2, [3])
+
+    def test_shape_behaves_like_frozendict(self):
+        plain = FrozenDict(x=1, y=2, z=[3])
+        self.assertIs(type(self.frz), FrozenDict)
+        self.assertEqual(self.frz, plain)
+        self.assertEqual(plain, self.frz)
+        self.assertEqual(list(self.frz), ['x', 'y', 'z'])
+        self.assertEqual(repr(self.frz), repr(FrozenDict(self.frz)))
+        self.assertRaises(KeyError, itemgetter('w'), self.frz)
+        self.assertRaises(TypeError, hash, self.frz)
+        point = FrozenDict.shape(('x', 'y'))
+        self.assertEqual(hash(point(3, 4)), hash(FrozenDict(y=4, x=3)))
+
+    def test_shape_constructors(self):
+        self.assertEqual(self.shape.fromvalues([1, 2, [3]]), self.frz)
+        self.assertEqual(self.shape.fromdict({'z': [3], 'y': 2, 'x': 1}),
+                         self.frz)
+        self.assertRaises(TypeError, self.shape, 1, 2)
+        self.assertRaises(ValueError, self.shape.fromdict, {'x': 1})
+        self.assertRaises(KeyError, self.shape.fromdict,
+                          {'x': 1, 'y': 2, 'w': 3})
+        self.assertRaises(ValueError, FrozenDict.shape, 'xyx')
+        self.assertEqual(len(self.shape), 3)
+
+    def test_shape_set_keeps_shared_keys(self):
+        f = self.frz.set('y', 20)
+        self.assertEqual(f, FrozenDict(x=1, y=20, z=[3]))
+        self.assertLess(f.__sizeof__(), FrozenDict(f).set('w', 0).__sizeof__())
+        self.assertEqual(self.frz.set('w', 0), FrozenDict(x=1, y=2, z=[3], w=0))
+        self.assertEqual(self.frz.delete('x'), FrozenDict(y=2, z=[3]))
+
+    def test_shape_smaller_than_dict(self):
+        point = FrozenDict.shape(('x', 'y'))
+        self.assertLess(point(3, 4).__sizeof__(),
+                        FrozenDict(x=3, y=4).__sizeof__())
+
+class Test_Batch(unittest.TestCase):
+    def layouts(self, d):
+        # The same items stored small, shaped, in a dict, and ordered
+        big = dict(d, **dict(('pad%d' % i, i) for i in range(10)))
+        return [FrozenDict(d), FrozenDict.shape(list(d)).fromdict(d),
+                FrozenDict(big), OrderedMap(big)]
+
+    def test_get(self):
+        for frz in self.layouts({'a': 1, 'b': None}):
+            self.assertEqual(frz.get('a'), 1)
+            self.assertEqual(frz.get(''.join(['a'])), 1)
+            self.assertIsNone(frz.get('b', 0))
+            self.assertIsNone(frz.get('missing'))
+            self.assertEqual(frz.get('missing', 5), 5)
+            self.assertRaises(TypeError, frz.get, [])
+
+    def test_get_many(self):
+        for frz in self.layouts({'a': 1, 'b': 2, 'c': 3}):
+            self.assertEqual(frz.get_many(['c', 'missing', 'a']),
+                             (3, None, 1))
+            self.assertEqual(frz.get_many(iter('ab'), 0), (1, 2))
+            self.assertEqual(frz.get_many(('x',), default=0), (0,))
+            self.assertEqual(frz.get_many([]), ())
+
+    def test_getter(self):
+        import pickle
+        g = FrozenDict.getter('c', 'a')
+        with_default = FrozenDict.getter('a', 'missing', default=0)
+        for frz in self.layouts({'a': 1, 'b': 2, 'c': 3}):
+            # Twice, the second time from what the getter remembers
+            for i in range(2):
+                self.assertEqual(g(frz), (3, 1))
+                self.assertEqual(with_default(frz), (1, 0))
+                self.assertRaises(KeyError, FrozenDict.getter('missing'), frz)
+        self.assertEqual(g({'a': 1, 'c': 3}), (3, 1))
+        self.assertEqual(with_default({'a': 1}), (1, 0))
+        self.assertRaises(KeyError, g, {'a': 1})
+        self.assertEqual(g.keys, ('c', 'a'))
+        self.assertEqual(repr(g), "FrozenDict.getter('c', 'a')")
+        self.assertEqual(repr(with_default),
+                         "FrozenDict.getter('a', 'missing', default=0)")
+        self.assertEqual(pickle.loads(pickle.dumps(with_default))({'a': 1}),
+                         (1, 0))
+        self.assertEqual(pickle.loads(pickle.dumps(g))({'a': 1, 'c': 3}),
+                         (3, 1))
+
+    def test_getter_across_shapes(self):
+        g = FrozenDict.getter('y', 'x')
+        for keys in ('xy', 'yxz', 'zx', 'xy'):
+            frz = FrozenDict.shape(keys).fromvalues(range(len(keys)))
+            if 'y' in keys:
+                self.assertEqual(g(frz), (frz['y'], frz['x']))
+            else:
+                self.assertRaises(KeyError, g, frz)
+
+    def test_take(self):
+        from array import array
+        frz = FrozenDict((i, i * 10) for i in range(20))
+        self.assertEqual(frz.take(array('q', [3, 0, 19])), [30, 0, 190])
+        for code in 'bBhHiIlLqQ':
+            keys = array(code, [1, 2, 2])
+            self.assertEqual(frz.take(keys), [10, 20, 20])
+            self.assertEqual(frz.take(memoryview(keys)[::2]), [10, 20])
+        out = array('d', [0.0] * 3)
+        self.assertIs(frz.take(array('i', [1, 2, 50]), out, -1), out)
+        self.assertEqual(list(out), [10.0, 20.0, -1.0])
+        out = array('i', [0] * 2)
+        frz.take(array('i', [5, 6]), out)
+        self.assertEqual(list(out), [50, 60])
+        self.assertEqual(frz.take(array('i', [])), [])
+        self.assertRaises(KeyError, frz.take, array('i', [50]))
+        self.assertRaises(ValueError, frz.take, array('d', [1.0]))
+        self.assertRaises(ValueError, frz.take, array('i', [1]), out)
+        self.assertRaises(OverflowError, frz.take, array('i', [19, 19]),
+                          array('b', [0, 0]))
+        self.assertRaises(TypeError, FrozenDict({1: 1.5}).take,
+                          array('i', [1]), array('i', [0]))
+        self.assertRaises(TypeError, frz.take, [1, 2])
+        self.assertRaises(BufferError, frz.take, array('i', [1]), bytes(4))
+
+class Test_Freeze(unittest.TestCase):
+    def test_freeze_nested(self):
+        dct = {'x': 3, 'z': {'a': 0, 'b': [3, 1, {4, 1}, [5, 9]]}}
+        frz = freeze(dct)
+        self.assertEqual(frz, FrozenDict(x=3, z=FrozenDict(
+            a=0, b=(3, 1, frozenset([1, 4]), (5, 9)))))
+        self.assertIs(type(frz['z']), FrozenDict)
+        hash(frz)
+
+    def test_freeze_keeps_frozen_objects(self):
+        t = (1, 'a', (2.5, None))
+        self.assertIs(freeze(t), t)
+        f = FrozenDict(a=t)
+        self.assertIs(freeze(f), f)
+        self.assertEqual(freeze((1, [2])), (1, (2,)))
+        self.assertEqual(freeze(FrozenDict(a=[1])), FrozenDict(a=(1,)))
+
+    def test_freeze_generic_types(self):
+        from collections import OrderedDict, deque
+        self.assertEqual(freeze(OrderedDict(a=[1])), FrozenDict(a=(1,)))
+        self.assertEqual(freeze(deque([1, [2]])), (1, (2,)))
+        self.assertEqual(freeze({1: {2: 3}.keys()}), FrozenDict({1: frozenset([2])}))
+        self.assertRaises(TypeError, freeze, [object.__new__(type('X', (), {'__hash__': None}))])
+
+    def test_freeze_unregistered_mapping(self):
+        # Not registered with the Mapping ABC, and not hashable
+        class KeylessBag(object):
+            __hash__ = None
+            def __init__(self, d):
+                self.d = d
+            def __getitem__(self, key):
+                return self.d[key]
+            def __iter__(self):
+                return iter(self.d)
+            def __len__(self):
+                return len(self.d)
+        class Bag(KeylessBag):
+            def keys(self):
+                return self.d.keys()
+        for cls in (Bag, KeylessBag):
+            self.assertEqual(freeze(cls({'a': [1], 'b': 2})),
+                             FrozenDict({'a': (1,), 'b': 2}))
+
+    def test_freeze_deep_input(self):
+        deep = []
+        for i in range(100000):
+            deep = [deep]
+        frz = freeze(deep)
+        for i in range(100000):
+            frz = frz[0]
+        self.assertEqual(frz, ())
+
+    def test_freeze_shared_and_cyclic(self):
+        shared = {'a': [1, 2]}
+        frz = freeze([shared, shared, {'b': shared}])
+        self.assertIs(frz[0], frz[1])
+        self.assertIs(frz[0], frz[2]['b'])
+        cycle = []
+        cycle.append(cycle)
+        self.assertRaises(ValueError, freeze, cycle)
+        cycle = {}
+        cycle['self'] = [cycle]
+        self.assertRaises(ValueError, freeze, cycle)
+
+class Test_FreezeMany(unittest.TestCase):
+    def test_freeze_many(self):
+        objs = [{'a': [i, {'b': set([i])}]} for i in range(20)]
+        expected = [freeze(obj) for obj in objs]
+        self.assertEqual(frozen_dict.freeze_many(objs), expected)
+        self.assertEqual(frozen_dict.freeze_many(objs, workers=2), expected)
+        self.assertEqual(frozen_dict.freeze_many(iter(objs), workers=1),
+                         expected)
+        self.assertEqual(frozen_dict.freeze_many([]), [])
+
+    def test_hash_from_threads(self):
+        import threading
+        frz = FrozenDict((i, str(i)) for i in range(1000))
+        expected = hash(FrozenDict(dict(frz)))
+        seen = []
+        threads = [threading.Thread(target=lambda: seen.append(hash(frz)))
+                   for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(seen, [expected] * 8)
+
+class Test_Layered(unittest.TestCase):
+    # FrozenDicts of 512 items or more share their hidden dictionary
+    # with what set, delete, update and patch derive from them
+    def setUp(self):
+        self.d = dict(('key%d' % i, i) for i in range(1000))
+        self.frz = FrozenDict(self.d)
+
+    def assertSame(self, frz, d):
+        import pickle
+        self.assertEqual(len(frz), len(d))
+        for k in ('key0', 'key999', 'new', 'other', 'missing'):
+            self.assertEqual(k in frz, k in d)
+            self.assertEqual(frz.get(k), d.get(k))
+        self.assertEqual(frz, d)
+        self.assertEqual(list(frz.items()), list(d.items()))
+        self.assertEqual(hash(frz), hash(FrozenDict(dict(d))))
+        self.assertEqual(pickle.loads(pickle.dumps(frz)), frz)
+        self.assertEqual(thaw(frz), d)
+
+    def test_changes_match_dict(self):
+        import random
+        rng = random.Random(7)
+        hash(self.frz)
+        frz, d = self.frz, dict(self.d)
+        for step in range(200):
+            k = rng.choice(['new', 'other', 'key%d' % rng.randrange(1000)])
+            if k in d and rng.random() < 0.4:
+                frz = frz.delete(k)
+                del d[k]
+            elif rng.random() < 0.2:
+                frz = frz.update({k: step, 'other': -step})
+                d.update({k: step, 'other': -step})
+            else:
+                frz = frz.set(k, step)
+                d[k] = step
+            self.assertEqual(len(frz), len(d))
+            self.assertEqual(frz.get(k), d.get(k))
+            if step % 25 == 0:
+                self.assertSame(frz, d)
+        self.assertSame(frz, d)
+        self.assertEqual(self.frz, self.d)
+
+    def test_order_matches_dict(self):
+        frz = self.frz.delete('key5').set('new', 1).set('key5', 2)
+        frz = frz.set('key0', 3).delete('new').set('new', 4)
+        d = dict(self.d)
+        del d['key5']
+        d['new'] = 1
+        d['key5'] = 2
+        d['key0'] = 3
+        del d['new']
+        d['new'] = 4
+        self.assertEqual(list(frz), list(d))
+        self.assertEqual(list(frz.values()), list(d.values()))
+        self.assertRaises(KeyError, frz.delete, 'missing')
+        self.assertRaises(KeyError, itemgetter('missing'), frz)
+        self.assertRaises(KeyError, self.frz.set('a', 1).delete, 'key5000')
+
+    def test_shares_until_compacted(self):
+        full = self.frz.__sizeof__()
+        frz = self.frz.set('new', 1)
+        self.assertLess(frz.__sizeof__(), full // 10)
+        copied = []
+        for i in range(1, 100):
+            frz = frz.set('key%d' % i, -i)
+            if frz.__sizeof__() > full // 2:
+                copied.append(i)
+        # Past sqrt(1000) changes the map gets a dictionary of its
+        # own, which the next ones are layered over in turn
+        self.assertEqual(copied, [31, 63, 95])
+        self.assertEqual(frz['key99'], -99)
+        self.assertEqual(frz['key100'], 100)
+        small = FrozenDict(a=1).set('b', 2)
+        self.assertEqual(small, {'a': 1, 'b': 2})
+
+    def test_views_and_diff(self):
+        frz = self.frz.set('new', 1).delete('key1')
+        other = self.frz.set('key2', 'two').set('other', 0)
+        self.assertIn('new', frz.keys())
+        self.assertNotIn('key1', frz.keys())
+        self.assertIn(('new', 1), frz.items())
+        self.assertIn(1, frz.values())
+        self.assertEqual(frz.keys() - self.frz.keys(), {'new'})
+        self.assertEqual(hash(frz.items()), hash(FrozenDict(frz).items()))
+        diff = frz.diff(other)
+        self.assertEqual(diff.added, {'key1': 1, 'other': 0})
+        self.assertEqual(diff.removed, {'new': 1})
+        self.assertEqual(diff.changed, {'key2': (2, 'two')})
+        self.assertEqual(diff, FrozenDict(dict(frz)).diff(other))
+        self.assertEqual(frz.patch(diff), other)
+        self.assertEqual(self.frz.patch(self.frz.diff(frz)), frz)
+        self.assertFalse(frz.diff(frz.set('new', 1)))
+        e = frz.evolver()
+        e['key3'] = 'three'
+        self.assertEqual(e.persistent(), dict(frz, key3='three'))
+
+class Test_Diff(unittest.TestCase):
+    def setUp(self):
+        self.old = freeze({'a': 1, 'b': 2, 'n': {'x': 1, 'y': {'z': 0}}})
+        self.new = self.old.update({'b': 3, 'c': 4}).delete('a')
+        self.new = self.new.set('n', self.old['n'].set('x', 2))
+
+    def test_diff(self):
+        diff = self.old.diff(self.new)
+        self.assertEqual(diff.added, {'c': 4})
+        self.assertEqual(diff.removed, {'a': 1})
+        self.assertEqual(diff.changed, {'b': (2, 3), 'n': (
+            self.old['n'], self.new['n'])})
+        self.assertTrue(diff)
+        self.assertFalse(self.old.diff(self.old))
+        self.assertFalse(self.old.diff(freeze(thaw(self.old))))
+        self.assertEqual(self.old.diff({'a': 1}).removed,
+                         {'b': 2, 'n': self.old['n']})
+
+    def test_recursive(self):
+        diff = self.old.diff(self.new, recursive=True)
+        nested = diff.changed['n']
+        self.assertEqual(nested.changed, {'x': (1, 2)})
+        self.assertFalse(nested.added or nested.removed)
+        self.assertEqual(diff, self.old.diff(self.new, True))
+        self.assertNotEqual(diff, self.old.diff(self.new))
+
+    def test_patch(self):
+        for recursive in (False, True):
+            diff = self.old.diff(self.new, recursive)
+            out = self.old.patch(diff)
+            self.assertEqual(out, self.new)
+            self.assertEqual(hash(out), hash(FrozenDict(dict(self.new))))
+        self.assertIs(self.old.patch(self.old.diff(self.old)), self.old)
+        om = OrderedMap([('a', 1), ('b', 2)])
+        self.assertEqual(list(om.patch(om.diff({'b': 3})).items()),
+                         [('b', 3)])
+
+class Test_LazyFreeze(unittest.TestCase):
+    def setUp(self):
+        self.doc = {'meta': {'id': 7, 'tags': ['a', 'b']},
+                    'rows': [{'x': i, 's': {i}} for i in range(3)],
+                    'n': 1}
+        self.frz = freeze(self.doc)
+        self.lazy = frozen_dict.lazy_freeze(self.doc)
+
+    def test_reads(self):
+        lazy = self.lazy
+        LazyFrozenDict = frozen_dict.LazyFrozenDict
+        self.assertIs(type(lazy), LazyFrozenDict)
+        self.assertIs(type(lazy['meta']), LazyFrozenDict)
+        self.assertIs(lazy['meta'], lazy['meta'])
+        self.assertEqual(lazy['meta']['tags'], ('a', 'b'))
+        self.assertEqual(lazy['rows'][1]['s'], frozenset([1]))
+        self.assertEqual(len(lazy), 3)
+        self.assertEqual(sorted(lazy), ['meta', 'n', 'rows'])
+        self.assertIn('n', lazy)
+        self.assertEqual(lazy.get('missing', 0), 0)
+        self.assertRaises(KeyError, itemgetter('missing'), lazy)
+        self.assertEqual(dict(lazy.items())['n'], 1)
+        self.assertEqual(frozen_dict.lazy_freeze([{'a': 1}]),
+                         (FrozenDict(a=1),))
+        self.assertEqual(frozen_dict.lazy_freeze(5), 5)
+
+    def test_threads_see_the_same_values(self):
+        import threading, gc
+        for trial in range(20):
+            # Not yet copied, so the threads race to copy it
+            child = frozen_dict.lazy_freeze([{'a': {'b': 1}}])[0]
+            barrier = threading.Barrier(8)
+            results = []
+            def run():
+                barrier.wait()
+                results.append(child['a'])
+            threads = [threading.Thread(target=run) for i in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            self.assertEqual(len(set(map(id, results))), 1)
+            self.assertIs(child['a'], results[0])
+        # Reading leaves the collector as it was
+        gc.disable()
+        try:
+            frozen_dict.lazy_freeze({'l': [{}, {}]})['l']
+            self.assertFalse(gc.isenabled())
+        finally:
+            gc.enable()
+
+    def test_values_are_frozen_when_read(self):
+        class Unsupported(object):
+            __hash__ = None
+        doc = {'good': {'a': 1}, 'bad': {'b': Unsupported()}}
+        lazy = frozen_dict.lazy_freeze(doc)
+        self.assertEqual(lazy['good']['a'], 1)
+        self.assertRaises(TypeError, freeze, doc)
+        self.assertRaises(TypeError, itemgetter('b'), lazy['bad'])
+        self.assertRaises(TypeError, hash, lazy)
+
+    def test_levels_are_copied_when_reached(self):
+        doc = {'a': {'b': 1}}
+        lazy = frozen_dict.lazy_freeze(doc)
+        doc['c'] = 2
+        child = lazy['a']
+        self.assertEqual(len(child), 1)
+        doc['a']['d'] = 3
+        self.assertNotIn('c', lazy)
+        self.assertNotIn('d', child)
+
+    def test_compare_hash_and_materialize(self):
+        lazy = self.lazy
+        self.assertEqual(lazy, self.frz)
+        self.assertEqual(self.frz, lazy)
+        self.assertEqual(frozen_dict.lazy_freeze({'a': 1}), {'a': 1})
+        self.assertEqual({'a': 1}, frozen_dict.lazy_freeze({'a': 1}))
+        self.assertEqual(repr(frozen_dict.lazy_freeze({'a': [1]})),
+                         "LazyFrozenDict({'a': (1,)})")
+        self.assertNotEqual(lazy, self.frz.set('n', 2))
+        self.assertEqual(lazy['rows'], self.frz['rows'])
+        out = lazy.materialize()
+        self.assertIs(type(out), FrozenDict)
+        self.assertIs(type(out['meta']), FrozenDict)
+        self.assertEqual(out, self.frz)
+        self.assertIs(lazy.materialize(), out)
+        self.assertEqual(hash(lazy), hash(self.frz))
+        self.assertEqual(freeze(frozen_dict.lazy_freeze(self.doc)), self.frz)
+        self.assertEqual(thaw(frozen_dict.lazy_freeze(self.doc)), self.doc)
+
+    def test_pickle(self):
+        import pickle
+        out = pickle.loads(pickle.dumps(self.lazy))
+        self.assertIs(type(out), FrozenDict)
+        self.assertEqual(out, self.frz)
+
+class Test_Thaw(unittest.TestCase):
+    def setUp(self):
+        self.data = {'x': 3, 'z': {'a': 0, 'b': [3, 1, {4, 1}, [5, 9]]},
+                     'e': [], 'f': {}, 's': {(1, 2)}}
+        self.frz = freeze(self.data)
+
+    def test_thaw_round_trip(self):
+        out = thaw(self.frz)
+        self.assertEqual(out, self.data)
+        self.assertIs(type(out['z']), dict)
+        self.assertIs(type(out['z']['b'][3]), list)
+        self.assertEqual(out['s'], {(1, 2)})
+        self.assertEqual(thaw('text'), 'text')
+        shape = FrozenDict.shape(('a', 'b'))
+        self.assertEqual(thaw(shape(1, (2,))), {'a': 1, 'b': [2]})
+        om = thaw(OrderedMap([('b', (1,)), ('a', 2)]))
+        self.assertEqual(list(om.items()), [('b', [1]), ('a', 2)])
+
+    def test_thaw_depth(self):
+        out = thaw(self.frz, depth=1)
+        self.assertIs(type(out), dict)
+        self.assertIs(out['z'], self.frz['z'])
+        out = thaw(self.frz, depth=2)
+        self.assertIs(type(out['z']), dict)
+        self.assertIs(out['z']['b'], self.frz['z']['b'])
+        self.assertIs(thaw(self.frz, depth=0), self.frz)
+
+    def test_thaw_shared_and_deep(self):
+        shared = freeze({'a': [1]})
+        out = thaw((shared, shared, (), ()))
+        self.assertIs(out[0], out[1])
+        self.assertIsNot(out[2], out[3])
+        deep = ()
+        for i in range(100000):
+            deep = (deep,)
+        out = thaw(deep)
+        for i in range(100000):
+            out = out[0]
+        self.assertEqual(out, [])
+
+class Test_Intern(unittest.TestCase):
+    def setUp(self):
+        self.table = frozen_dict.InternTable()
+
+    def test_intern_returns_canonical_instance(self):
+        a = FrozenDict(x=1, y=(2, 3))
+        b = FrozenDict(y=(2, 3), x=1)
+        self.assertIs(self.table.intern(a), a)
+        self.assertIs(self.table.intern(b), a)
+        self.assertIs(self.table.intern({'x': 1, 'y': (2, 3)}), a)
+        self.assertIsNot(self.table.intern(FrozenDict(x=2)), a)
+        stats = self.table.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (2, 2))
+        self.assertEqual(stats['size'], 1)
+        self.assertRaises(TypeError, self.table.intern, FrozenDict(x=[]))
+
+    def test_intern_keeps_types(self):
+        ints = self.table.intern(FrozenDict(a=1, b=(1, 2)))
+        self.assertIs(self.table.intern(FrozenDict(a=1, b=(1, 2))), ints)
+        floats = self.table.intern(FrozenDict(a=1.0, b=(1, 2)))
+        self.assertIsNot(floats, ints)
+        self.assertIs(type(floats['a']), float)
+        nested = self.table.intern(FrozenDict(a=1, b=(1, 2.0)))
+        self.assertIs(type(nested['b'][1]), float)
+        keys = self.table.intern(FrozenDict({1.0: 'x'}))
+        self.assertIs(type(list(self.table.intern({1: 'x'}))[0]), int)
+        self.assertIs(self.table.intern(FrozenDict({1.0: 'x'})), keys)
+        sets = self.table.intern(FrozenDict(s=frozenset([1, 2])))
+        self.assertIsNot(self.table.intern(FrozenDict(s=frozenset([1.0, 2]))),
+                         sets)
+
+    def test_intern_keeps_class_and_order(self):
+        plain = self.table.intern(FrozenDict(a=1, b=2))
+        om = self.table.intern(OrderedMap([('b', 2), ('a', 1)]))
+        self.assertIs(type(om), OrderedMap)
+        self.assertEqual(list(om), ['b', 'a'])
+        self.assertIsNot(om, plain)
+        other = self.table.intern(OrderedMap([('a', 1), ('b', 2)]))
+        self.assertEqual(list(other), ['a', 'b'])
+        self.assertIs(self.table.intern(OrderedMap([('b', 2), ('a', 1)])), om)
+        self.assertIs(FrozenDict.intern(OrderedMap(a=1)).__class__, OrderedMap)
+        self.assertIs(type(freeze({'n': 1.0}, intern=True)['n']), float)
+
+    def test_intern_threads_share_one_instance(self):
+        import threading
+        for trial in range(20):
+            barrier = threading.Barrier(8)
+            results = []
+            def run():
+                frz = FrozenDict(trial=trial, data=tuple(range(50)))
+                barrier.wait()
+                results.append(self.table.intern(frz))
+            threads = [threading.Thread(target=run) for i in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            self.assertEqual(len(set(map(id, results))), 1)
+        self.assertEqual(self.table.stats()['misses'], 20)
+
+    def test_intern_is_weak(self):
+        self.table.intern(FrozenDict(x=1))
+        import gc; gc.collect()
+        self.assertEqual(len(self.table), 0)
+
+    def test_intern_bounded_and_clear(self):
+        self.table.maxsize = 2
+        keep = [self.table.intern(FrozenDict(x=i)) for i in range(5)]
+        self.assertEqual(len(self.table), 2)
+        self.assertEqual(self.table.evictions, 3)
+        self.assertIs(self.table.intern(FrozenDict(x=4)), keep[4])
+        self.table.clear()
+        self.assertEqual(len(self.table), 0)
+        self.table.reset_stats()
+        self.assertEqual(self.table.stats()['hits'], 0)
+
+    def test_freeze_intern(self):
+        data = [{'a': [1, 2], 'b': {'c': 3}}, {'b': {'c': 3}, 'a': [1, 2]}]
+        frz = freeze(data, intern=True)
+        self.assertEqual(frz, freeze(data))
+        self.assertIs(frz[0], frz[1])
+        self.assertIs(frz[0]['b'], FrozenDict.intern(FrozenDict(c=3)))
+        other = freeze([[1, 2], {'a': [1, 2]}], intern=True)
+        self.assertIs(other[0], other[1]['a'])
+
+    def test_freeze_intern_counts_once(self):
+        frozen_dict.intern_table.reset_stats()
+        keep = freeze({'fresh': 1}, intern=True)
+        stats = frozen_dict.intern_table.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (0, 1))
+        self.assertIs(freeze({'fresh': 1}, intern=True), keep)
+        stats = frozen_dict.intern_table.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+        self.assertIs(freeze(keep, intern=True), keep)
+
+class Test_OrderedMap(unittest.TestCase):
+    def setUp(self):
+        self.pairs = [('x', 1), ('y', 2), ('z', 3), ('w', 4)]
+        self.om = OrderedMap(self.pairs)
+
+    def test_orderedmap_preserves_order(self):
+        self.assertEqual(list(self.om), ['x', 'y', 'z', 'w'])
+        self.assertEqual(list(self.om.items()), self.pairs)
+        self.assertEqual(list(self.om.viewitems()), self.pairs)
+        self.assertEqual(list(self.om.viewvalues()), [1, 2, 3, 4])
+        self.assertEqual(self.om, dict(self.pairs))
+
+    def test_orderedmap_from_iterator(self):
+        om = OrderedMap((k, v) for k, v in self.pairs)
+        self.assertEqual(len(om), 4)
+        self.assertEqual(list(om.items()), self.pairs)
+        om = OrderedMap(iter(self.pairs))
+        self.assertEqual(list(om), ['x', 'y', 'z', 'w'])
+
+    def test_orderedmap_from_mapping(self):
+        om = OrderedMap(self.om)
+        self.assertEqual(list(om.items()), self.pairs)
+        om = OrderedMap({'x': 1})
+        self.assertEqual(list(om.items()), [('x', 1)])
+
+    def test_orderedmap_duplicate_keys(self):
+        om = OrderedMap([('x', 1), ('y', 2), ('x', 3)])
+        self.assertEqual(list(om.items()), [('x', 3), ('y', 2)])
+
+    def test_orderedmap_copy_and_adopt(self):
+        self.assertIs(self.om.copy(), self.om)
+        om = OrderedMap(self.om)
+        self.assertEqual(list(om.items()), self.pairs)
+        self.assertEqual(FrozenDict(self.om), dict(self.pairs))
+        om = OrderedMap.adopt(dict(self.pairs))
+        self.assertIs(type(om), OrderedMap)
+        self.assertEqual(set(om.items()), set(self.pairs))
+        self.assertEqual(len(list(om)), len(self.pairs))
+
+    def test_orderedmap_empty(self):
+        for om in (OrderedMap(), OrderedMap([])):
+            self.assertEqual(len(om), 0)
+            self.assertEqual(list(om), [])
+            self.assertEqual(om, {})
+
+    def test_orderedmap_method_set(self):
+        om = self.om.set('y', 20)
+        self.assertIs(type(om), OrderedMap)
+        self.assertEqual(list(om.items()),
+            [('x', 1), ('y', 20), ('z', 3), ('w', 4)])
+        om = self.om.set('a', 0)
+        self.assertEqual(list(om), ['x', 'y', 'z', 'w', 'a'])
+        self.assertEqual(list(self.om.items()), self.pairs)
+
+    def test_orderedmap_method_delete(self):
+        om = self.om.delete('y')
+        self.assertIs(type(om), OrderedMap)
+        self.assertEqual(list(om.items()), [('x', 1), ('z', 3), ('w', 4)])
+        om = om.delete('x').delete('z').delete('w')
+        self.assertEqual(list(om), [])
+        self.assertRaises(KeyError, om.delete, 'x')
+
+    def test_orderedmap_method_update(self):
+        om = self.om.update([('z', 30), ('b', 5)])
+        self.assertEqual(list(om.items()),
+            [('x', 1), ('y', 2), ('z', 30), ('w', 4), ('b', 5)])
+        self.assertEqual(list(self.om.items()), self.pairs)
+
+    def test_orderedmap_method_evolver(self):
+        e = self.om.evolver()
+        e['y'] = 20
+        del e['x']
+        e['a'] = 0
+        om = e.persistent()
+        self.assertIs(type(om), OrderedMap)
+        self.assertEqual(list(om.items()),
+            [('y', 20), ('z', 3), ('w', 4), ('a', 0)])
+        self.assertEqual(list(self.om.items()), self.pairs)
+
+    def test_orderedmap_positional(self):
+        self.assertEqual(self.om.key_at(0), 'x')
+        self.assertEqual(self.om.key_at(-1), 'w')
+        self.assertEqual(self.om.value_at(2), 3)
+        self.assertEqual(self.om.item_at(1), ('y', 2))
+        self.assertRaises(IndexError, self.om.key_at, 4)
+        self.assertEqual(list(reversed(self.om)), ['w', 'z', 'y', 'x'])
+        om = OrderedMap([('x', 1), ('y', 2), ('x', 3)])
+        self.assertEqual(om.item_at(0), ('x', 3))
+
+    def test_orderedmap_slice(self):
+        om = self.om.slice(1, 3)
+        self.assertIs(type(om), OrderedMap)
+        self.assertEqual(list(om.items()), [('y', 2), ('z', 3)])
+        self.assertEqual(om['z'], 3)
+        self.assertNotIn('x', om)
+        self.assertEqual(list(self.om.slice(-1).items()), [('w', 4)])
+        self.assertEqual(len(self.om.slice(3, 1)), 0)
+
+    def test_orderedmap_keywords(self):
+        om = OrderedMap([('b', 1)], a=2)
+        self.assertEqual(list(om.items()), [('b', 1), ('a', 2)])
+
+class Test_SortedFrozenMap(unittest.TestCase):
+    def setUp(self):
+        self.sm = SortedFrozenMap([(5, 'e'), (1, 'a'), (3, 'c'), (9, 'i')])
+
+    def test_sorted_order(self):
+        self.assertEqual(list(self.sm), [1, 3, 5, 9])
+        self.assertEqual(list(self.sm.values()), ['a', 'c', 'e', 'i'])
+        self.assertEqual(self.sm, {1: 'a', 3: 'c', 5: 'e', 9: 'i'})
+        sm = SortedFrozenMap({'b': 1}, a=2)
+        self.assertEqual(list(sm.items()), [('a', 2), ('b', 1)])
+        self.assertEqual(list(SortedFrozenMap(OrderedMap(sm))), ['a', 'b'])
+        self.assertRaises(TypeError, SortedFrozenMap, [(1, 1), ('a', 2)])
+
+    def test_sorted_derive(self):
+        sm = self.sm.set(4, 'd').delete(9)
+        self.assertIs(type(sm), SortedFrozenMap)
+        self.assertEqual(list(sm), [1, 3, 4, 5])
+        sm = self.sm.update({0: 'z', 7: 'g'})
+        self.assertEqual(list(sm), [0, 1, 3, 5, 7, 9])
+        e = self.sm.evolver()
+        e[2] = 'b'
+        self.assertEqual(list(e.persistent()), [1, 2, 3, 5, 9])
+        sm = SortedFrozenMap.adopt({2: 'b', 1: 'a'})
+        self.assertEqual(list(sm.items()), [(1, 'a'), (2, 'b')])
+
+    def test_sorted_range(self):
+        sm = self.sm.range(2, 9)
+        self.assertIs(type(sm), SortedFrozenMap)
+        self.assertEqual(list(sm.items()), [(3, 'c'), (5, 'e')])
+        self.assertEqual(list(self.sm.range(5)), [5, 9])
+        self.assertEqual(list(self.sm.range(hi=3)), [1])
+        self.assertEqual(len(self.sm.range(6, 7)), 0)
+
+    def test_sorted_floor_ceiling_rank(self):
+        self.assertEqual(self.sm.floor(4), (3, 'c'))
+        self.assertEqual(self.sm.floor(5), (5, 'e'))
+        self.assertRaises(KeyError, self.sm.floor, 0)
+        self.assertEqual(self.sm.ceiling(4), (5, 'e'))
+        self.assertEqual(self.sm.ceiling(1), (1, 'a'))
+        self.assertRaises(KeyError, self.sm.ceiling, 10)
+        self.assertEqual(self.sm.rank(0), 0)
+        self.assertEqual(self.sm.rank(5), 2)
+        self.assertEqual(self.sm.rank(10), 4)
+
+class Test_Memoize(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        def f(*args, **kw):
+            self.calls.append((args, kw))
+            return len(self.calls)
+        self.f = f
+
+    def test_memoize_caches_by_arguments(self):
+        g = frozen_dict.memoize()(self.f)
+        self.assertEqual(g(1, x=2), 1)
+        self.assertEqual(g(1, x=2), 1)
+        self.assertEqual(g(1), 2)
+        self.assertEqual(g(1, x=3), 3)
+        self.assertEqual(g([1], y={'a': [2]}), 4)
+        self.assertEqual(g([1], y={'a': [2]}), 4)
+        self.assertEqual(g.__name__, 'f')
+        stats = g.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (2, 4))
+        self.assertEqual(len(g), 4)
+        g.clear()
+        self.assertEqual(g(1), 5)
+
+    def test_memoize_bare_and_typed(self):
+        g = frozen_dict.memoize(self.f)
+        self.assertEqual(g(1), g(1.0))
+        g = frozen_dict.memoize(typed=True)(self.f)
+        self.assertNotEqual(g(1), g(1.0))
+
+    def test_memoize_typed_keywords(self):
+        def f(**kw):
+            return dict((k, type(v).__name__) for k, v in kw.items())
+        g = frozen_dict.memoize(typed=True)(f)
+        self.assertEqual(g(a=1, b=1.0), {'a': 'int', 'b': 'float'})
+        self.assertEqual(g(b=1, a=1.0), {'a': 'float', 'b': 'int'})
+        self.assertEqual(g(b=1.0, a=1), {'a': 'int', 'b': 'float'})
+
+    def test_memoize_frozen_arguments_kept_apart(self):
+        g = frozen_dict.memoize(self.f)
+        self.assertEqual(g([1, 2]), 1)
+        self.assertEqual(g((1, 2)), 2)
+        self.assertEqual(g({'a': 1}), 3)
+        self.assertEqual(g(FrozenDict(a=1)), 4)
+        self.assertEqual(g(x={'a': 1}), 5)
+        self.assertEqual(g(x=FrozenDict(a=1)), 6)
+        self.assertEqual(g([1, 2]), 1)
+        self.assertEqual(g(x={'a': 1}), 5)
+
+    def test_memoize_lru(self):
+        g = frozen_dict.memoize(maxsize=2)(self.f)
+        g(1); g(2); g(1); g(3)
+        self.assertEqual(g.evictions, 1)
+        self.assertEqual(g(1), 1)
+        self.assertEqual(g(2), 4)
+        self.assertEqual(frozen_dict.memoize(maxsize=0)(self.f)(1), 5)
+
+    def test_memoize_ttl(self):
+        import time
+        g = frozen_dict.memoize(ttl=0.05)(self.f)
+        self.assertEqual(g(1), 1)
+        self.assertEqual(g(1), 1)
+        time.sleep(0.1)
+        self.assertEqual(g(1), 2)
+
+    def test_memoize_exceptions_not_cached(self):
+        def f(x):
+            self.calls.append(x)
+            raise ValueError(x)
+        g = frozen_dict.memoize()(f)
+        self.assertRaises(ValueError, g, 1)
+        self.assertRaises(ValueError, g, 1)
+        self.assertEqual(len(self.calls), 2)
+
+    def test_memoize_method(self):
+        class C(object):
+            @frozen_dict.memoize
+            def m(self, x):
+                return (self, x)
+        c = C()
+        self.assertEqual(c.m(1), (c, 1))
+        self.assertIs(c.m(1), c.m(1))
+
+    def test_memoize_recursive(self):
+        @frozen_dict.memoize(maxsize=None)
+        def fib(n):
+            return n if n < 2 else fib(n - 1) + fib(n - 2)
+        self.assertEqual(fib(80), 23416728348467685)
+
+    def test_memoize_threads_share_one_call(self):
+        import threading, time
+        started = threading.Event()
+        def slow(x):
+            self.calls.append(x)
+            started.set()
+            time.sleep(0.1)
+            return x * 2
+        g = frozen_dict.memoize()(slow)
+        results = []
+        first = threading.Thread(target=lambda: results.append(g(21)))
+        first.start()
+        started.wait()
+        others = [threading.Thread(target=lambda: results.append(g(21)))
+                  for i in range(4)]
+        for t in others:
+            t.start()
+        for t in [first] + others:
+            t.join()
+        self.assertEqual(results, [42] * 5)
+        self.assertEqual(self.calls, [21])
+
+class FrozenDictSub(FrozenDict):
+    pass
+
+class Test_Pickle(unittest.TestCase):
+    def roundtrip(self, obj):
+        import pickle
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            out = pickle.loads(pickle.dumps(obj, protocol))
+            self.assertIs(type(out), type(obj))
+            self.assertEqual(out, obj)
+            self.assertEqual(list(out.items()), list(obj.items()))
+        return out
+
+    def test_pickle_frozendict(self):
+        self.roundtrip(FrozenDict())
+        frz = FrozenDict(x=1, y=(2, 'a'), z=FrozenDict(w=[3]))
+        out = self.roundtrip(frz)
+        self.assertEqual(out['z']['w'], [3])
+
+    def test_pickle_keeps_stable_hash(self):
+        frz = FrozenDict({'x': 1, 2: 'b', None: 1.5})
+        reduced = frz.__reduce__()
+        self.assertEqual(len(reduced[1]), 3)
+        h = hash(frz)
+        reduced = frz.__reduce__()
+        self.assertEqual(reduced[1][3], h)
+        self.assertEqual(hash(self.roundtrip(frz)), h)
+        # Hashes of other objects may differ in another process
+        frz = FrozenDict(x=(1, 2))
+        hash(frz)
+        self.assertEqual(len(frz.__reduce__()[1]), 3)
+
+    def test_pickle_shaped(self):
+        import pickle
+        shape = FrozenDict.shape(('x', 'y'))
+        pair = [shape(1, 2), shape(3, 4)]
+        out = pickle.loads(pickle.dumps(pair))
+        self.assertEqual(out, pair)
+        self.assertEqual(out[1].set('x', 5), {'x': 5, 'y': 4})
+
+    def test_pickle_ordered_and_sorted(self):
+        om = self.roundtrip(OrderedMap([('b', 1), ('a', 2)]))
+        self.assertEqual(om.key_at(0), 'b')
+        sm = self.roundtrip(SortedFrozenMap([('b', 1), ('a', 2)]))
+        self.assertEqual(sm.floor('az'), ('a', 2))
+
+    def test_pickle_subclass_state(self):
+        frz = FrozenDictSub(x=1)
+        frz.note = 'kept'
+        self.assertEqual(self.roundtrip(frz).note, 'kept')
+
+class Test_Snapshot(unittest.TestCase):
+    def setUp(self):
+        import os, tempfile
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.remove, self.path)
+        self.frz = FrozenDict({u'x': 1, 2: u'\u00e9', b'k': None,
+                               -(1 << 70): 2.5, u'': True, 7: b'\x00v'})
+        self.frz.dump_snapshot(self.path)
+
+    def open(self):
+        snap = FrozenDict.open_snapshot(self.path)
+        self.addCleanup(snap.close)
+        return snap
+
+    def test_snapshot_lookup(self):
+        snap = self.open()
+        self.assertEqual(len(snap), 6)
+        for k, v in self.frz.items():
+            self.assertIn(k, snap)
+            self.assertEqual(snap[k], v)
+            self.assertIs(type(snap[k]), type(v))
+        self.assertEqual(snap[2.0], u'\u00e9')
+        self.assertNotIn(2.5, snap)
+        self.assertNotIn(u'y', snap)
+        self.assertNotIn((1,), snap)
+        self.assertRaises(KeyError, lambda: snap[u'y'])
+        self.assertEqual(snap.get(u'y', 0), 0)
+        self.assertEqual(list(snap), list(self.frz))
+        self.assertEqual(dict(snap.items()), dict(self.frz.items()))
+
+    def test_snapshot_equal_and_hash(self):
+        snap = self.open()
+        self.assertEqual(snap, self.frz)
+        self.assertEqual(self.frz, snap)
+        self.assertEqual(hash(snap), hash(self.frz))
+        self.assertNotEqual(snap, self.frz.set(u'x', 0))
+        self.assertEqual(FrozenDict(snap), self.frz)
+
+    def test_snapshot_large(self):
+        frz = FrozenDict((u'k%d' % i, i) for i in range(5000))
+        frz.dump_snapshot(self.path)
+        snap = self.open()
+        self.assertEqual(snap, frz)
+        self.assertEqual(snap[u'k4321'], 4321)
+
+    def test_snapshot_errors(self):
+        self.assertRaises(TypeError,
+            FrozenDict({(1,): 1}).dump_snapshot, self.path)
+        self.assertRaises(TypeError,
+            FrozenDict({1: [1]}).dump_snapshot, self.path)
+        with open(self.path, 'wb') as f:
+            f.write(b'not a snapshot' * 10)
+        self.assertRaises(ValueError, FrozenDict.open_snapshot, self.path)
+
+    def test_snapshot_failed_dump_keeps_old_file(self):
+        import os
+        bad = FrozenDict((u'k%d' % i, i) for i in range(100)).set(u'z', [1])
+        self.assertRaises(TypeError, bad.dump_snapshot, self.path)
+        self.assertEqual(self.open(), self.frz)
+        directory = os.path.dirname(self.path)
+        name = os.path.basename(self.path)
+        self.assertEqual([f for f in os.listdir(directory)
+                          if f.startswith(name + '.')], [])
+
+    def test_snapshot_close_and_pickle(self):
+        import pickle
+        with FrozenDict.open_snapshot(self.path) as snap:
+            other = pickle.loads(pickle.dumps(snap))
+            self.addCleanup(other.close)
+            self.assertEqual(other, snap)
+        self.assertRaises(ValueError, lambda: snap[u'x'])
+
+class Test_Static(unittest.TestCase):
+    def test_static_lookup(self):
+        frz = FrozenDict((u'k%d' % i, i) for i in range(1000))
+        static = frz.compile()
+        self.assertIs(type(static), frozen_dict.StaticFrozenDict)
+        self.assertEqual(len(static), 1000)
+        for k, v in frz.items():
+            self.assertEqual(static[k], v)
+            self.assertIn(k, static)
+        self.assertNotIn(u'k1000', static)
+        self.assertRaises(KeyError, lambda: static[u'k1000'])
+        self.assertEqual(static.get(u'k5'), 5)
+        self.assertEqual(static.get(u'x', 0), 0)
+        self.assertEqual(list(static), list(frz))
+        self.assertEqual(set(static.items()), set(frz.items()))
+
+    def test_static_small_and_empty(self):
+        empty = FrozenDict().compile()
+        self.assertEqual(len(empty), 0)
+        self.assertNotIn(1, empty)
+        self.assertEqual(empty, {})
+        one = frozen_dict.StaticFrozenDict(a=1)
+        self.assertEqual(one['a'], 1)
+        self.assertEqual(list(OrderedMap([(2, 0), (1, 0)]).compile()), [2, 1])
+
+    def test_static_equal_hashes(self):
+        # -1 and -2 share a hash, and 1 and 1.0 are the same key
+        static = frozen_dict.StaticFrozenDict({-1: 'a', -2: 'b', 1: 'c'})
+        self.assertEqual(static[-1], 'a')
+        self.assertEqual(static[-2], 'b')
+        self.assertEqual(static[1.0], 'c')
+        self.assertNotIn(-3, static)
+
+    def test_static_compares_like_frozendict(self):
+        frz = FrozenDict(x=1, y=(2, 3))
+        static = frz.compile()
+        self.assertEqual(static, frz)
+        self.assertEqual(frz, static)
+        self.assertEqual(hash(static), hash(frz))
+        self.assertNotEqual(static, frz.set('x', 2))
+        self.assertEqual(FrozenDict(static), frz)
+        import pickle
+        self.assertEqual(pickle.loads(pickle.dumps(static)), static)
+
+    def test_static_is_mapping(self):
+        try:
+            from collections.abc import Mapping
+        except ImportError:
+            from collections import Mapping
+        self.assertIsInstance(FrozenDict().compile(), Mapping)
+
+class Test_Stats(unittest.TestCase):
+    def setUp(self):
+        frozen_dict.reset_stats()
+        self.addCleanup(frozen_dict.enable_stats, False)
+        self.addCleanup(frozen_dict.set_slow_hook, None)
+
+    def test_stats_disabled(self):
+        FrozenDict(x=1)
+        hash(FrozenDict(x=1))
+        stats = frozen_dict.stats()
+        self.assertFalse(stats['enabled'])
+        self.assertEqual(stats['created'], 0)
+        self.assertEqual(stats['hash_computed'], 0)
+
+    def test_stats_counters(self):
+        frozen_dict.enable_stats()
+        a = FrozenDict(x=1, y=2)
+        b = a.set('y', 3)
+        hash(a); hash(a); hash(b)
+        self.assertFalse(a <= b)
+        freeze({'a': [1, {'b': 2}]})
+        stats = frozen_dict.stats()
+        # a, b and the two made by freeze
+        self.assertEqual(stats['created'], 4)
+        self.assertEqual(stats['hash_computed'], 2)
+        self.assertEqual(stats['hash_cached'], 1)
+        self.assertEqual(stats['slow_compares'], 1)
+        self.assertEqual(stats['freeze_calls'], 1)
+        self.assertGreater(stats['freeze_seconds'], 0)
+        frozen_dict.reset_stats()
+        self.assertEqual(frozen_dict.stats()['created'], 0)
+
+    def test_slow_hook(self):
+        seen = []
+        frozen_dict.set_slow_hook(lambda *args: seen.append(args), 0)
+        frz = FrozenDict(x=1)
+        hash(frz)
+        data = [1]
+        freeze(data)
+        self.assertEqual([(op, obj) for op, t, obj in seen],
+                         [('hash', frz), ('freeze', data)])
+        del seen[:]
+        frozen_dict.set_slow_hook(lambda *args: seen.append(args), 10)
+        hash(FrozenDict(x=2))
+        self.assertEqual(seen, [])
+        frozen_dict.set_slow_hook(None)
+        self.assertFalse(frozen_dict.stats()['enabled'])
+
+class Test_Columns(unittest.TestCase):
+    def setUp(self):
+        from array import array
+        self.keys = ('id', 'name', 'score')
+        self.columns = [array('q', [1, 2, 3]), ['a', 'b', 'c'],
+                        (0.5, 1.5, 2.5)]
+        self.expected = [FrozenDict(id=1, name='a', score=0.5),
+                         FrozenDict(id=2, name='b', score=1.5),
+                         FrozenDict(id=3, name='c', score=2.5)]
+
+    def test_from_columns(self):
+        rows = FrozenDict.from_columns(self.keys, self.columns)
+        self.assertEqual(rows, self.expected)
+        self.assertEqual([hash(r) for r in rows],
+                         [hash(r) for r in self.expected])
+        self.assertEqual(rows[1].set('id', 5)['id'], 5)
+        rows = FrozenDict.from_columns(['x'], [iter(range(3))])
+        self.assertEqual(rows, [{'x': 0}, {'x': 1}, {'x': 2}])
+        self.assertEqual(FrozenDict.from_columns(['x'], [[]]), [])
+
+    def test_from_columns_errors(self):
+        self.assertRaises(ValueError, FrozenDict.from_columns,
+                          ('a', 'b'), [[1, 2], [1]])
+        self.assertRaises(TypeError, FrozenDict.from_columns,
+                          ('a', 'b'), [[1, 2]])
+        self.assertRaises(ValueError, FrozenDict.from_columns,
+                          ('a', 'a'), [[1], [2]])
+
+    def test_from_rows(self):
+        shape = FrozenDict.shape(self.keys)
+        rows = FrozenDict.from_rows(shape, zip(*self.columns))
+        self.assertEqual(rows, self.expected)
+        self.assertRaises(TypeError, FrozenDict.from_rows,
+                          self.keys, [(1, 'a')])
+
+    def test_record_batch(self):
+        for batch in (FrozenDict.from_columns(self.keys, self.columns,
+                                              lazy=True),
+                      FrozenDict.from_rows(self.keys, zip(*self.columns),
+                                           lazy=True)):
+            self.assertIs(type(batch), frozen_dict.FrozenRecordBatch)
+            self.assertEqual(len(batch), 3)
+            self.assertEqual(batch[0], self.expected[0])
+            self.assertEqual(batch[-1], self.expected[-1])
+            self.assertRaises(IndexError, lambda: batch[3])
+            self.assertEqual(list(batch), self.expected)
+            self.assertEqual(batch.tolist(), self.expected)
+            self.assertEqual(list(batch[1:]), self.expected[1:])
+            self.assertEqual(list(batch[::-2]), self.expected[::-2])
+            self.assertEqual(batch.column('name'), ('a', 'b', 'c'))
+            self.assertEqual(batch.shape.keys, self.keys)
+
+    def test_record_batch_keeps_its_own_columns(self):
+        from array import array
+        ids, names = array('q', [1, 2, 3]), ['a', 'b', 'c']
+        scores = [0.5, 1.5, 2.5]
+        batch = FrozenDict.from_columns(
+            self.keys, [ids, names, iter(scores)], lazy=True)
+        ids[0] = 99
+        names[0] = 'MUTATED'
+        del names[:]
+        self.assertEqual(list(batch), self.expected)
+        self.assertEqual(list(batch[:2]), self.expected[:2])
+        ids.append(4)
+        self.assertEqual(len(batch), 3)
+        rows = [list(r) for r in zip(*self.columns)]
+        batch = FrozenDict.from_rows(self.keys, rows, lazy=True)
+        rows[0][1] = 'MUTATED'
+        self.assertEqual(batch[0], self.expected[0])
+
+class Test_Json(unittest.TestCase):
+    def test_loads(self):
+        import json
+        import frozen_json
+        text = ('{"a": [1, [2, {"b": [3]}], []], "c": {"d": null},'
+                ' "e": "\\u00e9", "a2": {}}')
+        frz = frozen_json.loads(text)
+        self.assertEqual(frz, freeze(json.loads(text)))
+        self.assertIs(type(frz), FrozenDict)
+        self.assertIs(type(frz['a'][1]), tuple)
+        self.assertIs(type(frz['a'][1][1]['b']), tuple)
+        hash(frz)
+        self.assertEqual(frozen_json.loads(text.encode('utf-8')), frz)
+        self.assertEqual(frozen_json.loads('[[1], 2]'), ((1,), 2))
+        self.assertEqual(frozen_json.loads('3'), 3)
+        self.assertEqual(frozen_json.loads('{"k": 1, "k": 2}'), {'k': 2})
+
+    def test_load_and_iter_load(self):
+        import io, os, tempfile
+        import frozen_json
+        text = '{"a": 1}\n\n[1, 2]\n{"b": [true]}\n'
+        self.assertEqual(frozen_json.load(io.StringIO('{"a": [1]}')),
+                         FrozenDict(a=(1,)))
+        expected = [FrozenDict(a=1), (1, 2), FrozenDict(b=(True,))]
+        self.assertEqual(list(frozen_json.iter_load(io.StringIO(text))),
+                         expected)
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+        with open(path, 'w') as f:
+            f.write(text)
+        self.assertEqual(list(frozen_json.iter_load(path)), expected)
+
+class Test_CAPI(unittest.TestCase):
+    # Calls the functions of the C API through their capsules,
+    # the way import_frozen_dict() in frozen_dict_api.h does
+    def function(self, name, restype, *argtypes):
+        import ctypes
+        capsule = frozen_dict.__pyx_capi__[name]
+        pythonapi = ctypes.pythonapi
+        pythonapi.PyCapsule_GetName.restype = ctypes.c_char_p
+        pythonapi.PyCapsule_GetName.argtypes = [ctypes.py_object]
+        pythonapi.PyCapsule_GetPointer.restype = ctypes.c_void_p
+        pythonapi.PyCapsule_GetPointer.argtypes = [ctypes.py_object,
+                                                   ctypes.c_char_p]
+        pointer = pythonapi.PyCapsule_GetPointer(
+            capsule, pythonapi.PyCapsule_GetName(capsule))
+        return ctypes.PYFUNCTYPE(restype, *argtypes)(pointer)
+
+    def test_read(self):
+        import ctypes
+        obj = ctypes.py_object
+        size = self.function('FrozenDict_Size', ctypes.c_ssize_t, obj)
+        get = self.function('FrozenDict_GetItem', ctypes.c_void_p, obj, obj)
+        contains = self.function('FrozenDict_Contains', ctypes.c_int,
+                                 obj, obj)
+        next_item = self.function(
+            'FrozenDict_Next', ctypes.c_int, obj,
+            ctypes.POINTER(ctypes.c_ssize_t),
+            ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_void_p))
+        check = self.function('FrozenDict_Check', ctypes.c_int, obj)
+        deref = lambda p: ctypes.cast(p, obj).value
+        for frz in (FrozenDict(a=1, b=2), FrozenDict((i, -i) for i in range(20)),
+                    FrozenDict.shape(('a', 'b'))(1, 2),
+                    SortedFrozenMap([('b', 1), ('a', 2)])):
+            self.assertTrue(check(frz))
+            self.assertEqual(size(frz), len(frz))
+            for key in frz:
+                self.assertEqual(deref(get(frz, key)), frz[key])
+                self.assertEqual(contains(frz, key), 1)
+            self.assertIsNone(get(frz, 'missing'))
+            self.assertEqual(contains(frz, 'missing'), 0)
+            pos, k, v = ctypes.c_ssize_t(0), ctypes.c_void_p(), \
+                ctypes.c_void_p()
+            items = []
+            while next_item(frz, ctypes.byref(pos), ctypes.byref(k),
+                            ctypes.byref(v)):
+                items.append((deref(k.value), deref(v.value)))
+            self.assertEqual(items, list(frz.items()))
+        # A derived map is read through its layer, then walked
+        frz = FrozenDict((i, -i) for i in range(600)).delete(0).set(-1, 1)
+        self.assertEqual(size(frz), 600)
+        self.assertEqual(deref(get(frz, -1)), 1)
+        self.assertIsNone(get(frz, 0))
+        self.assertEqual(contains(frz, 0), 0)
+        pos, k, v = ctypes.c_ssize_t(0), ctypes.c_void_p(), ctypes.c_void_p()
+        keys = []
+        while next_item(frz, ctypes.byref(pos), ctypes.byref(k),
+                        ctypes.byref(v)):
+            keys.append(deref(k.value))
+        self.assertEqual(keys, list(range(1, 600)) + [-1])
+        self.assertFalse(check({}))
+        self.assertRaises(TypeError, size, {'a': 1})
+        self.assertRaises(TypeError, contains, FrozenDict(a=1), [])
+
+    def test_construct_and_hash(self):
+        import ctypes
+        obj = ctypes.py_object
+        from_dict = self.function('FrozenDict_FromDict', obj, obj)
+        cached_hash = self.function('FrozenDict_CachedHash',
+                                    ctypes.c_longlong, obj)
+        frz = from_dict({'a': 1, 'b': (2,)})
+        self.assertIs(type(frz), FrozenDict)
+        self.assertEqual(frz, FrozenDict(a=1, b=(2,)))
+        self.assertEqual(cached_hash(frz), -1)
+        self.assertEqual(cached_hash(frz.__class__(frz)), -1)
+        self.assertEqual(cached_hash(frz), -1)
+        h = hash(frz)
+        self.assertEqual(cached_hash(frz), h)
+        self.assertRaises(TypeError, from_dict, [('a', 1)])
+
 if __name__ == '__main__':
     unittest.main()
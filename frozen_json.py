@@ -0,0 +1,47 @@
+''' Reads JSON straight into frozen structures: objects become
+    FrozenDicts and arrays become tuples, with no mutable copy of
+    the document built along the way.
+
+    >>> import frozen_json
+    >>> frozen_json.loads('{"a": [1, {"b": 2}]}')
+    FrozenDict({'a': (1, FrozenDict({'b': 2}))})
+'''
+import json
+
+from frozen_dict import frozen_pairs, json_value
+
+_decoder = json.JSONDecoder(object_pairs_hook=frozen_pairs)
+
+def _text(s):
+    if isinstance(s, (bytes, bytearray)):
+        if hasattr(json, 'detect_encoding'):
+            return s.decode(json.detect_encoding(s), 'surrogatepass')
+        return s.decode('utf-8')
+    return s
+
+def loads(s):
+    ''' Like json.loads, but returns frozen structures '''
+    return json_value(_decoder.decode(_text(s)))
+
+def load(fp):
+    ''' Like json.load, but returns frozen structures '''
+    return loads(fp.read())
+
+def iter_load(source):
+    ''' Yields one frozen value per line of a JSON Lines file, so a
+        file of any size is read with bounded memory.  source is a
+        path or a file object opened in text or binary mode.  Blank
+        lines are skipped.  '''
+    if isinstance(source, (str, bytes)) or hasattr(source, '__fspath__'):
+        with open(source, 'rb') as fp:
+            for value in _iter_lines(fp):
+                yield value
+    else:
+        for value in _iter_lines(source):
+            yield value
+
+def _iter_lines(fp):
+    for line in fp:
+        line = _text(line)
+        if line.strip():
+            yield loads(line)
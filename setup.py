@@ -1,16 +1,12 @@
-from distutils.core import setup
-from distutils.extension import Extension
+try:
+    from setuptools import setup
+except ImportError:
+    from distutils.core import setup
+from Cython.Build import cythonize
 
-if 3/2 == 1.5:
-    version = 3
-else:
-    version = 2
-
-if version == 3:
-    setup(
-        ext_modules = [Extension('frozen_dict', ['frozen_dict_py3.c'])]
-    )
-else:
-    setup(
-        ext_modules = [Extension('frozen_dict', ['frozen_dict_py2.c'])]
-    )
+# The extension is always built from frozen_dict.pyx, which picks
+# the methods for the running interpreter when it is compiled, so
+# the same source serves Python 2 and Python 3.
+setup(
+    ext_modules = cythonize('frozen_dict.pyx')
+)